@@ -11,6 +11,7 @@ Use this server to test the MCP client functionality.
 """
 
 from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
 import json
 import os
 from datetime import datetime
@@ -19,21 +20,24 @@ from datetime import datetime
 # Create the server
 mcp = FastMCP("Simple Example Server")
 
+# Pure functions: results depend only on the arguments and may be cached
+PURE = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
 
 # Tools
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 def add(a: float, b: float) -> float:
     """Add two numbers together."""
     return a + b
 
 
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 def multiply(a: float, b: float) -> float:
     """Multiply two numbers together."""
     return a * b
 
 
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 def divide(a: float, b: float) -> float:
     """Divide two numbers (a / b)."""
     if b == 0:
@@ -41,7 +45,7 @@ def divide(a: float, b: float) -> float:
     return a / b
 
 
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 def power(base: float, exponent: float) -> float:
     """Raise base to the power of exponent."""
     return base ** exponent
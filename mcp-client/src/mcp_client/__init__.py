@@ -9,7 +9,13 @@ __version__ = "0.1.0"
 __author__ = "MCP Client Team"
 __description__ = "A comprehensive Python MCP client that can connect to any MCP server"
 
-from .client import MCPClient, MCPClientConfig
-from .main import main
+from .lazy import lazy_exports
 
-__all__ = ["MCPClient", "MCPClientConfig", "main"] 
\ No newline at end of file
+# Exports are imported on first access so that `import mcp_client` stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "MCPClient": ".client",
+    "MCPClientConfig": ".client",
+    "main": ".main",
+})
+
+__all__ = ["MCPClient", "MCPClientConfig", "main"]
@@ -5,7 +5,10 @@ This module provides REST API endpoints for managing MCP servers,
 executing queries, and running intelligent conversations.
 """
 
-from .app import create_app
-from .routes import servers, queries, chat, health
+from ..lazy import lazy_exports
 
-__all__ = ["create_app"] 
\ No newline at end of file
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "create_app": ".app",
+})
+
+__all__ = ["create_app"]
@@ -11,7 +11,10 @@ from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
+from ..client import aclose_shared_http_transports
 from ..database.database import init_database, get_database
+from ..pool import get_session_pool_manager, server_config_from_model
+from .supervisor import get_supervisor
 from .routes import servers, queries, chat, health
 
 
@@ -25,10 +28,26 @@ async def lifespan(app: FastAPI):
     init_database()
     print("✅ Database initialized")
     
+    # Open warm sessions for servers that ask for them
+    db = get_database()
+    pool_manager = get_session_pool_manager()
+    pool_manager.latency_history = db.get_tool_latency_history  # seeds per-tool deadlines
+    for server in db.get_active_servers():
+        pool_options = (server.client_options or {}).get("pool") or {}
+        if pool_options.get("warm_spares") or pool_options.get("min_size"):
+            pool_manager.prewarm(server.id, server_config_from_model(server))
+    
+    # Heartbeat pooled sessions and restart servers that die
+    get_supervisor().start()
+    print("✅ Server supervisor started")
+    
     yield
     
     # Shutdown
     print("🛑 Shutting down MCP Client API...")
+    await get_supervisor().stop()
+    await get_session_pool_manager().close_all()
+    await aclose_shared_http_transports()
 
 
 def create_app() -> FastAPI:
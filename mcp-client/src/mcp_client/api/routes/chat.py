@@ -12,6 +12,7 @@ from fastapi import APIRouter, HTTPException, Depends, status
 from ...database.database import get_database
 from ...database.models import ChatRequest, MCPServer, User
 from ...llm.agent import get_agent_manager, create_mcp_agent
+from ...pool import server_config_from_model
 from .servers import get_current_user
 
 router = APIRouter()
@@ -39,16 +40,12 @@ async def chat_with_server(
         # Get or create agent for this server
         agent = agent_manager.get_agent(server_id)
         
-        if not agent:
+        if agent:
+            # Replace a session that died since the last turn
+            await agent_manager.renew_session(server_id)
+        else:
             # Create new agent
-            server_config = {
-                "server_command": server.server_command,
-                "server_args": server.server_args or [],
-                "server_env": server.server_env or {},
-                "server_type": server.server_type,
-                "server_path": server.server_path,
-                "server_url": server.server_url
-            }
+            server_config = {**server_config_from_model(server), "capabilities": server.capabilities}
             
             llm_config = {
                 "provider": request.llm_provider,
@@ -67,7 +64,8 @@ async def chat_with_server(
             message=request.message,
             model=request.model_name,
             temperature=0.7,
-            max_tokens=1000
+            max_tokens=1000,
+            turn_timeout=request.turn_timeout
         )
         
         # Log the conversation
@@ -180,14 +178,7 @@ async def get_available_tools(
     else:
         # Create temporary agent to get tool info
         try:
-            server_config = {
-                "server_command": server.server_command,
-                "server_args": server.server_args or [],
-                "server_env": server.server_env or {},
-                "server_type": server.server_type,
-                "server_path": server.server_path,
-                "server_url": server.server_url
-            }
+            server_config = {**server_config_from_model(server), "capabilities": server.capabilities}
             
             llm_config = {
                 "provider": "openai",
@@ -232,14 +223,7 @@ async def execute_tool_directly(
         
         if not agent:
             # Create temporary agent
-            server_config = {
-                "server_command": server.server_command,
-                "server_args": server.server_args or [],
-                "server_env": server.server_env or {},
-                "server_type": server.server_type,
-                "server_path": server.server_path,
-                "server_url": server.server_url
-            }
+            server_config = {**server_config_from_model(server), "capabilities": server.capabilities}
             
             llm_config = {
                 "provider": "openai",
@@ -11,6 +11,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from ...database.database import get_db_session, get_database
+from ...cache import get_resource_mirror
+from ...concurrency import get_request_coalescer
+from ...pool import get_session_pool_manager
+from ...resilience import get_circuit_breakers
+from ..supervisor import get_supervisor
 
 router = APIRouter()
 
@@ -83,6 +88,20 @@ async def detailed_health():
         }
 
 
+@router.get("/pools")
+async def pool_status():
+    """Status of the pooled MCP server sessions."""
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "pools": get_session_pool_manager().stats(),
+        "replicas": get_session_pool_manager().replica_stats(),
+        "supervisor": get_supervisor().stats(),
+        "coalescing": get_request_coalescer().stats(),
+        "resource_mirror": get_resource_mirror().stats(),
+        "circuits": get_circuit_breakers().stats()
+    }
+
+
 @router.get("/ready")
 async def readiness_check():
     """Readiness check for deployment orchestration."""
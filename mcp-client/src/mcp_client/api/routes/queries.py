@@ -5,28 +5,59 @@ This module provides endpoints for executing MCP tools,
 reading resources, and getting prompts.
 """
 
+import asyncio
+import json
+import time
 from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
 
 from ...database.database import get_database
 from ...database.models import (
-    QueryRequest, QueryResponse, MCPServer, User
+    BatchToolRequest, QueryRequest, QueryResponse, MCPServer, User
 )
-from ...client import MCPClient, MCPClientConfig
+from ...cache import get_resource_mirror, get_result_cache
+from ...client import CallStats
+from ...content import SPOOL_MAX_MEMORY, BinaryContent, binary_payload, describe_binary, spool_resource_content
+from ...pool import get_session_pool_manager, server_config_from_model
+from ...resilience import OPEN, CircuitOpenError, get_circuit_breakers
+from ...timing import Timings, acquire_timings
 from .servers import get_current_user
 
 router = APIRouter()
 
 
+def _format_tool_content(content: Optional[list], include_binary: bool = False) -> list:
+    """Text items as strings, binary items as size descriptions (with base64 data if asked)."""
+    formatted = []
+    for content_item in content or []:
+        if hasattr(content_item, 'text'):
+            formatted.append(content_item.text)
+        elif binary_payload(content_item) is not None:
+            formatted.append(describe_binary(content_item, include_data=include_binary))
+        else:
+            formatted.append(str(content_item))
+    return formatted
+
+
 @router.post("/{server_id}/tool")
 async def execute_tool(
     server_id: int,
     tool_name: str,
     tool_args: dict,
+    include_binary: bool = False,
+    content_index: Optional[int] = None,
     user: User = Depends(get_current_user)
 ):
-    """Execute a tool on an MCP server."""
+    """
+    Execute a tool on an MCP server.
+    
+    Binary content (images, audio, blobs) is described by type and size;
+    include_binary=true also embeds its base64 data as received from the
+    server, and content_index returns that binary item as raw bytes.
+    """
     db = get_database()
     server = db.get_server_by_id(server_id)
     
@@ -37,65 +68,71 @@ async def execute_tool(
         )
     
     start_time = datetime.utcnow()
+    timings = Timings()
     
     try:
-        # Create MCP client and execute tool
-        config = MCPClientConfig(
-            server_command=server.server_command,
-            server_args=server.server_args or [],
-            server_env=server.server_env or {},
-            transport_type=server.server_type,
-            timeout=30,
-            debug=False
-        )
+        # Reuse a pooled session to execute the tool
+        server_config = server_config_from_model(server)
         
-        async with MCPClient(config) as client:
-            if server.server_url:
-                await client.connect(server.server_url, server.server_type)
-            elif server.server_path:
-                await client.connect(server.server_path)
-            else:
-                await client.connect_stdio(
-                    server.server_command,
-                    server.server_args or [],
-                    server.server_env or {}
-                )
-            
-            result = await client.call_tool(tool_name, tool_args)
-            
-            # Calculate execution time
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-            
-            # Format result
-            formatted_result = []
-            if hasattr(result, 'content') and result.content:
-                for content_item in result.content:
-                    if hasattr(content_item, 'text'):
-                        formatted_result.append(content_item.text)
-                    else:
-                        formatted_result.append(str(content_item))
-            
-            # Log query
-            query_data = {
-                "query_text": f"Tool: {tool_name}",
-                "query_type": "tool",
-                "tool_name": tool_name,
-                "tool_args": tool_args,
-                "result": {"content": formatted_result},
-                "execution_time": int(execution_time)
-            }
-            
-            db.log_query(user.id, server_id, query_data)
-            
-            return {
-                "success": True,
-                "tool_name": tool_name,
-                "arguments": tool_args,
-                "result": formatted_result,
-                "execution_time_ms": int(execution_time),
-                "timestamp": start_time.isoformat()
-            }
-            
+        acquire_start = time.perf_counter()
+        async with get_session_pool_manager().acquire(server_id, server_config) as client:
+            timings.merge(acquire_timings(client, acquire_start))
+            stats = CallStats()
+            result = await client.call_tool(tool_name, tool_args, stats=stats)
+            timings.merge(stats.timings)
+            cache_info = {"hit": stats.cache_hit, **get_result_cache().stats(client.server_key)}
+        
+        # A bad index is the caller's mistake, not a tool failure: reject it
+        # unlogged, and outside acquire() so the session is not health-checked
+        if content_index is not None and (
+            not 0 <= content_index < len(result.content)
+            or binary_payload(result.content[content_index]) is None
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Tool result has no binary content at index {content_index}"
+            )
+        
+        # Format result; binary data never goes into the query log
+        with timings.phase("parse"):
+            formatted_result = _format_tool_content(result.content, include_binary)
+            logged_result = _format_tool_content(result.content) if include_binary else formatted_result
+        
+        # Calculate execution time
+        execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+        
+        # Log query
+        query_data = {
+            "query_text": f"Tool: {tool_name}",
+            "query_type": "tool",
+            "tool_name": tool_name,
+            "tool_args": tool_args,
+            "result": {"content": logged_result},
+            "execution_time": int(execution_time),
+            "timings": timings.to_dict()
+        }
+        
+        db.log_query(user.id, server_id, query_data)
+        
+        if content_index is not None:
+            binary = BinaryContent.from_content(result.content[content_index])
+            return Response(content=binary.view, media_type=binary.mime_type)
+        
+        return {
+            "success": True,
+            "tool_name": tool_name,
+            "arguments": tool_args,
+            "result": formatted_result,
+            "execution_time_ms": int(execution_time),
+            "cache": cache_info,
+            "coalesced": stats.coalesced,
+            "hedged": stats.hedged,
+            "timings": timings.to_dict(),
+            "timestamp": start_time.isoformat()
+        }
+        
+    except HTTPException:
+        raise
     except Exception as e:
         execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
         
@@ -106,24 +143,156 @@ async def execute_tool(
             "tool_name": tool_name,
             "tool_args": tool_args,
             "error_message": str(e),
-            "execution_time": int(execution_time)
+            "execution_time": int(execution_time),
+            "timings": timings.to_dict()
         }
         
         db.log_query(user.id, server_id, query_data)
         
+        if isinstance(e, CircuitOpenError):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Tool execution failed: {str(e)}",
+                headers={"Retry-After": str(max(1, round(e.retry_after)))}
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Tool execution failed: {str(e)}"
         )
 
 
+@router.post("/{server_id}/tools/batch")
+async def execute_tools_batch(
+    server_id: int,
+    request: BatchToolRequest,
+    user: User = Depends(get_current_user)
+):
+    """
+    Execute many tools on an MCP server over one pooled session.
+    
+    Results are streamed back as newline-delimited JSON in completion
+    order; each line carries the index of its call in the request. The
+    session is checked out before the response starts, so an unreachable
+    server or open circuit fails the request with an error status; a
+    failure after that ends the stream with an {"error": ...} line.
+    """
+    db = get_database()
+    server = db.get_server_by_id(server_id)
+    
+    if not server or server.owner_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Server not found"
+        )
+    
+    if request.concurrency < 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="concurrency must be at least 1"
+        )
+    
+    server_config = server_config_from_model(server)
+    calls = [call.model_dump() for call in request.calls]
+    
+    start_time = datetime.utcnow()
+    pool = get_session_pool_manager().get_pool(server_id, server_config)
+    try:
+        client = await pool.checkout()
+    except Exception as e:
+        _log_batch_error(db, user.id, server_id, e, start_time)
+        raise _batch_http_error(e)
+    
+    # Every call would be refused while the server's circuit is open
+    breaker = get_circuit_breakers().get(
+        client.server_key, None, client.config.circuit_failure_threshold, client.config.circuit_reset_timeout
+    )
+    if client.config.circuit_breaker and breaker.state == OPEN:
+        await pool.checkin(client)
+        error = CircuitOpenError("Server", breaker.retry_after())
+        _log_batch_error(db, user.id, server_id, error, start_time)
+        raise _batch_http_error(error)
+    
+    async def results():
+        try:
+            async for outcome in client.iter_tools_batch(calls, request.concurrency, request.timeout):
+                line = outcome.to_dict()
+                if outcome.result is not None:
+                    line["result"] = _format_tool_content(outcome.result.content, request.include_binary)
+                
+                # Log query
+                query_data = {
+                    "query_text": f"Tool: {outcome.tool_name}",
+                    "query_type": "tool",
+                    "tool_name": outcome.tool_name,
+                    "tool_args": outcome.arguments,
+                    "execution_time": outcome.execution_time_ms,
+                    "timings": line["timings"]
+                }
+                if outcome.error is not None:
+                    query_data["error_message"] = line["error"]
+                elif request.include_binary:
+                    query_data["result"] = {"content": _format_tool_content(outcome.result.content)}
+                else:
+                    query_data["result"] = {"content": line["result"]}
+                db.log_query(user.id, server_id, query_data)
+                
+                yield json.dumps(line) + "\n"
+        except Exception as e:
+            _log_batch_error(db, user.id, server_id, e, start_time)
+            yield json.dumps({"error": f"Batch execution failed: {str(e)}"}) + "\n"
+        finally:
+            await pool.checkin(client)
+    
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+def _log_batch_error(db, user_id: int, server_id: int, error: Exception, start_time: datetime) -> None:
+    """Log a batch that failed as a whole, rather than one of its calls."""
+    db.log_query(user_id, server_id, {
+        "query_text": "Tool batch",
+        "query_type": "tool",
+        "error_message": str(error),
+        "execution_time": int((datetime.utcnow() - start_time).total_seconds() * 1000)
+    })
+
+
+def _batch_http_error(error: Exception) -> HTTPException:
+    """503 (with Retry-After for open circuits) when the server is unavailable, 400 otherwise."""
+    if isinstance(error, CircuitOpenError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Batch execution failed: {str(error)}",
+            headers={"Retry-After": str(max(1, round(error.retry_after)))}
+        )
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Batch execution failed: {str(error)}"
+        )
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Batch execution failed: {str(error)}"
+    )
+
+
 @router.get("/{server_id}/resource")
 async def read_resource(
     server_id: int,
     resource_uri: str,
+    stream: bool = False,
+    index: int = 0,
+    include_binary: bool = False,
     user: User = Depends(get_current_user)
 ):
-    """Read a resource from an MCP server."""
+    """
+    Read a resource from an MCP server.
+    
+    With stream=true the content item at index is streamed back as raw
+    bytes instead of being returned inside the JSON result: small blobs
+    from one decoded buffer, anything larger through a spooled temporary
+    file. Otherwise blobs are described by size, with their base64 data
+    embedded only when include_binary=true.
+    """
     db = get_database()
     server = db.get_server_by_id(server_id)
     
@@ -134,71 +303,110 @@ async def read_resource(
         )
     
     start_time = datetime.utcnow()
+    timings = Timings()
     
     try:
-        # Create MCP client and read resource
-        config = MCPClientConfig(
-            server_command=server.server_command,
-            server_args=server.server_args or [],
-            server_env=server.server_env or {},
-            transport_type=server.server_type,
-            timeout=30,
-            debug=False
-        )
+        # Reuse a pooled session to read the resource
+        server_config = server_config_from_model(server)
         
-        async with MCPClient(config) as client:
-            if server.server_url:
-                await client.connect(server.server_url, server.server_type)
-            elif server.server_path:
-                await client.connect(server.server_path)
-            else:
-                await client.connect_stdio(
-                    server.server_command,
-                    server.server_args or [],
-                    server.server_env or {}
-                )
+        acquire_start = time.perf_counter()
+        async with get_session_pool_manager().acquire(server_id, server_config) as client:
+            timings.merge(acquire_timings(client, acquire_start))
+            result = await client.read_resource(resource_uri, timings=timings)
             
-            result = await client.read_resource(resource_uri)
+        if stream:
+            if not 0 <= index < len(result.contents):
+                raise ValueError(f"Resource has no content at index {index}")
+            content_item = result.contents[index]
+            del result
             
-            # Calculate execution time
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            blob = binary_payload(content_item)
+            if blob is not None and len(blob) <= SPOOL_MAX_MEMORY:
+                # Decode once and stream slices of the one buffer
+                with timings.phase("parse"):
+                    binary = BinaryContent.from_content(content_item)
+                execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+                
+                db.log_query(user.id, server_id, {
+                    "query_text": f"Resource: {resource_uri}",
+                    "query_type": "resource",
+                    "resource_uri": resource_uri,
+                    "result": {"streamed": True, "size": binary.size, "mimeType": binary.mime_type},
+                    "execution_time": int(execution_time),
+                    "timings": timings.to_dict()
+                })
+                
+                return StreamingResponse(
+                    binary.iter_chunks(),
+                    media_type=binary.mime_type,
+                    headers={"Content-Length": str(binary.size)}
+                )
             
-            # Format result
-            formatted_content = []
-            if hasattr(result, 'contents') and result.contents:
-                for content_item in result.contents:
-                    if hasattr(content_item, 'text'):
-                        formatted_content.append({
-                            "type": "text",
-                            "content": content_item.text,
-                            "mimeType": getattr(content_item, 'mimeType', 'text/plain')
-                        })
-                    elif hasattr(content_item, 'data'):
-                        formatted_content.append({
-                            "type": "binary",
-                            "size": len(content_item.data),
-                            "mimeType": getattr(content_item, 'mimeType', 'application/octet-stream')
-                        })
+            # Decode off the event loop; large blobs roll over to disk
+            with timings.phase("parse"):
+                spooled = await asyncio.to_thread(spool_resource_content, content_item)
+            del content_item
+            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
             
-            # Log query
-            query_data = {
+            db.log_query(user.id, server_id, {
                 "query_text": f"Resource: {resource_uri}",
                 "query_type": "resource",
                 "resource_uri": resource_uri,
-                "result": {"content": formatted_content},
-                "execution_time": int(execution_time)
-            }
+                "result": {"streamed": True, "size": spooled.size, "mimeType": spooled.mime_type},
+                "execution_time": int(execution_time),
+                "timings": timings.to_dict()
+            })
             
-            db.log_query(user.id, server_id, query_data)
-            
-            return {
-                "success": True,
-                "resource_uri": resource_uri,
-                "content": formatted_content,
-                "execution_time_ms": int(execution_time),
-                "timestamp": start_time.isoformat()
-            }
+            return StreamingResponse(
+                spooled.iter_chunks(),
+                media_type=spooled.mime_type,
+                headers={"Content-Length": str(spooled.size)},
+                background=BackgroundTask(spooled.close)
+            )
             
+        # Format result; binary data never goes into the query log
+        parse_start = time.perf_counter()
+        formatted_content = []
+        logged_content = []
+        if hasattr(result, 'contents') and result.contents:
+            for content_item in result.contents:
+                if hasattr(content_item, 'text'):
+                    text_content = {
+                        "type": "text",
+                        "content": content_item.text,
+                        "mimeType": getattr(content_item, 'mimeType', 'text/plain')
+                    }
+                    formatted_content.append(text_content)
+                    logged_content.append(text_content)
+                elif binary_payload(content_item) is not None:
+                    formatted_content.append(describe_binary(content_item, include_data=include_binary))
+                    logged_content.append(describe_binary(content_item))
+        timings.add("parse", (time.perf_counter() - parse_start) * 1000)
+        
+        # Calculate execution time
+        execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+        
+        # Log query
+        query_data = {
+            "query_text": f"Resource: {resource_uri}",
+            "query_type": "resource",
+            "resource_uri": resource_uri,
+            "result": {"content": logged_content},
+            "execution_time": int(execution_time),
+            "timings": timings.to_dict()
+        }
+        
+        db.log_query(user.id, server_id, query_data)
+        
+        return {
+            "success": True,
+            "resource_uri": resource_uri,
+            "content": formatted_content,
+            "execution_time_ms": int(execution_time),
+            "timings": timings.to_dict(),
+            "timestamp": start_time.isoformat()
+        }
+        
     except Exception as e:
         execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
         
@@ -208,7 +416,8 @@ async def read_resource(
             "query_type": "resource",
             "resource_uri": resource_uri,
             "error_message": str(e),
-            "execution_time": int(execution_time)
+            "execution_time": int(execution_time),
+            "timings": timings.to_dict()
         }
         
         db.log_query(user.id, server_id, query_data)
@@ -219,6 +428,70 @@ async def read_resource(
         )
 
 
+@router.post("/{server_id}/resource/subscribe")
+async def subscribe_resource(
+    server_id: int,
+    resource_uri: str,
+    user: User = Depends(get_current_user)
+):
+    """
+    Subscribe to a resource so reads are served from the local mirror.
+    
+    The mirror is refreshed whenever the server reports the resource as
+    updated, so subsequent reads need no round trip to the server.
+    """
+    db = get_database()
+    server = db.get_server_by_id(server_id)
+    
+    if not server or server.owner_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Server not found"
+        )
+    
+    try:
+        pool = get_session_pool_manager().get_pool(server_id, server_config_from_model(server))
+        client = await pool.subscribe_resource(resource_uri)
+        
+        return {
+            "success": True,
+            "resource_uri": resource_uri,
+            "mirror": get_resource_mirror().stats(client.server_key)
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Resource subscription failed: {str(e)}"
+        )
+
+
+@router.delete("/{server_id}/resource/subscribe")
+async def unsubscribe_resource(
+    server_id: int,
+    resource_uri: str,
+    user: User = Depends(get_current_user)
+):
+    """Unsubscribe from a resource and drop it from the local mirror."""
+    db = get_database()
+    server = db.get_server_by_id(server_id)
+    
+    if not server or server.owner_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Server not found"
+        )
+    
+    pool = get_session_pool_manager().get_pool(server_id, server_config_from_model(server))
+    if not await pool.unsubscribe_resource(resource_uri):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resource is not subscribed"
+        )
+    
+    return {"success": True, "resource_uri": resource_uri}
+
+
 @router.post("/{server_id}/prompt")
 async def get_prompt(
     server_id: int,
@@ -237,44 +510,30 @@ async def get_prompt(
         )
     
     start_time = datetime.utcnow()
+    timings = Timings()
     
     try:
-        # Create MCP client and get prompt
-        config = MCPClientConfig(
-            server_command=server.server_command,
-            server_args=server.server_args or [],
-            server_env=server.server_env or {},
-            transport_type=server.server_type,
-            timeout=30,
-            debug=False
-        )
+        # Reuse a pooled session to get the prompt
+        server_config = server_config_from_model(server)
         
-        async with MCPClient(config) as client:
-            if server.server_url:
-                await client.connect(server.server_url, server.server_type)
-            elif server.server_path:
-                await client.connect(server.server_path)
-            else:
-                await client.connect_stdio(
-                    server.server_command,
-                    server.server_args or [],
-                    server.server_env or {}
-                )
+        acquire_start = time.perf_counter()
+        async with get_session_pool_manager().acquire(server_id, server_config) as client:
+            timings.merge(acquire_timings(client, acquire_start))
+            result = await client.get_prompt(prompt_name, prompt_args, timings=timings)
             
-            result = await client.get_prompt(prompt_name, prompt_args)
+            # Format result
+            with timings.phase("parse"):
+                formatted_messages = []
+                if hasattr(result, 'messages') and result.messages:
+                    for message in result.messages:
+                        formatted_messages.append({
+                            "role": getattr(message, 'role', 'unknown'),
+                            "content": getattr(message, 'content', {})
+                        })
             
             # Calculate execution time
             execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
             
-            # Format result
-            formatted_messages = []
-            if hasattr(result, 'messages') and result.messages:
-                for message in result.messages:
-                    formatted_messages.append({
-                        "role": getattr(message, 'role', 'unknown'),
-                        "content": getattr(message, 'content', {})
-                    })
-            
             # Log query
             query_data = {
                 "query_text": f"Prompt: {prompt_name}",
@@ -282,7 +541,8 @@ async def get_prompt(
                 "prompt_name": prompt_name,
                 "prompt_args": prompt_args,
                 "result": {"messages": formatted_messages},
-                "execution_time": int(execution_time)
+                "execution_time": int(execution_time),
+                "timings": timings.to_dict()
             }
             
             db.log_query(user.id, server_id, query_data)
@@ -293,6 +553,7 @@ async def get_prompt(
                 "arguments": prompt_args,
                 "messages": formatted_messages,
                 "execution_time_ms": int(execution_time),
+                "timings": timings.to_dict(),
                 "timestamp": start_time.isoformat()
             }
             
@@ -306,7 +567,8 @@ async def get_prompt(
             "prompt_name": prompt_name,
             "prompt_args": prompt_args,
             "error_message": str(e),
-            "execution_time": int(execution_time)
+            "execution_time": int(execution_time),
+            "timings": timings.to_dict()
         }
         
         db.log_query(user.id, server_id, query_data)
@@ -5,6 +5,7 @@ This module provides CRUD operations for MCP servers
 and capability discovery functionality.
 """
 
+import time
 from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, status
@@ -16,6 +17,7 @@ from ...database.models import (
 )
 from ...client import MCPClient, MCPClientConfig
 from ...llm.agent import get_agent_manager
+from ...pool import get_session_pool_manager, server_config_from_model
 
 router = APIRouter()
 
@@ -156,6 +158,9 @@ async def delete_server(
         agent_manager = get_agent_manager()
         await agent_manager.remove_agent(server_id)
         
+        # Close pooled sessions
+        await get_session_pool_manager().close_server(server_id)
+        
         # Mark as inactive instead of deleting
         server.is_active = False
         server.updated_at = datetime.utcnow()
@@ -244,7 +249,7 @@ async def test_server_connection(
                 )
             
             # Basic capability check
-            await client.discover_capabilities()
+            await client.discover_capabilities(refresh=True)
             
             return {
                 "status": "success",
@@ -252,6 +257,7 @@ async def test_server_connection(
                 "tools_count": len(client.available_tools),
                 "resources_count": len(client.available_resources),
                 "prompts_count": len(client.available_prompts),
+                "discovery_timings_ms": client.discovery_timings,
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -263,6 +269,69 @@ async def test_server_connection(
         }
 
 
+@router.get("/{server_id}/resources")
+async def list_server_resources(
+    server_id: int,
+    prefix: str = "",
+    limit: int = 100,
+    user: User = Depends(get_current_user)
+):
+    """
+    List a server's resources by URI prefix.
+    
+    Lookups are served from the server's indexed resource catalog, which is
+    filled lazily from paginated resources/list. If no resource has the
+    prefix as its exact URI, the resource template it expands from is
+    reported as well.
+    """
+    db = get_database()
+    server = db.get_server_by_id(server_id)
+    
+    if not server:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Server not found"
+        )
+    
+    if server.owner_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    try:
+        async with get_session_pool_manager().acquire(server_id, server_config_from_model(server)) as client:
+            start = time.perf_counter()
+            resources = await client.find_resources(prefix, limit)
+            template_match = None
+            if prefix and not client.resource_catalog().get(prefix):
+                template_match = await client.match_resource_template(prefix)
+            lookup_ms = (time.perf_counter() - start) * 1000
+            catalog_stats = client.resource_catalog().stats()
+        
+        response = {
+            "prefix": prefix,
+            "resources": [resource.model_dump(mode="json", exclude_none=True) for resource in resources],
+            "count": len(resources),
+            "catalog": catalog_stats,
+            "lookup_ms": round(lookup_ms, 3)
+        }
+        if template_match:
+            template, variables = template_match
+            response["template"] = {
+                "uriTemplate": template.uriTemplate,
+                "name": template.name,
+                "variables": variables
+            }
+        return response
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to list resources: {str(e)}"
+        )
+
+
 async def discover_server_capabilities(server_id: int) -> dict:
     """Discover capabilities for a server and update database."""
     db = get_database()
@@ -295,37 +364,11 @@ async def discover_server_capabilities(server_id: int) -> dict:
             )
         
         # Discover capabilities
-        await client.discover_capabilities()
+        await client.discover_capabilities(refresh=True)
         
         # Format capabilities
-        capabilities = {
-            "tools": [
-                {
-                    "name": tool.name,
-                    "description": getattr(tool, 'description', ''),
-                    "inputSchema": getattr(tool, 'inputSchema', {})
-                }
-                for tool in client.available_tools
-            ],
-            "resources": [
-                {
-                    "uri": str(resource.uri),
-                    "name": getattr(resource, 'name', ''),
-                    "description": getattr(resource, 'description', ''),
-                    "mimeType": getattr(resource, 'mimeType', '')
-                }
-                for resource in client.available_resources
-            ],
-            "prompts": [
-                {
-                    "name": prompt.name,
-                    "description": getattr(prompt, 'description', ''),
-                    "arguments": getattr(prompt, 'arguments', [])
-                }
-                for prompt in client.available_prompts
-            ],
-            "last_updated": datetime.utcnow().isoformat()
-        }
+        capabilities = client.capabilities_snapshot()
+        capabilities["discovery_timings_ms"] = client.discovery_timings
         
         # Update database
         db.update_server_capabilities(server_id, capabilities)
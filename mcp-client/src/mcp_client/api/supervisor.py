@@ -0,0 +1,154 @@
+"""
+Background supervision of pooled MCP server sessions.
+
+This module pings every live pooled session on a fixed interval, records
+heartbeat latency in MCPServer.last_ping, and restarts servers whose
+sessions have all died, keeping them out of rotation until they are back.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..database.database import get_database
+from ..pool import SessionPool, SessionPoolManager, get_session_pool_manager
+
+
+logger = logging.getLogger("mcp_client.supervisor")
+
+
+class SupervisorConfig(BaseModel):
+    """Heartbeat and restart settings for the server supervisor."""
+
+    interval: float = 15.0  # seconds between heartbeats
+    ping_timeout: float = 5.0
+    restart_backoff: float = 1.0  # initial delay between restart attempts
+    restart_backoff_max: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "SupervisorConfig":
+        """Load settings from MCP_SUPERVISOR_* environment variables."""
+        defaults = cls()
+        return cls(
+            interval=float(os.getenv("MCP_SUPERVISOR_INTERVAL", defaults.interval)),
+            ping_timeout=float(os.getenv("MCP_SUPERVISOR_PING_TIMEOUT", defaults.ping_timeout)),
+            restart_backoff=float(os.getenv("MCP_SUPERVISOR_RESTART_BACKOFF", defaults.restart_backoff)),
+            restart_backoff_max=float(os.getenv("MCP_SUPERVISOR_RESTART_BACKOFF_MAX", defaults.restart_backoff_max)),
+        )
+
+
+class ServerSupervisor:
+    """
+    Heartbeats pooled sessions and restarts servers that stop answering.
+
+    A server is considered down when none of its pooled sessions answer a
+    heartbeat. Its pool is then taken out of rotation, so requests fail fast
+    instead of discovering the crash, and restarted with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        pool_manager: Optional[SessionPoolManager] = None,
+        config: Optional[SupervisorConfig] = None
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            pool_manager: Pools to supervise (defaults to the global manager)
+            config: Heartbeat and restart settings
+        """
+        self.pool_manager = pool_manager or get_session_pool_manager()
+        self.config = config or SupervisorConfig()
+        self.restarts: Dict[Tuple[int, Optional[int]], asyncio.Task] = {}  # keyed by server id and replica
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the heartbeat loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the heartbeat loop and any restarts in progress."""
+        tasks = [t for t in [self._task, *self.restarts.values()] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self.restarts.clear()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check_all()
+            except Exception as e:
+                logger.warning(f"Supervisor heartbeat failed: {e}")
+            await asyncio.sleep(self.config.interval)
+
+    async def check_all(self) -> None:
+        """Heartbeat every pool once."""
+        pools = [
+            p for p in self.pool_manager.pools.values()
+            if p.available and (p.server_id, p.replica) not in self.restarts
+        ]
+        await asyncio.gather(*(self.check_pool(pool) for pool in pools))
+
+    async def check_pool(self, pool: SessionPool) -> None:
+        """Heartbeat one pool, recording latency or restarting the server."""
+        failures, latencies = await pool.heartbeat(self.config.ping_timeout)
+
+        if latencies:
+            latency = sum(latencies) / len(latencies)
+            try:
+                get_database().update_server_ping(pool.server_id, round(latency, 2))
+            except Exception as e:
+                logger.warning(f"Failed to record ping for server {pool.server_id}: {e}")
+        elif failures:
+            logger.warning(f"Server {pool.server_id} (replica {pool.replica}) stopped responding; restarting")
+            pool.available = False
+            self.restarts[(pool.server_id, pool.replica)] = asyncio.create_task(self._restart(pool))
+
+    async def _restart(self, pool: SessionPool) -> None:
+        delay = self.config.restart_backoff
+        attempt = 0
+        try:
+            while not pool.closed:
+                attempt += 1
+                try:
+                    await pool.restart()
+                    pool.available = True
+                    pool.start()
+                    logger.info(f"Restarted server {pool.server_id} after {attempt} attempt(s)")
+                    return
+                except Exception as e:
+                    logger.warning(f"Restart attempt {attempt} for server {pool.server_id} failed: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.config.restart_backoff_max)
+        finally:
+            self.restarts.pop((pool.server_id, pool.replica), None)
+
+    def stats(self) -> Dict[str, object]:
+        """Get supervisor status."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval": self.config.interval,
+            "restarting": [
+                {"server_id": server_id, "replica": replica}
+                for server_id, replica in self.restarts
+            ]
+        }
+
+
+# Global server supervisor
+server_supervisor: Optional[ServerSupervisor] = None
+
+
+def get_supervisor() -> ServerSupervisor:
+    """Get the global server supervisor, creating it from the environment on first use."""
+    global server_supervisor
+    if server_supervisor is None:
+        server_supervisor = ServerSupervisor(config=SupervisorConfig.from_env())
+    return server_supervisor
@@ -0,0 +1,123 @@
+"""
+Load generation for MCP servers.
+
+This module drives one operation (a tool call, resource read or prompt
+get) against a connected server at a fixed concurrency, optionally paced
+to a target rate, for a duration or a number of calls, and summarizes
+throughput, latency percentiles and error rate.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .latency import nearest_rank
+
+
+class BenchResult:
+    """Latencies and errors collected by a benchmark run."""
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []  # successful calls only
+        self.errors = 0
+        self.error_messages: Dict[str, int] = {}
+        self.elapsed = 0.0  # seconds
+
+    @property
+    def requests(self) -> int:
+        """Number of completed calls, successful or not."""
+        return len(self.latencies_ms) + self.errors
+
+    def record_error(self, error: Exception) -> None:
+        """Count a failed call by error message."""
+        self.errors += 1
+        message = f"{type(error).__name__}: {error}"
+        self.error_messages[message] = self.error_messages.get(message, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Get throughput, latency percentiles (ms) and error rate."""
+        latencies = sorted(self.latencies_ms)
+        latency = {}
+        if latencies:
+            latency = {
+                "mean": round(sum(latencies) / len(latencies), 2),
+                "p50": round(nearest_rank(latencies, 50), 2),
+                "p90": round(nearest_rank(latencies, 90), 2),
+                "p99": round(nearest_rank(latencies, 99), 2),
+                "max": round(latencies[-1], 2),
+            }
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "duration_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.requests / self.elapsed, 2) if self.elapsed else 0.0,
+            "latency_ms": latency,
+            "error_messages": self.error_messages,
+        }
+
+
+async def run_benchmark(
+    operation: Callable[[], Awaitable[Any]],
+    concurrency: int = 1,
+    duration: Optional[float] = None,
+    requests: Optional[int] = None,
+    rate: Optional[float] = None,
+    warmup: int = 0
+) -> BenchResult:
+    """
+    Run an operation repeatedly and collect its latencies.
+
+    With a rate, calls are started on a fixed schedule and latency is
+    measured from each call's scheduled start, so a server that falls
+    behind shows up in the latencies rather than just lowering the rate.
+
+    Args:
+        operation: Performs one call; an exception counts as an error
+        concurrency: Calls in flight at once
+        duration: Stop starting calls after this many seconds
+        requests: Stop after this many calls
+        rate: Target calls per second across all workers
+        warmup: Calls made before measuring, not included in the result
+
+    Returns:
+        The collected result
+    """
+    if duration is None and requests is None:
+        raise ValueError("A duration or a number of requests is required")
+
+    for _ in range(warmup):
+        try:
+            await operation()
+        except Exception:
+            pass
+
+    result = BenchResult()
+    next_index = 0
+    start = time.perf_counter()
+    deadline = start + duration if duration is not None else None
+
+    async def worker() -> None:
+        nonlocal next_index
+        while True:
+            index = next_index
+            if requests is not None and index >= requests:
+                return
+            next_index += 1
+
+            scheduled = start + index / rate if rate else time.perf_counter()
+            if deadline is not None and scheduled >= deadline:
+                return
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                await operation()
+                result.latencies_ms.append((time.perf_counter() - scheduled) * 1000)
+            except Exception as e:
+                result.record_error(e)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    result.elapsed = time.perf_counter() - start
+    return result
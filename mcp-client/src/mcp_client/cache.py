@@ -0,0 +1,352 @@
+"""
+Caching utilities for MCP Client.
+
+This module provides the capability cache shared by every MCPClient that
+is connected to the same server, helpers to convert cached capabilities
+to and from the JSON snapshot stored in MCPServer.capabilities, the
+result cache for idempotent tool calls, and the mirror of subscribed
+resources.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp.types import Prompt, Resource, Tool
+
+
+CAPABILITY_TYPES = {
+    "resources": Resource,
+    "tools": Tool,
+    "prompts": Prompt,
+}
+
+# Server notifications that invalidate a capability category
+LIST_CHANGED_NOTIFICATIONS = {
+    "notifications/resources/list_changed": "resources",
+    "notifications/tools/list_changed": "tools",
+    "notifications/prompts/list_changed": "prompts",
+}
+
+
+class CapabilityCache:
+    """
+    In-memory cache of server capabilities keyed by server identity.
+
+    Entries are stored per category so that a list_changed notification
+    for tools does not throw away cached resources and prompts.
+    """
+
+    def __init__(self):
+        """Initialize an empty capability cache."""
+        self._entries: Dict[Tuple[str, str], Tuple[List[Any], float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, server_key: str, category: str, ttl: float) -> Optional[List[Any]]:
+        """
+        Get cached items for a category.
+
+        Args:
+            server_key: Server identity
+            category: resources, tools or prompts
+            ttl: Maximum age in seconds; 0 disables the cache
+
+        Returns:
+            The cached items, or None if missing or expired
+        """
+        if ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get((server_key, category))
+        if entry is None:
+            return None
+        items, fetched_at = entry
+        if time.time() - fetched_at > ttl:
+            self.invalidate(server_key, category)
+            return None
+        return items
+
+    def put(self, server_key: str, category: str, items: List[Any], fetched_at: Optional[float] = None) -> None:
+        """Store items for a category."""
+        with self._lock:
+            self._entries[(server_key, category)] = (list(items), fetched_at or time.time())
+
+    def fetched_at(self, server_key: str, category: str) -> Optional[float]:
+        """Get the time a category was fetched, if cached."""
+        with self._lock:
+            entry = self._entries.get((server_key, category))
+        return entry[1] if entry else None
+
+    def invalidate(self, server_key: str, category: Optional[str] = None) -> None:
+        """Invalidate one category, or every category, for a server."""
+        with self._lock:
+            categories = [category] if category else list(CAPABILITY_TYPES)
+            for name in categories:
+                self._entries.pop((server_key, name), None)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+def capabilities_to_snapshot(
+    resources: List[Resource],
+    tools: List[Tool],
+    prompts: List[Prompt],
+    fetched_at: Optional[float] = None
+) -> Dict[str, Any]:
+    """Convert capabilities to the JSON snapshot stored in MCPServer.capabilities."""
+    return {
+        "tools": [tool.model_dump(mode="json", exclude_none=True) for tool in tools],
+        "resources": [resource.model_dump(mode="json", exclude_none=True) for resource in resources],
+        "prompts": [prompt.model_dump(mode="json", exclude_none=True) for prompt in prompts],
+        "last_updated": datetime.utcfromtimestamp(fetched_at or time.time()).isoformat()
+    }
+
+
+def capabilities_from_snapshot(snapshot: Dict[str, Any]) -> Tuple[Dict[str, List[Any]], Optional[float]]:
+    """
+    Parse a stored capabilities snapshot.
+
+    Returns:
+        Parsed items per category and the snapshot time as a UNIX timestamp
+        (None if the snapshot is undated)
+    """
+    parsed = {}
+    for category, model in CAPABILITY_TYPES.items():
+        parsed[category] = [model.model_validate(item) for item in snapshot.get(category) or []]
+
+    fetched_at = None
+    if snapshot.get("last_updated"):
+        try:
+            last_updated = datetime.fromisoformat(snapshot["last_updated"])
+            fetched_at = (last_updated - datetime(1970, 1, 1)).total_seconds()
+        except (TypeError, ValueError):
+            fetched_at = None
+    return parsed, fetched_at
+
+
+def canonical_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """Serialize tool arguments so that equal arguments give equal keys."""
+    return json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ResultCache:
+    """
+    TTL and size-bounded LRU cache of tool call results.
+
+    Keys combine the server identity, the tool name and the canonicalized
+    arguments. Hit and miss counters are tracked per server.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of cached results across all servers
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[Any, float]]" = OrderedDict()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, server_key: str, tool_name: str, arguments: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """Get a cached result, counting the lookup as a hit or miss."""
+        key = (server_key, tool_name, canonical_arguments(arguments))
+        now = time.monotonic()
+        with self._lock:
+            counters = self._counters.setdefault(server_key, {"hits": 0, "misses": 0})
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                counters["hits"] += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            counters["misses"] += 1
+            return None
+
+    def put(self, server_key: str, tool_name: str, arguments: Optional[Dict[str, Any]], result: Any, ttl: float) -> None:
+        """Store a result for ttl seconds, evicting the least recently used entries."""
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        key = (server_key, tool_name, canonical_arguments(arguments))
+        with self._lock:
+            self._entries[key] = (result, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, server_key: str, tool_name: Optional[str] = None) -> None:
+        """Drop cached results for a server, or for one of its tools."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == server_key and (tool_name is None or k[1] == tool_name)]:
+                del self._entries[key]
+
+    def stats(self, server_key: str) -> Dict[str, int]:
+        """Get hit and miss counters for a server."""
+        with self._lock:
+            return dict(self._counters.get(server_key, {"hits": 0, "misses": 0}))
+
+    def clear(self) -> None:
+        """Remove every cached result and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+def resource_result_size(result: Any) -> int:
+    """Approximate in-memory size of a read_resource result."""
+    size = 0
+    for content in getattr(result, "contents", None) or []:
+        size += len(getattr(content, "text", None) or getattr(content, "blob", None) or "")
+    return size
+
+
+class ResourceMirror:
+    """
+    Local copy of subscribed resources, refreshed on update notifications.
+
+    Subscriptions are reference-counted per server and URI so that several
+    sessions to the same server can hold one. Contents are bounded in total
+    size; evicting a mirrored resource only costs one re-read.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the resource mirror.
+
+        Args:
+            max_bytes: Maximum total size of mirrored contents
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, int]]" = OrderedDict()
+        self._subscribers: Dict[Tuple[str, str], int] = {}
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, server_key: str, uri: str) -> None:
+        """Add a subscriber for a resource."""
+        with self._lock:
+            key = (server_key, uri)
+            self._subscribers[key] = self._subscribers.get(key, 0) + 1
+
+    def unsubscribe(self, server_key: str, uri: str) -> None:
+        """Remove a subscriber, dropping the mirrored contents with the last one."""
+        with self._lock:
+            key = (server_key, uri)
+            remaining = self._subscribers.get(key, 0) - 1
+            if remaining > 0:
+                self._subscribers[key] = remaining
+                return
+            self._subscribers.pop(key, None)
+            self._generations.pop(key, None)
+            self._drop(key)
+
+    def is_subscribed(self, server_key: str, uri: str) -> bool:
+        """Whether a resource is mirrored."""
+        with self._lock:
+            return (server_key, uri) in self._subscribers
+
+    def get(self, server_key: str, uri: str) -> Optional[Any]:
+        """Get the mirrored contents of a subscribed resource, if present."""
+        key = (server_key, uri)
+        with self._lock:
+            if key not in self._subscribers:
+                return None
+            counters = self._counters.setdefault(server_key, {"hits": 0, "misses": 0, "updates": 0})
+            entry = self._entries.get(key)
+            if entry is None:
+                counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            counters["hits"] += 1
+            return entry[0]
+
+    def generation(self, server_key: str, uri: str) -> int:
+        """Number of updates seen for a resource, used to discard stale reads."""
+        with self._lock:
+            return self._generations.get((server_key, uri), 0)
+
+    def put(self, server_key: str, uri: str, result: Any, generation: Optional[int] = None) -> None:
+        """
+        Store the latest contents of a subscribed resource.
+
+        If generation is given and the resource has been updated since it was
+        taken, the result is stale and is not stored.
+        """
+        key = (server_key, uri)
+        size = resource_result_size(result)
+        with self._lock:
+            if key not in self._subscribers or size > self.max_bytes:
+                return
+            if generation is not None and generation != self._generations.get(key, 0):
+                return
+            self._drop(key)
+            self._entries[key] = (result, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted
+
+    def invalidate(self, server_key: str, uri: str) -> None:
+        """Drop mirrored contents after the server reports an update."""
+        with self._lock:
+            counters = self._counters.setdefault(server_key, {"hits": 0, "misses": 0, "updates": 0})
+            counters["updates"] += 1
+            key = (server_key, uri)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._drop(key)
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    def stats(self, server_key: Optional[str] = None) -> Dict[str, Any]:
+        """Get mirror statistics, optionally for one server."""
+        with self._lock:
+            if server_key is not None:
+                return {
+                    "subscriptions": sorted(uri for key, uri in self._subscribers if key == server_key),
+                    "mirrored": sum(1 for key, _ in self._entries if key == server_key),
+                    **self._counters.get(server_key, {"hits": 0, "misses": 0, "updates": 0})
+                }
+            return {
+                "subscriptions": len(self._subscribers),
+                "mirrored": len(self._entries),
+                "total_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
+# Global capability cache
+capability_cache = CapabilityCache()
+
+# Global tool result cache
+result_cache = ResultCache()
+
+# Global mirror of subscribed resources
+resource_mirror = ResourceMirror()
+
+
+def get_capability_cache() -> CapabilityCache:
+    """Get the global capability cache."""
+    return capability_cache
+
+
+def get_result_cache() -> ResultCache:
+    """Get the global tool result cache."""
+    return result_cache
+
+
+def get_resource_mirror() -> ResourceMirror:
+    """Get the global resource mirror."""
+    return resource_mirror
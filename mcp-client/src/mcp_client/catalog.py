@@ -0,0 +1,246 @@
+"""
+Indexed resource catalog for MCP Client.
+
+This module indexes a server's resources by URI so that prefix and exact
+lookups stay fast for servers exposing tens of thousands of resources,
+and matches URIs against the server's resource templates. Catalogs are
+filled lazily, one list_resources page at a time, and shared by every
+client connected to the same server.
+"""
+
+import asyncio
+import re
+import threading
+from bisect import bisect_left
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Tuple
+
+from mcp.types import Resource, ResourceTemplate
+
+
+# Fetches one page of items given a cursor, returning the items and next cursor
+PageFetcher = Callable[[Optional[str]], Awaitable[Tuple[List[Any], Optional[str]]]]
+
+_EXPRESSION = re.compile(r"\{([+#/?&]?)([^}]+)\}")
+
+
+def compile_uri_template(template: str) -> Pattern:
+    """
+    Compile an RFC 6570 URI template into a regular expression.
+
+    Simple ({var}), reserved ({+var}, {#var}), path segment ({/var}) and
+    query ({?a,b}) expressions are supported; variables become named groups.
+    """
+    pattern = []
+    position = 0
+    for match in _EXPRESSION.finditer(template):
+        pattern.append(re.escape(template[position:match.start()]))
+        operator, names = match.group(1), [n.rstrip("*") for n in match.group(2).split(",")]
+        groups = [f"(?P<{_group_name(name)}>{{value}})" for name in names]
+        if operator in ("+", "#"):
+            prefix = "#" if operator == "#" else ""
+            pattern.append(re.escape(prefix) + ",".join(g.format(value=".+?") for g in groups))
+        elif operator == "/":
+            pattern.append("".join("/" + g.format(value="[^/?#]+") for g in groups))
+        elif operator in ("?", "&"):
+            pairs = [f"{re.escape(name)}={g.format(value='[^&#]*')}" for name, g in zip(names, groups)]
+            pattern.append("(?:" + re.escape(operator) + "&".join(pairs) + ")?")
+        else:
+            pattern.append(",".join(g.format(value="[^/?#,]+") for g in groups))
+        position = match.end()
+    pattern.append(re.escape(template[position:]))
+    return re.compile("".join(pattern) + r"\Z")
+
+
+def _group_name(name: str) -> str:
+    if not re.fullmatch(r"\w+", name):
+        raise re.error(f"Unsupported template variable name: {name}")
+    return "v_" + name
+
+
+def _template_literal_prefix(template: str) -> str:
+    brace = template.find("{")
+    return template if brace < 0 else template[:brace]
+
+
+class ResourceCatalog:
+    """
+    URI index of one server's resources and resource templates.
+
+    URIs are kept in a sorted array, so a prefix query is a binary search
+    to the first match followed by a scan over the matches only, which
+    answers like a prefix trie without a node per character.
+    """
+
+    def __init__(self):
+        """Initialize an empty catalog."""
+        self._uris: List[str] = []
+        self._resources: Dict[str, Resource] = {}
+        self._sorted = True
+        self._templates: List[Tuple[ResourceTemplate, str, Pattern]] = []
+        self._cursor: Optional[str] = None
+        self._seen_cursors: set = set()
+        self.complete = False
+        self.templates_loaded = False
+        self.pages_loaded = 0
+        self._load_lock = asyncio.Lock()
+        self._index_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def add(self, resources: List[Resource]) -> None:
+        """Index a batch of resources."""
+        with self._index_lock:
+            for resource in resources:
+                uri = str(resource.uri)
+                if uri not in self._resources:
+                    self._uris.append(uri)
+                    self._sorted = False
+                self._resources[uri] = resource
+
+    def set_templates(self, templates: List[ResourceTemplate]) -> None:
+        """Replace the resource templates."""
+        compiled = []
+        for template in templates:
+            try:
+                compiled.append((template, _template_literal_prefix(template.uriTemplate), compile_uri_template(template.uriTemplate)))
+            except re.error:
+                continue
+        # Most specific (longest literal prefix) templates are tried first
+        compiled.sort(key=lambda entry: len(entry[1]), reverse=True)
+        self._templates = compiled
+        self.templates_loaded = True
+
+    def seed(self, resources: List[Resource]) -> None:
+        """Fill the catalog from a complete resource list."""
+        self.add(resources)
+        self.complete = True
+
+    def get(self, uri: str) -> Optional[Resource]:
+        """Get a resource by exact URI."""
+        return self._resources.get(uri)
+
+    def find(self, prefix: str = "", limit: Optional[int] = None) -> List[Resource]:
+        """
+        Get resources whose URI starts with prefix, in URI order.
+
+        Args:
+            prefix: URI prefix; an empty prefix matches everything
+            limit: Maximum number of results
+        """
+        with self._index_lock:
+            if not self._sorted:
+                self._uris.sort()
+                self._sorted = True
+            results = []
+            for index in range(bisect_left(self._uris, prefix), len(self._uris)):
+                uri = self._uris[index]
+                if not uri.startswith(prefix) or (limit is not None and len(results) >= limit):
+                    break
+                results.append(self._resources[uri])
+            return results
+
+    def match_template(self, uri: str) -> Optional[Tuple[ResourceTemplate, Dict[str, str]]]:
+        """
+        Find the resource template a URI expands from.
+
+        Returns:
+            The template and the extracted variables, or None if no template matches
+        """
+        for template, literal_prefix, pattern in self._templates:
+            if not uri.startswith(literal_prefix):
+                continue
+            match = pattern.match(uri)
+            if match:
+                variables = {
+                    group[2:]: value
+                    for group, value in match.groupdict().items()
+                    if value is not None
+                }
+                return template, variables
+        return None
+
+    async def load(
+        self,
+        fetch_page: PageFetcher,
+        until: Optional[Callable[[], bool]] = None
+    ) -> None:
+        """
+        Fetch resource pages until the listing is complete or until() is true.
+
+        Args:
+            fetch_page: Fetches one list_resources page
+            until: Checked after each page; loading stops early once true
+        """
+        async with self._load_lock:
+            while not self.complete and not (until and until()):
+                resources, cursor = await fetch_page(self._cursor)
+                self.add(resources)
+                self.pages_loaded += 1
+                if not cursor or cursor in self._seen_cursors:
+                    self.complete = True
+                    break
+                self._seen_cursors.add(cursor)
+                self._cursor = cursor
+
+    async def search(
+        self,
+        prefix: str,
+        fetch_page: PageFetcher,
+        limit: Optional[int] = None
+    ) -> List[Resource]:
+        """
+        Find resources by prefix, loading pages only as far as needed.
+
+        With a limit, loading stops as soon as enough matches are indexed;
+        without one the whole listing is loaded on first use.
+        """
+        if not self.complete:
+            until = (lambda: len(self.find(prefix, limit)) >= limit) if limit else None
+            await self.load(fetch_page, until)
+        return self.find(prefix, limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get catalog statistics."""
+        return {
+            "resources": len(self._resources),
+            "templates": len(self._templates),
+            "pages_loaded": self.pages_loaded,
+            "complete": self.complete
+        }
+
+
+class ResourceCatalogRegistry:
+    """Resource catalogs shared by all clients, keyed by server identity."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._catalogs: Dict[str, ResourceCatalog] = {}
+        self._lock = threading.Lock()
+
+    def get(self, server_key: str) -> ResourceCatalog:
+        """Get the catalog for a server, creating an empty one if needed."""
+        with self._lock:
+            catalog = self._catalogs.get(server_key)
+            if catalog is None:
+                catalog = self._catalogs[server_key] = ResourceCatalog()
+            return catalog
+
+    def invalidate(self, server_key: str) -> None:
+        """Drop a server's catalog so it is rebuilt on next use."""
+        with self._lock:
+            self._catalogs.pop(server_key, None)
+
+    def clear(self) -> None:
+        """Drop every catalog."""
+        with self._lock:
+            self._catalogs.clear()
+
+
+# Global resource catalog registry
+resource_catalogs = ResourceCatalogRegistry()
+
+
+def get_resource_catalogs() -> ResourceCatalogRegistry:
+    """Get the global resource catalog registry."""
+    return resource_catalogs
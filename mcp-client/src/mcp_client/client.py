@@ -6,28 +6,46 @@ using various transport mechanisms (stdio, SSE, streamable HTTP).
 """
 
 import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
 import os
 import subprocess
 import sys
-from contextlib import AsyncExitStack
+import time
+from contextlib import AsyncExitStack, nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+import anyio
+import httpx
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_client_server_memory_streams
 from mcp.types import (
     CallToolResult,
+    CancelledNotification,
+    CancelledNotificationParams,
+    ClientNotification,
     GetPromptResult,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
     ListPromptsResult,
     ListResourcesResult,
     ListToolsResult,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
     Prompt,
     ReadResourceResult,
     Resource,
+    ResourceTemplate,
+    ServerNotification,
     Tool,
 )
 from pydantic import BaseModel, ValidationError
@@ -36,6 +54,27 @@ from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
 
+from .cache import (
+    LIST_CHANGED_NOTIFICATIONS,
+    canonical_arguments,
+    capabilities_from_snapshot,
+    capabilities_to_snapshot,
+    get_capability_cache,
+    get_resource_mirror,
+    get_result_cache,
+)
+from .catalog import ResourceCatalog, get_resource_catalogs
+from .concurrency import RequestGate, get_request_coalescer, iter_bounded
+from .content import describe_binary
+from .resilience import get_circuit_breakers
+from .timing import Timings
+from .latency import get_latency_tracker
+
+
+# JSON-RPC errors caused by the request itself (e.g. arguments made up by an
+# LLM); like an isError result they show the server is answering normally
+CLIENT_ERROR_CODES = frozenset({PARSE_ERROR, INVALID_REQUEST, METHOD_NOT_FOUND, INVALID_PARAMS})
+
 
 class MCPClientConfig(BaseModel):
     """Configuration for MCP Client."""
@@ -43,10 +82,238 @@ class MCPClientConfig(BaseModel):
     server_command: Optional[str] = None
     server_args: List[str] = []
     server_env: Dict[str, str] = {}
-    transport_type: str = "stdio"  # stdio, sse, streamable_http
+    transport_type: str = "stdio"  # stdio, sse, streamable_http, inprocess
     server_url: Optional[str] = None
     timeout: int = 30
     debug: bool = False
+    
+    # Identity used by the shared caches; replicas of one logical server set
+    # the same key (derived from the connection target when unset)
+    server_key: Optional[str] = None
+    
+    # HTTP connection pooling (sse, streamable_http)
+    http2: bool = False
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    
+    # Seconds discovered capabilities stay cached (0 disables the cache)
+    capability_cache_ttl: float = 300.0
+    
+    # Maximum concurrent requests on one session (0 means unlimited)
+    max_concurrency: int = 16
+    
+    # Tool result caching: tools listed here, or annotated as read-only and
+    # idempotent by the server, are cached for result_cache_ttl seconds
+    cacheable_tools: List[str] = []
+    cache_annotated_tools: bool = True
+    result_cache_ttl: float = 60.0
+    
+    # Identical concurrent reads (resources, prompts and read-only or
+    # idempotent tools) share one in-flight request
+    coalesce_requests: bool = True
+    
+    # Hedged tool calls (opt-in): if an idempotent tool has not answered by
+    # hedge_percentile of its observed latency, a duplicate is sent on
+    # another pooled session or replica and the slower one is cancelled
+    hedge_requests: bool = False
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    
+    # Per-tool deadlines (opt-in): call_tool gives up after
+    # tool_timeout_multiplier times the tool's observed latency percentile,
+    # clamped between tool_timeout_min and timeout (timeout alone until
+    # enough samples exist)
+    adaptive_timeouts: bool = False
+    tool_timeout_percentile: float = 99.0
+    tool_timeout_multiplier: float = 3.0
+    tool_timeout_min: float = 1.0
+    tool_timeout_min_samples: int = 10
+    
+    # Send notifications/cancelled for abandoned requests. Off by default:
+    # servers built on the mcp 1.9 SDK crash when a request they are still
+    # running is cancelled
+    send_cancellation: bool = False
+    
+    # Circuit breakers: after circuit_failure_threshold consecutive failures
+    # calls to the tool (or the whole server, for transport failures and
+    # timeouts) fail fast for circuit_reset_timeout seconds
+    circuit_breaker: bool = True
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+
+
+class CallStats:
+    """Per-call details filled in by MCPClient.call_tool."""
+    
+    def __init__(self):
+        self.cache_hit: Optional[bool] = None  # None when the tool is not cacheable
+        self.coalesced = False  # True when the result was shared with an identical in-flight call
+        self.hedged = False  # True when a duplicate request was sent to another session
+        self.hedge_won = False  # True when the duplicate answered first
+        self.deadline: Optional[float] = None  # seconds the call was allowed to take
+        self.timings = Timings()  # request phase of the call
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary."""
+        return {
+            "cache_hit": self.cache_hit,
+            "coalesced": self.coalesced,
+            "hedged": self.hedged,
+            "hedge_won": self.hedge_won,
+            "deadline": self.deadline,
+            "timings": self.timings.to_dict()
+        }
+
+
+class BatchToolResult:
+    """Outcome of one call in MCPClient.call_tools_batch."""
+    
+    def __init__(self, index: int, tool_name: str, arguments: Dict[str, Any]):
+        self.index = index  # position of the call in the batch
+        self.tool_name = tool_name
+        self.arguments = arguments
+        self.result: Optional[CallToolResult] = None
+        self.error: Optional[Exception] = None
+        self.stats = CallStats()
+        self.execution_time_ms = 0
+        
+    @property
+    def success(self) -> bool:
+        """Whether the call returned a result that is not a tool error."""
+        return self.error is None and self.result is not None and not self.result.isError
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary."""
+        return {
+            "index": self.index,
+            "success": self.success,
+            "tool_name": self.tool_name,
+            "arguments": self.arguments,
+            "result": self.result.model_dump(mode="json", exclude_none=True) if self.result is not None else None,
+            "error": str(self.error) if self.error is not None else None,
+            "execution_time_ms": self.execution_time_ms,
+            **self.stats.to_dict()
+        }
+
+
+class _SharedHTTPTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that delegates to a shared connection pool.
+    
+    The MCP HTTP transports close their httpx client when a session ends;
+    closing this wrapper leaves the shared pool and its keep-alive
+    connections open for the next session.
+    """
+    
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self._transport = transport
+        
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+        
+    async def aclose(self) -> None:
+        pass
+
+
+_http_transports: Dict[tuple, httpx.AsyncHTTPTransport] = {}
+
+
+def get_shared_http_transport(config: MCPClientConfig) -> httpx.AsyncHTTPTransport:
+    """
+    Get the process-wide HTTP connection pool for the given settings.
+    
+    Pools are per event loop because httpx connections cannot be shared
+    across loops.
+    """
+    http2 = config.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logging.getLogger("mcp_client").warning(
+            "HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1"
+        )
+        http2 = False
+        
+    key = (
+        id(asyncio.get_running_loop()),
+        http2,
+        config.http_max_connections,
+        config.http_max_keepalive_connections,
+        config.http_keepalive_expiry,
+    )
+    transport = _http_transports.get(key)
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            http1=True,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_keepalive_connections,
+                keepalive_expiry=config.http_keepalive_expiry,
+            ),
+        )
+        _http_transports[key] = transport
+    return transport
+
+
+async def aclose_shared_http_transports() -> None:
+    """Close the shared HTTP connection pools of the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    for key in [k for k in _http_transports if k[0] == loop_id]:
+        await _http_transports.pop(key).aclose()
+
+
+_inprocess_modules: Dict[str, Any] = {}
+
+
+def _load_inprocess_server(server_path: str):
+    """
+    Import a Python MCP server module and return its low-level server.
+    
+    Modules are imported once per process and reused by later connections.
+    The module-level FastMCP (or low-level Server) instance is located by
+    the conventional names mcp, server and app, falling back to the first
+    instance found in the module namespace.
+    """
+    from mcp.server.fastmcp import FastMCP
+    from mcp.server.lowlevel import Server
+    
+    path = Path(server_path).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Server file not found: {server_path}")
+    if path.suffix.lower() != ".py":
+        raise ValueError(f"In-process transport requires a Python server module: {server_path}")
+        
+    module = _inprocess_modules.get(str(path))
+    if module is None:
+        module_name = "_mcp_inprocess_" + hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:12]
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        # Let the server import its sibling modules
+        sys.path.insert(0, str(path.parent))
+        try:
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+        except Exception:
+            sys.modules.pop(module_name, None)
+            raise
+        finally:
+            sys.path.remove(str(path.parent))
+        _inprocess_modules[str(path)] = module
+        
+    candidates = [getattr(module, name, None) for name in ("mcp", "server", "app")]
+    candidates += list(vars(module).values())
+    for candidate in candidates:
+        if isinstance(candidate, FastMCP):
+            return candidate._mcp_server
+        if isinstance(candidate, Server):
+            return candidate
+            
+    raise ValueError(f"No FastMCP or Server instance found in {server_path}")
+
+
+def _server_identity(*parts: str) -> str:
+    """Build a stable identity for a server connection target."""
+    return "\x1f".join(str(part) for part in parts)
 
 
 class MCPClient:
@@ -57,6 +324,7 @@ class MCPClient:
     - stdio: Communication via standard input/output (for local servers)
     - SSE: Server-Sent Events over HTTP
     - streamable_http: HTTP-based streaming transport
+    - inprocess: In-memory streams to a Python FastMCP server imported into this process
     """
     
     def __init__(self, config: Optional[MCPClientConfig] = None):
@@ -76,6 +344,28 @@ class MCPClient:
         self.available_resources: List[Resource] = []
         self.available_tools: List[Tool] = []
         self.available_prompts: List[Prompt] = []
+        self.tools_by_name: Dict[str, Tool] = {}
+        self.discovery_timings: Dict[str, float] = {}
+        
+        # Connect, initialize and discovery phases of this session
+        self.timings = Timings()
+        self.connected_at: Optional[float] = None
+        
+        # Capability caching
+        self.server_key: Optional[str] = None
+        self.stale_capabilities: set = set()
+        self.on_capabilities_updated: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._invalidations = 0
+        
+        # Bounds in-flight requests on the session
+        self.request_gate = RequestGate(self.config.max_concurrency)
+        
+        # Opens another session to the same server for hedged requests (set by the pool)
+        self.hedge_source: Optional[Callable[[], AsyncContextManager["MCPClient"]]] = None
+        
+        # Resources this session is subscribed to, mirrored locally
+        self.subscriptions: set = set()
+        self._background_tasks: set = set()
         
     def _setup_logging(self) -> logging.Logger:
         """Set up logging for the client."""
@@ -90,6 +380,23 @@ class MCPClient:
             logger.addHandler(handler)
         return logger
         
+    async def _initialize_session(self, connect_start: float) -> None:
+        """Initialize the session, recording the connect and initialize phases."""
+        self.timings.add("connect", (time.perf_counter() - connect_start) * 1000)
+        with self.timings.phase("initialize"):
+            await self.session.initialize()
+        self.connected_at = time.perf_counter()
+        
+    def connection_timings(self, since: float) -> Timings:
+        """
+        Get the connect, initialize and discovery phases of this session if
+        it connected at or after since (a time.perf_counter() value), e.g.
+        while a request was waiting for it; otherwise an empty breakdown.
+        """
+        if self.connected_at is None or self.connected_at < since:
+            return Timings()
+        return Timings(self.timings.phases)
+        
     async def connect_stdio(self, command: str, args: List[str], env: Optional[Dict[str, str]] = None) -> None:
         """
         Connect to an MCP server using stdio transport.
@@ -106,6 +413,8 @@ class MCPClient:
         )
         
         self.logger.debug(f"Connecting to stdio server: {command} {' '.join(args)}")
+        self.server_key = self.config.server_key or _server_identity("stdio", command, *args)
+        connect_start = time.perf_counter()
         
         try:
             stdio_transport = await self.exit_stack.enter_async_context(
@@ -113,9 +422,9 @@ class MCPClient:
             )
             read_stream, write_stream = stdio_transport
             self.session = await self.exit_stack.enter_async_context(
-                ClientSession(read_stream, write_stream)
+                ClientSession(read_stream, write_stream, message_handler=self._handle_message)
             )
-            await self.session.initialize()
+            await self._initialize_session(connect_start)
             self.logger.info("Successfully connected via stdio")
             
         except Exception as e:
@@ -130,22 +439,117 @@ class MCPClient:
             url: The SSE endpoint URL
         """
         self.logger.debug(f"Connecting to SSE server: {url}")
+        self.server_key = self.config.server_key or _server_identity("sse", url)
+        connect_start = time.perf_counter()
         
         try:
             sse_transport = await self.exit_stack.enter_async_context(
-                sse_client(url)
+                sse_client(url, httpx_client_factory=self._create_http_client)
             )
             read_stream, write_stream = sse_transport
             self.session = await self.exit_stack.enter_async_context(
-                ClientSession(read_stream, write_stream)
+                ClientSession(read_stream, write_stream, message_handler=self._handle_message)
             )
-            await self.session.initialize()
+            await self._initialize_session(connect_start)
             self.logger.info("Successfully connected via SSE")
             
         except Exception as e:
             self.logger.error(f"Failed to connect via SSE: {e}")
             raise
             
+    async def connect_streamable_http(self, url: str, headers: Optional[Dict[str, str]] = None) -> None:
+        """
+        Connect to an MCP server using streamable HTTP transport.
+        
+        Requests go through a shared keep-alive connection pool, so sessions
+        to servers behind the same host reuse open connections.
+        
+        Args:
+            url: The streamable HTTP endpoint URL
+            headers: Optional HTTP headers to send with every request
+        """
+        self.logger.debug(f"Connecting to streamable HTTP server: {url}")
+        self.server_key = self.config.server_key or _server_identity("streamable_http", url)
+        connect_start = time.perf_counter()
+        
+        try:
+            http_transport = await self.exit_stack.enter_async_context(
+                streamablehttp_client(
+                    url,
+                    headers=headers,
+                    timeout=self.config.timeout,
+                    httpx_client_factory=self._create_http_client
+                )
+            )
+            read_stream, write_stream, _get_session_id = http_transport
+            self.session = await self.exit_stack.enter_async_context(
+                ClientSession(read_stream, write_stream, message_handler=self._handle_message)
+            )
+            await self._initialize_session(connect_start)
+            self.logger.info("Successfully connected via streamable HTTP")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to connect via streamable HTTP: {e}")
+            raise
+            
+    async def connect_inprocess(self, server_path: str) -> None:
+        """
+        Connect to a Python MCP server running inside this process.
+        
+        The server module is imported and served over in-memory streams,
+        which removes the subprocess and the stdio pipe serialization. The
+        server shares this process and event loop, so only use it for
+        trusted local servers.
+        
+        Args:
+            server_path: Path to a Python module defining a FastMCP server
+        """
+        self.logger.debug(f"Connecting to in-process server: {server_path}")
+        self.server_key = self.config.server_key or _server_identity("inprocess", str(Path(server_path).resolve()))
+        connect_start = time.perf_counter()
+        
+        try:
+            server = _load_inprocess_server(server_path)
+            client_streams, server_streams = await self.exit_stack.enter_async_context(
+                create_client_server_memory_streams()
+            )
+            task_group = await self.exit_stack.enter_async_context(anyio.create_task_group())
+            task_group.start_soon(partial(
+                server.run,
+                server_streams[0],
+                server_streams[1],
+                server.create_initialization_options(),
+                raise_exceptions=False
+            ))
+            # Stop the server before the task group is exited
+            self.exit_stack.callback(task_group.cancel_scope.cancel)
+            
+            read_stream, write_stream = client_streams
+            self.session = await self.exit_stack.enter_async_context(
+                ClientSession(read_stream, write_stream, message_handler=self._handle_message)
+            )
+            await self._initialize_session(connect_start)
+            self.logger.info("Successfully connected in-process")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to connect in-process: {e}")
+            raise
+            
+    def _create_http_client(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        auth: Optional[httpx.Auth] = None
+    ) -> httpx.AsyncClient:
+        """Create an httpx client backed by the shared connection pool."""
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout or httpx.Timeout(self.config.timeout),
+            auth=auth,
+            follow_redirects=True,
+            transport=_SharedHTTPTransport(get_shared_http_transport(self.config))
+        )
+        
     async def connect(self, 
                      server_path_or_url: Optional[str] = None,
                      transport: Optional[str] = None) -> None:
@@ -154,7 +558,7 @@ class MCPClient:
         
         Args:
             server_path_or_url: Path to server script or URL
-            transport: Transport type (stdio, sse, streamable_http)
+            transport: Transport type (stdio, sse, streamable_http, inprocess)
         """
         transport = transport or self.config.transport_type
         
@@ -162,7 +566,11 @@ class MCPClient:
             # Auto-detect transport type if not specified
             if transport == "auto":
                 if server_path_or_url.startswith(("http://", "https://")):
-                    transport = "sse"
+                    # MCP servers conventionally mount streamable HTTP at /mcp
+                    if urlparse(server_path_or_url).path.rstrip("/").endswith("/mcp"):
+                        transport = "streamable_http"
+                    else:
+                        transport = "sse"
                 else:
                     transport = "stdio"
                     
@@ -170,6 +578,10 @@ class MCPClient:
                 await self._connect_stdio_auto(server_path_or_url)
             elif transport == "sse":
                 await self.connect_sse(server_path_or_url)
+            elif transport == "streamable_http":
+                await self.connect_streamable_http(server_path_or_url)
+            elif transport == "inprocess":
+                await self.connect_inprocess(server_path_or_url)
             else:
                 raise ValueError(f"Unsupported transport type: {transport}")
         elif self.config.server_command:
@@ -181,6 +593,26 @@ class MCPClient:
         else:
             raise ValueError("No server specified. Provide server_path_or_url or configure server_command")
             
+    async def connect_server(self, server_config: Dict[str, Any]) -> None:
+        """
+        Connect using a stored server configuration.
+        
+        Args:
+            server_config: Dictionary with the MCPServer connection fields
+                (server_type, server_path, server_url, server_command,
+                server_args, server_env)
+        """
+        if server_config.get("server_url"):
+            await self.connect(server_config["server_url"], server_config.get("server_type"))
+        elif server_config.get("server_path"):
+            await self.connect(server_config["server_path"])
+        else:
+            await self.connect_stdio(
+                server_config["server_command"],
+                server_config.get("server_args") or [],
+                server_config.get("server_env") or {}
+            )
+            
     async def _connect_stdio_auto(self, server_path: str) -> None:
         """Auto-detect and connect to a stdio server based on file extension."""
         path = Path(server_path)
@@ -207,43 +639,186 @@ class MCPClient:
         args = [server_path] if server_path else []
         await self.connect_stdio(command, args)
         
-    async def discover_capabilities(self) -> None:
-        """Discover and cache server capabilities."""
+    async def discover_capabilities(self, refresh: bool = False) -> None:
+        """
+        Discover and cache server capabilities.
+        
+        Resources, tools and prompts are listed concurrently, and each
+        category follows pagination cursors until the server has returned
+        every page. Per-category latencies are stored in discovery_timings.
+        
+        Categories are served from the shared capability cache until their
+        TTL expires or the server sends the matching list_changed notification.
+        
+        Args:
+            refresh: Bypass the capability cache and list everything from the server
+        """
         if not self.session:
             raise RuntimeError("Not connected to any server")
             
         try:
-            # List resources
-            try:
-                resources_result = await self.session.list_resources()
-                self.available_resources = resources_result.resources
-                self.logger.debug(f"Found {len(self.available_resources)} resources")
-            except Exception as e:
-                self.logger.warning(f"Failed to list resources: {e}")
-                self.available_resources = []
-                
-            # List tools
-            try:
-                tools_result = await self.session.list_tools()
-                self.available_tools = tools_result.tools
-                self.logger.debug(f"Found {len(self.available_tools)} tools")
-            except Exception as e:
-                self.logger.warning(f"Failed to list tools: {e}")
-                self.available_tools = []
-                
-            # List prompts
-            try:
-                prompts_result = await self.session.list_prompts()
-                self.available_prompts = prompts_result.prompts
-                self.logger.debug(f"Found {len(self.available_prompts)} prompts")
-            except Exception as e:
-                self.logger.warning(f"Failed to list prompts: {e}")
-                self.available_prompts = []
+            start = time.perf_counter()
+            (resources, resources_ms, resources_fetched), (tools, tools_ms, tools_fetched), \
+                (prompts, prompts_ms, prompts_fetched) = await asyncio.gather(
+                    self._discover_category("resources", self.session.list_resources, refresh),
+                    self._discover_category("tools", self.session.list_tools, refresh),
+                    self._discover_category("prompts", self.session.list_prompts, refresh),
+                )
+            
+            self.available_resources = resources
+            self.available_tools = tools
+            self.available_prompts = prompts
+            self.tools_by_name = {tool.name: tool for tool in tools}
+            self.discovery_timings = {
+                "resources": resources_ms,
+                "tools": tools_ms,
+                "prompts": prompts_ms,
+                "total": round((time.perf_counter() - start) * 1000, 2),
+            }
+            self.timings.add("discovery", self.discovery_timings["total"])
+            self.logger.debug(f"Discovery timings (ms): {self.discovery_timings}")
+            
+            if (resources_fetched or tools_fetched or prompts_fetched) and self.on_capabilities_updated:
+                try:
+                    self.on_capabilities_updated(self.capabilities_snapshot())
+                except Exception as e:
+                    self.logger.warning(f"Failed to persist capabilities: {e}")
                 
         except Exception as e:
             self.logger.error(f"Failed to discover capabilities: {e}")
             raise
             
+    async def _discover_category(self, category: str, list_method, refresh: bool) -> Tuple[List[Any], float, bool]:
+        """
+        Get one capability category from the cache or the server.
+        
+        Returns:
+            The items, the elapsed time in milliseconds, and whether the
+            items were fetched from the server
+        """
+        cache = get_capability_cache()
+        if not refresh and self.server_key:
+            cached = cache.get(self.server_key, category, self.config.capability_cache_ttl)
+            if cached is not None:
+                self.stale_capabilities.discard(category)
+                return cached, 0.0, False
+                
+        start = time.perf_counter()
+        invalidations = self._invalidations
+        try:
+            items = await self._list_all(category, list_method)
+        except Exception as e:
+            self.logger.warning(f"Failed to list {category}: {e}")
+            return [], round((time.perf_counter() - start) * 1000, 2), False
+            
+        # Skip caching if the list changed while we were fetching it
+        if self.server_key and invalidations == self._invalidations:
+            cache.put(self.server_key, category, items)
+            self.stale_capabilities.discard(category)
+        return items, round((time.perf_counter() - start) * 1000, 2), True
+            
+    async def _list_all(self, category: str, list_method) -> List[Any]:
+        """
+        List every item of a capability category, following pagination cursors.
+        
+        Args:
+            category: Result attribute holding the items (resources, tools, prompts)
+            list_method: Session method that lists one page
+        """
+        items: List[Any] = []
+        seen_cursors = set()
+        cursor = None
+        
+        while True:
+            async with self.request_gate:
+                result = await (list_method(cursor) if cursor else list_method())
+            items.extend(getattr(result, category))
+            cursor = getattr(result, "nextCursor", None)
+            if not cursor or cursor in seen_cursors:
+                break
+            seen_cursors.add(cursor)
+        self.logger.debug(f"Found {len(items)} {category} in {len(seen_cursors) + 1} page(s)")
+        return items
+        
+    async def _handle_message(self, message) -> None:
+        """Handle notifications sent by the server."""
+        if not isinstance(message, ServerNotification):
+            return
+            
+        method = message.root.method
+        category = LIST_CHANGED_NOTIFICATIONS.get(method)
+        if category:
+            self.logger.debug(f"Server reported {category} list change")
+            self._invalidations += 1
+            self.stale_capabilities.add(category)
+            if self.server_key:
+                get_capability_cache().invalidate(self.server_key, category)
+                if category == "tools":
+                    get_result_cache().invalidate(self.server_key)
+                elif category == "resources":
+                    get_resource_catalogs().invalidate(self.server_key)
+            return
+            
+        if method == "notifications/resources/updated":
+            uri = str(message.root.params.uri)
+            if self.server_key and uri in self.subscriptions:
+                self.logger.debug(f"Server reported update of {uri}")
+                get_resource_mirror().invalidate(self.server_key, uri)
+                # Requests cannot be awaited from the session's receive loop
+                task = asyncio.create_task(self._refresh_mirrored(uri))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+                
+    def capabilities_snapshot(self) -> Dict[str, Any]:
+        """Get the current capabilities as a JSON snapshot for MCPServer.capabilities."""
+        fetched_at = None
+        if self.server_key:
+            fetched_at = get_capability_cache().fetched_at(self.server_key, "tools")
+        return capabilities_to_snapshot(
+            self.available_resources,
+            self.available_tools,
+            self.available_prompts,
+            fetched_at
+        )
+        
+    def load_capabilities_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Seed the capability cache from a stored snapshot.
+        
+        Must be called after connecting. Categories that are already cached,
+        or a snapshot older than the cache TTL, are ignored.
+        """
+        if not self.server_key or not snapshot:
+            return
+            
+        try:
+            parsed, fetched_at = capabilities_from_snapshot(snapshot)
+        except Exception as e:
+            self.logger.warning(f"Ignoring invalid capabilities snapshot: {e}")
+            return
+            
+        if fetched_at is None or time.time() - fetched_at > self.config.capability_cache_ttl:
+            return
+            
+        cache = get_capability_cache()
+        for category, items in parsed.items():
+            if cache.fetched_at(self.server_key, category) is None:
+                cache.put(self.server_key, category, items, fetched_at)
+
+    def restore_capabilities(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Set the capability lists from a stored snapshot without contacting the server.
+
+        Used to display or validate against capabilities saved by an
+        earlier process; unlike load_capabilities_snapshot this does not
+        need a connection and ignores the snapshot's age.
+        """
+        parsed, _ = capabilities_from_snapshot(snapshot)
+        self.available_resources = parsed["resources"]
+        self.available_tools = parsed["tools"]
+        self.available_prompts = parsed["prompts"]
+        self.tools_by_name = {tool.name: tool for tool in self.available_tools}
+
     def display_capabilities(self) -> None:
         """Display server capabilities in a formatted table."""
         self.console.print("\n[bold blue]🔍 Server Capabilities[/bold blue]")
@@ -302,36 +877,374 @@ class MCPClient:
         if not (self.available_resources or self.available_tools or self.available_prompts):
             self.console.print("[yellow]No capabilities found or server doesn't expose any.[/yellow]")
             
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> CallToolResult:
+    async def ping(self) -> None:
+        """Send a ping to the server to verify the session is alive."""
+        if not self.session:
+            raise RuntimeError("Not connected to any server")
+            
+        await self.session.send_ping()
+        
+    def is_tool_cacheable(self, tool_name: str) -> bool:
+        """
+        Whether results of a tool may be cached.
+        
+        A tool is cacheable if it is listed in cacheable_tools, or if the
+        server annotates it as both read-only and idempotent.
+        """
+        if tool_name in self.config.cacheable_tools:
+            return True
+        if not self.config.cache_annotated_tools:
+            return False
+        annotations = self._tool_annotations(tool_name)
+        return bool(annotations and annotations.readOnlyHint and annotations.idempotentHint)
+        
+    def is_tool_coalescable(self, tool_name: str) -> bool:
+        """
+        Whether identical concurrent calls to a tool may share one request.
+        
+        Unlike caching this only needs the tool to be read-only or
+        idempotent, since callers only share a call that is still in flight.
+        """
+        if tool_name in self.config.cacheable_tools:
+            return True
+        annotations = self._tool_annotations(tool_name)
+        return bool(annotations and (annotations.readOnlyHint or annotations.idempotentHint))
+        
+    def _tool_annotations(self, tool_name: str):
+        """
+        Get a tool's annotations.
+        
+        Pooled sessions do not run discovery themselves, so tools discovered
+        by any client of the same server are consulted as well.
+        """
+        tool = self.tools_by_name.get(tool_name)
+        if tool is None and self.server_key:
+            cached = get_capability_cache().get(self.server_key, "tools", self.config.capability_cache_ttl)
+            tool = next((t for t in cached or [] if t.name == tool_name), None)
+        return getattr(tool, "annotations", None) if tool else None
+        
+    async def _coalesced(self, key: Optional[tuple], request: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Run a request, joining an identical one already in flight when key is given."""
+        if key is None or self.server_key is None or not self.config.coalesce_requests:
+            return await request(), False
+        return await get_request_coalescer().do((self.server_key,) + key, request)
+        
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        use_cache: Optional[bool] = None,
+        stats: Optional[CallStats] = None,
+        timeout: Optional[float] = None
+    ) -> CallToolResult:
         """
         Call a tool on the server.
         
+        The call is bounded by the tool's deadline (see tool_deadline), and
+        by timeout when one is given.
+        
         Args:
             tool_name: Name of the tool to call
             arguments: Arguments to pass to the tool
+            use_cache: Force the result cache on or off; by default it is
+                used for cacheable tools
+            stats: Optional record that receives per-call details
+            timeout: Optional upper bound in seconds, e.g. the time left in
+                a caller's own budget
             
         Returns:
             The result of the tool call
+            
+        Raises:
+            TimeoutError: If the deadline expires before the server answers
+            CircuitOpenError: If the tool or server is failing and its
+                circuit is open
         """
         if not self.session:
             raise RuntimeError("Not connected to any server")
             
         self.logger.debug(f"Calling tool: {tool_name} with args: {arguments}")
         
+        cache = get_result_cache()
+        cacheable = self.server_key is not None and (
+            use_cache if use_cache is not None else self.is_tool_cacheable(tool_name)
+        )
+        if cacheable:
+            cached = cache.get(self.server_key, tool_name, arguments)
+            if stats is not None:
+                stats.cache_hit = cached is not None
+            if cached is not None:
+                self.logger.debug(f"Tool result cache hit: {tool_name}")
+                return cached
+        
+        # Set when this call's request() is the one actually sent, as opposed
+        # to joining an identical request already in flight
+        leader = False
+        
+        async def request() -> CallToolResult:
+            nonlocal leader
+            leader = True
+            hedge_delay = self._hedge_delay(tool_name)
+            if hedge_delay is None:
+                result = await self._send_tool_call(tool_name, arguments)
+            else:
+                result = await self._hedged_tool_call(tool_name, arguments, hedge_delay, stats)
+            if cacheable and not result.isError:
+                cache.put(self.server_key, tool_name, arguments, result, self.config.result_cache_ttl)
+            return result
+        
+        key = None
+        if self.is_tool_coalescable(tool_name):
+            key = ("tool", tool_name, canonical_arguments(arguments))
+        
+        limit = float(self.config.timeout) if timeout is None else min(float(self.config.timeout), timeout)
+        deadline = min(self.tool_deadline(tool_name), limit)
+        if stats is not None:
+            stats.deadline = deadline
+        
+        breakers = get_circuit_breakers() if self.config.circuit_breaker and self.server_key else None
+        if breakers is not None:
+            breakers.check(
+                self.server_key,
+                tool_name,
+                self.config.circuit_failure_threshold,
+                self.config.circuit_reset_timeout
+            )
+        
+        outcome: Optional[bool] = None
+        server_failure = True
+        request_start = time.perf_counter()
         try:
-            result = await self.session.call_tool(tool_name, arguments)
+            if deadline <= 0:
+                raise asyncio.TimeoutError()
+            result, shared = await asyncio.wait_for(self._coalesced(key, request), deadline)
+            outcome = True
+            if stats is not None:
+                stats.coalesced = shared
             self.logger.debug(f"Tool call result: {result}")
             return result
+        except asyncio.TimeoutError:
+            if deadline > 0:
+                outcome = False
+                # A learned deadline can be missed by one slow but valid call,
+                # which says nothing about the health of the server
+                server_failure = deadline >= limit
+                if self.server_key:
+                    # Count the expiry as a sample so deadlines grow with a slowing tool
+                    get_latency_tracker().record(self.server_key, tool_name, deadline * 1000)
+            self.logger.error(f"Tool call timed out: {tool_name} after {deadline:.2f}s")
+            raise TimeoutError(f"Tool '{tool_name}' did not respond within {deadline:.2f}s") from None
+        except McpError as e:
+            # An error response means the server itself is still answering,
+            # and one caused by the request says nothing about the tool
+            outcome = e.error.code in CLIENT_ERROR_CODES
+            server_failure = False
+            self.logger.error(f"Tool call failed: {e}")
+            raise
         except Exception as e:
+            outcome = False
             self.logger.error(f"Tool call failed: {e}")
             raise
+        finally:
+            if stats is not None:
+                stats.timings.add("request", (time.perf_counter() - request_start) * 1000)
+            if breakers is not None:
+                # One upstream request is one outcome: coalesced followers only give back their slot
+                breakers.record(self.server_key, tool_name, outcome if leader else None, server_failure)
+            
+    def is_tool_available(self, tool_name: str) -> bool:
+        """Whether calls to a tool are currently let through by its circuit breakers."""
+        if not self.config.circuit_breaker or not self.server_key:
+            return True
+        return not get_circuit_breakers().is_open(self.server_key, tool_name)
+            
+    async def call_tools_batch(
+        self,
+        calls: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None
+    ) -> List[BatchToolResult]:
+        """
+        Run many tool calls over this session and return results in call order.
+        
+        See iter_tools_batch; a failed call is reported in its result rather
+        than raised.
+        """
+        results = [result async for result in self.iter_tools_batch(calls, concurrency, timeout)]
+        results.sort(key=lambda result: result.index)
+        return results
+            
+    async def iter_tools_batch(
+        self,
+        calls: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[BatchToolResult]:
+        """
+        Run many tool calls over this session, yielding results as they complete.
+        
+        Calls are pipelined over the one session with at most concurrency in
+        flight, and are read from calls only as slots free up, so a long or
+        lazily produced batch is never held in memory at once.
+        
+        Args:
+            calls: Tool calls with 'name' and optional 'arguments'
+            concurrency: Maximum calls in flight
+            timeout: Optional limit in seconds for each call
+        """
+        async def run(indexed_call: Tuple[int, Dict[str, Any]]) -> BatchToolResult:
+            index, call = indexed_call
+            outcome = BatchToolResult(index, call.get("name", ""), call.get("arguments") or {})
+            start = time.perf_counter()
+            try:
+                outcome.result = await self.call_tool(
+                    outcome.tool_name, outcome.arguments, stats=outcome.stats, timeout=timeout
+                )
+            except Exception as e:
+                outcome.error = e
+            outcome.execution_time_ms = int((time.perf_counter() - start) * 1000)
+            return outcome
+        
+        async for outcome in iter_bounded(enumerate(calls), run, concurrency):
+            yield outcome
+            
+    def tool_deadline(self, tool_name: str) -> float:
+        """
+        Seconds a call to a tool may take.
+        
+        With adaptive timeouts this is tool_timeout_multiplier times the
+        tool's observed latency percentile, clamped between tool_timeout_min
+        and the configured timeout.
+        """
+        limit = float(self.config.timeout)
+        if not self.config.adaptive_timeouts or not self.server_key:
+            return limit
+        latency_ms = get_latency_tracker().percentile(
+            self.server_key,
+            tool_name,
+            self.config.tool_timeout_percentile,
+            self.config.tool_timeout_min_samples
+        )
+        if latency_ms is None:
+            return limit
+        adaptive = latency_ms / 1000 * self.config.tool_timeout_multiplier
+        return min(limit, max(self.config.tool_timeout_min, adaptive))
+            
+    async def _send_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """
+        Send tools/call on this session and record its latency.
+        
+        If the caller is cancelled while waiting and send_cancellation is
+        set, the server is sent notifications/cancelled so it can stop
+        working on the request.
+        """
+        async with self.request_gate:
+            # The session assigns this id synchronously when the request starts.
+            # The SDK has no public accessor for it, so cancellation is skipped
+            # on a version without the private counter
+            request_id = getattr(self.session, "_request_id", None)
+            start = time.perf_counter()
+            try:
+                result = await self.session.call_tool(tool_name, arguments)
+            except asyncio.CancelledError:
+                if self.config.send_cancellation and isinstance(request_id, int):
+                    self._notify_cancelled(request_id, f"Client cancelled {tool_name}")
+                raise
+        if self.server_key:
+            get_latency_tracker().record(self.server_key, tool_name, (time.perf_counter() - start) * 1000)
+        return result
+        
+    def _notify_cancelled(self, request_id: int, reason: str) -> None:
+        """Tell the server, in the background, to stop working on a request."""
+        notification = ClientNotification(CancelledNotification(
+            method="notifications/cancelled",
+            params=CancelledNotificationParams(requestId=request_id, reason=reason)
+        ))
+        
+        async def send() -> None:
+            try:
+                await self.session.send_notification(notification)
+            except Exception as e:
+                self.logger.debug(f"Failed to send cancellation for request {request_id}: {e}")
+        
+        task = asyncio.create_task(send())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        
+    def is_tool_idempotent(self, tool_name: str) -> bool:
+        """Whether a tool is declared idempotent, so it may be safely sent twice."""
+        if tool_name in self.config.cacheable_tools:
+            return True
+        annotations = self._tool_annotations(tool_name)
+        return bool(annotations and annotations.idempotentHint)
+        
+    def _hedge_delay(self, tool_name: str) -> Optional[float]:
+        """Seconds to wait before hedging a call, or None if it should not be hedged."""
+        if not self.config.hedge_requests or self.hedge_source is None or not self.server_key:
+            return None
+        if not self.is_tool_idempotent(tool_name):
+            return None
+        latency_ms = get_latency_tracker().percentile(
+            self.server_key, tool_name, self.config.hedge_percentile, self.config.hedge_min_samples
+        )
+        return latency_ms / 1000 if latency_ms is not None else None
+        
+    async def _hedged_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        delay: float,
+        stats: Optional[CallStats]
+    ) -> CallToolResult:
+        """
+        Call a tool, sending a duplicate to another session if it is slow.
+        
+        Whichever request succeeds first wins and the other is cancelled.
+        """
+        primary = asyncio.ensure_future(self._send_tool_call(tool_name, arguments))
+        backup = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+            
+            async with AsyncExitStack() as stack:
+                try:
+                    other = await stack.enter_async_context(self.hedge_source())
+                except Exception as e:
+                    self.logger.debug(f"No session available to hedge {tool_name}: {e}")
+                    return await primary
+                
+                self.logger.debug(f"Hedging {tool_name} after {delay * 1000:.0f} ms")
+                backup = asyncio.ensure_future(other._send_tool_call(tool_name, arguments))
+                if stats is not None:
+                    stats.hedged = True
+                
+                pending = {primary, backup}
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            if stats is not None:
+                                stats.hedge_won = task is backup
+                            for loser in pending:
+                                loser.cancel()
+                            await asyncio.gather(*pending, return_exceptions=True)
+                            return task.result()
+                # Both failed; report the original request's error
+                return primary.result()
+        finally:
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
             
-    async def read_resource(self, uri: str) -> ReadResourceResult:
+    async def read_resource(self, uri: str, timings: Optional[Timings] = None) -> ReadResourceResult:
         """
         Read a resource from the server.
         
         Args:
             uri: URI of the resource to read
+            timings: Optional breakdown that receives the request phase
             
         Returns:
             The resource content and metadata
@@ -341,21 +1254,143 @@ class MCPClient:
             
         self.logger.debug(f"Reading resource: {uri}")
         
+        mirror = get_resource_mirror()
+        mirrored = self.server_key is not None and mirror.is_subscribed(self.server_key, str(uri))
+        if mirrored:
+            cached = mirror.get(self.server_key, str(uri))
+            if cached is not None:
+                self.logger.debug(f"Resource served from mirror: {uri}")
+                return cached
+            generation = mirror.generation(self.server_key, str(uri))
+        
+        async def request() -> ReadResourceResult:
+            async with self.request_gate:
+                return await self.session.read_resource(uri)
+        
         try:
-            result = await self.session.read_resource(uri)
+            with timings.phase("request") if timings is not None else nullcontext():
+                result, shared = await self._coalesced(("resource", str(uri)), request)
+            # A shared read may have started before the last update
+            if mirrored and not shared:
+                mirror.put(self.server_key, str(uri), result, generation)
             self.logger.debug(f"Resource read result: {result}")
             return result
         except Exception as e:
             self.logger.error(f"Resource read failed: {e}")
             raise
             
-    async def get_prompt(self, prompt_name: str, arguments: Optional[Dict[str, str]] = None) -> GetPromptResult:
+    def resource_catalog(self) -> ResourceCatalog:
+        """
+        Get the shared resource catalog for the connected server.
+        
+        If resources were already discovered the catalog is seeded from
+        them; otherwise it is filled lazily by find_resources.
+        """
+        if not self.server_key:
+            raise RuntimeError("Not connected to any server")
+        catalog = get_resource_catalogs().get(self.server_key)
+        if not len(catalog) and self.available_resources and "resources" not in self.stale_capabilities:
+            catalog.seed(self.available_resources)
+        return catalog
+        
+    async def _fetch_resource_page(self, cursor: Optional[str]) -> Tuple[List[Resource], Optional[str]]:
+        """Fetch one page of resources for the catalog."""
+        async with self.request_gate:
+            result = await (self.session.list_resources(cursor) if cursor else self.session.list_resources())
+        return result.resources, result.nextCursor
+        
+    async def find_resources(self, prefix: str = "", limit: Optional[int] = None) -> List[Resource]:
+        """
+        Find resources whose URI starts with a prefix.
+        
+        Pages of list_resources are fetched only until the catalog can
+        answer, after which lookups are served from the index.
+        
+        Args:
+            prefix: URI prefix; an empty prefix matches every resource
+            limit: Maximum number of results
+            
+        Returns:
+            Matching resources in URI order
+        """
+        if not self.session:
+            raise RuntimeError("Not connected to any server")
+        return await self.resource_catalog().search(prefix, self._fetch_resource_page, limit)
+        
+    async def match_resource_template(self, uri: str) -> Optional[Tuple[ResourceTemplate, Dict[str, str]]]:
+        """
+        Find the resource template a URI expands from.
+        
+        Returns:
+            The template and its extracted variables, or None if none matches
+        """
+        if not self.session:
+            raise RuntimeError("Not connected to any server")
+        catalog = self.resource_catalog()
+        if not catalog.templates_loaded:
+            templates = await self._list_all("resourceTemplates", self.session.list_resource_templates)
+            catalog.set_templates(templates)
+        return catalog.match_template(uri)
+        
+    async def subscribe_resource(self, uri: str) -> None:
+        """
+        Subscribe to a resource and mirror its contents locally.
+        
+        Subsequent reads of the resource through any client connected to
+        the same server are served from the mirror, which is refreshed when
+        the server sends notifications/resources/updated.
+        
+        Args:
+            uri: URI of the resource to subscribe to
+        """
+        if not self.session:
+            raise RuntimeError("Not connected to any server")
+        if uri in self.subscriptions:
+            return
+            
+        async with self.request_gate:
+            await self.session.subscribe_resource(uri)
+        self.subscriptions.add(uri)
+        get_resource_mirror().subscribe(self.server_key, uri)
+        self.logger.debug(f"Subscribed to resource: {uri}")
+        await self._refresh_mirrored(uri)
+        
+    async def unsubscribe_resource(self, uri: str) -> None:
+        """Unsubscribe from a resource and drop it from the mirror."""
+        if uri not in self.subscriptions:
+            return
+        self.subscriptions.discard(uri)
+        get_resource_mirror().unsubscribe(self.server_key, uri)
+        if self.session:
+            async with self.request_gate:
+                await self.session.unsubscribe_resource(uri)
+        self.logger.debug(f"Unsubscribed from resource: {uri}")
+        
+    async def _refresh_mirrored(self, uri: str) -> None:
+        """Re-read a subscribed resource into the mirror."""
+        mirror = get_resource_mirror()
+        generation = mirror.generation(self.server_key, uri)
+        try:
+            # Bypass coalescing so a read started before the update is not reused
+            async with self.request_gate:
+                result = await self.session.read_resource(uri)
+            mirror.put(self.server_key, uri, result, generation)
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh mirrored resource {uri}: {e}")
+            
+    async def get_prompt(
+        self,
+        prompt_name: str,
+        arguments: Optional[Dict[str, str]] = None,
+        timings: Optional[Timings] = None
+    ) -> GetPromptResult:
         """
         Get a prompt from the server.
         
         Args:
             prompt_name: Name of the prompt to get
             arguments: Arguments to pass to the prompt
+            timings: Optional breakdown that receives the request phase
             
         Returns:
             The prompt result
@@ -365,8 +1400,13 @@ class MCPClient:
             
         self.logger.debug(f"Getting prompt: {prompt_name} with args: {arguments}")
         
+        async def request() -> GetPromptResult:
+            async with self.request_gate:
+                return await self.session.get_prompt(prompt_name, arguments or {})
+        
         try:
-            result = await self.session.get_prompt(prompt_name, arguments or {})
+            with timings.phase("request") if timings is not None else nullcontext():
+                result, _ = await self._coalesced(("prompt", prompt_name, canonical_arguments(arguments)), request)
             self.logger.debug(f"Prompt result: {result}")
             return result
         except Exception as e:
@@ -483,8 +1523,8 @@ class MCPClient:
                 for content_item in result.content:
                     if hasattr(content_item, 'text'):
                         self.console.print(Panel(content_item.text, title="Result"))
-                    elif hasattr(content_item, 'data'):
-                        self.console.print(Panel(str(content_item.data), title="Data"))
+                    elif (binary := describe_binary(content_item)) is not None:
+                        self.console.print(Panel(f"Binary data ({binary['size']} bytes)", title=f"Data ({binary['mimeType']})"))
             else:
                 self.console.print(Panel(str(result), title="Result"))
                 
@@ -514,8 +1554,8 @@ class MCPClient:
                             self.console.print(Panel(syntax, title=f"Content ({getattr(content_item, 'mimeType', 'text')})"))
                         else:
                             self.console.print(Panel(content_item.text, title=f"Content ({getattr(content_item, 'mimeType', 'text')})"))
-                    elif hasattr(content_item, 'data'):
-                        self.console.print(Panel(f"Binary data ({len(content_item.data)} bytes)", title="Binary Content"))
+                    elif (binary := describe_binary(content_item)) is not None:
+                        self.console.print(Panel(f"Binary data ({binary['size']} bytes)", title="Binary Content"))
             else:
                 self.console.print(Panel(str(result), title="Result"))
                 
@@ -568,6 +1608,12 @@ class MCPClient:
             
     async def close(self) -> None:
         """Close the client and clean up resources."""
+        for task in list(self._background_tasks):
+            task.cancel()
+        mirror = get_resource_mirror()
+        for uri in self.subscriptions:
+            mirror.unsubscribe(self.server_key, uri)
+        self.subscriptions.clear()
         await self.exit_stack.aclose()
         self.logger.info("MCP Client closed")
         
@@ -0,0 +1,216 @@
+"""
+Concurrency control for MCP sessions.
+
+This module provides the request gate that bounds how many JSON-RPC
+requests are in flight on one session at a time, single-flight
+coalescing of identical concurrent requests, and bounded concurrent
+processing of a stream of work items.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Hashable, Iterable, Tuple, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RequestGate:
+    """
+    FIFO-fair limiter for in-flight requests on a single session.
+
+    When the limit is reached, callers queue in arrival order and a released
+    slot is handed directly to the oldest waiter, so late arrivals cannot
+    overtake requests that are already queued.
+    """
+
+    def __init__(self, limit: int = 0):
+        """
+        Initialize the gate.
+
+        Args:
+            limit: Maximum concurrent requests (0 means unlimited)
+        """
+        self.limit = limit
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # Metrics
+        self.total_requests = 0
+        self.total_queued = 0
+        self.max_in_flight = 0
+        self.max_queue_depth = 0
+        self.total_wait_ms = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    async def __aenter__(self):
+        self.total_requests += 1
+
+        if not self._waiters and (self.limit <= 0 or self.in_flight < self.limit):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return self
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.total_queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        start = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.done() or waiter.cancelled():
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            else:
+                # A slot was handed over just before cancellation; pass it on
+                self._release()
+            raise
+        finally:
+            self.total_wait_ms += (time.perf_counter() - start) * 1000
+
+        # The releasing request handed its slot over without decrementing in_flight
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._release()
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get gate metrics."""
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_in_flight": self.max_in_flight,
+            "max_queue_depth": self.max_queue_depth,
+            "total_requests": self.total_requests,
+            "total_queued": self.total_queued,
+            "avg_wait_ms": round(self.total_wait_ms / self.total_queued, 2) if self.total_queued else 0.0
+        }
+
+
+async def iter_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: int
+) -> AsyncIterator[R]:
+    """
+    Run worker over items with at most concurrency in flight, yielding
+    results as they complete.
+
+    Items are pulled from the iterable only as slots free up, so a long or
+    lazily produced input is never held in memory at once. Workers still
+    running when the consumer stops iterating are cancelled.
+    """
+    pending: set = set()
+    queued = iter(items)
+    try:
+        while True:
+            for item in queued:
+                pending.add(asyncio.ensure_future(worker(item)))
+                if len(pending) >= max(1, concurrency):
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical requests onto one in-flight task.
+
+    The first caller for a key starts the request; callers arriving while it
+    is still running await the same task instead of sending a duplicate.
+    The key is forgotten as soon as the request completes, so this never
+    serves stale results the way a cache would.
+
+    The shared task is cancelled once every caller waiting on it has been
+    cancelled (e.g. by its deadline), so an abandoned request does not keep
+    running, and holding its session's request gate slot, with no one to
+    receive the result.
+    """
+
+    def __init__(self):
+        """Initialize with no requests in flight."""
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self.total_calls = 0
+        self.total_coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run func for key, or join the identical request already in flight.
+
+        A caller that is cancelled does not cancel the shared request while
+        other callers are still waiting on it; the last one to leave does.
+
+        Returns:
+            The result and whether it was shared with an earlier caller
+        """
+        self.total_calls += 1
+        task = self._calls.get(key)
+        shared = task is not None
+        if shared:
+            self.total_coalesced += 1
+        else:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task), shared
+        finally:
+            self._leave(key, task)
+
+    def _leave(self, key: Hashable, task: asyncio.Task) -> None:
+        remaining = self._waiters.pop(task) - 1
+        if remaining:
+            self._waiters[task] = remaining
+        elif not task.done():
+            # Nobody is left to receive the result; new callers start afresh
+            if self._calls.get(key) is task:
+                del self._calls[key]
+            task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved when every caller has gone away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing metrics."""
+        return {
+            "in_flight": len(self._calls),
+            "total_calls": self.total_calls,
+            "total_coalesced": self.total_coalesced
+        }
+
+
+# Global coalescer shared by all clients, keyed by server identity
+request_coalescer = SingleFlight()
+
+
+def get_request_coalescer() -> SingleFlight:
+    """Get the global request coalescer."""
+    return request_coalescer
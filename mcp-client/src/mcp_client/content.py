@@ -0,0 +1,203 @@
+"""
+Resource content handling for MCP Client.
+
+This module spools resource contents into temporary files so that large
+blob resources can be decoded and streamed back in chunks instead of being
+held in memory as one decoded bytes object. Smaller binary content is
+decoded once into a single buffer that is shared by reference, and
+binary payloads are otherwise described by size without being decoded.
+"""
+
+import base64
+import tempfile
+from typing import Any, Dict, Iterator, Optional, Union
+
+from mcp.types import AudioContent, BlobResourceContents, ImageContent, TextResourceContents
+
+
+# Contents up to this size stay in memory; larger ones roll over to disk
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+# Base64 characters decoded per step
+DECODE_CHUNK_CHARS = 4 * 256 * 1024
+
+# Bytes per chunk when streaming spooled content back
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+def base64_decoded_size(data: str) -> int:
+    """Size of base64 data once decoded, without decoding it."""
+    # Line breaks and spaces (as in MIME-wrapped data) carry no bytes
+    length = len(data) - sum(data.count(c) for c in " \t\r\n")
+    if length == 0:
+        return 0
+    data = data.rstrip()
+    padding = 2 if data.endswith("==") else 1 if data.endswith("=") else 0
+    return (length * 3) // 4 - padding
+
+
+def iter_base64_decoded(data: str, chunk_chars: int = DECODE_CHUNK_CHARS) -> Iterator[bytes]:
+    """
+    Decode base64 data a slice at a time.
+
+    Whitespace is dropped from each slice and only whole 4-character
+    groups of what remains are decoded, carrying the rest over to the next
+    slice, so line-wrapped data never splits a group.
+    """
+    pending = ""
+    for start in range(0, len(data), chunk_chars):
+        pending += "".join(data[start:start + chunk_chars].split())
+        whole = len(pending) - len(pending) % 4
+        if whole:
+            yield base64.b64decode(pending[:whole])
+            pending = pending[whole:]
+    if pending:
+        # Raises for a truncated final group, as decoding it whole would
+        yield base64.b64decode(pending)
+
+
+def binary_payload(content: Any) -> Optional[str]:
+    """Base64 payload of an image, audio or blob content item, or None for other content."""
+    if isinstance(content, BlobResourceContents):
+        return content.blob
+    if isinstance(content, (ImageContent, AudioContent)):
+        return content.data
+    return None
+
+
+def describe_binary(content: Any, include_data: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    JSON description of a binary content item, without decoding it.
+
+    Args:
+        content: Tool or resource content item
+        include_data: Also embed the base64 payload, passed through as received
+
+    Returns:
+        Type, MIME type and decoded size, or None if the item is not binary
+    """
+    data = binary_payload(content)
+    if data is None:
+        return None
+    description = {
+        "type": "binary" if isinstance(content, BlobResourceContents) else content.type,
+        "mimeType": content.mimeType or "application/octet-stream",
+        "size": base64_decoded_size(data)
+    }
+    if include_data:
+        description["data"] = data
+    return description
+
+
+class BinaryContent:
+    """
+    Decoded binary content held in one buffer.
+
+    The bytes are exposed as a read-only memoryview, so consumers slice and
+    stream them by reference instead of copying.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview], mime_type: Optional[str] = None):
+        """
+        Wrap decoded bytes.
+
+        Args:
+            data: Decoded content; it is not copied
+            mime_type: MIME type of the content
+        """
+        self.view = memoryview(data).toreadonly()
+        self.mime_type = mime_type or "application/octet-stream"
+
+    @classmethod
+    def from_content(cls, content: Any) -> "BinaryContent":
+        """
+        Decode an image, audio or blob content item.
+
+        Raises:
+            ValueError: If the item has no binary payload
+        """
+        data = binary_payload(content)
+        if data is None:
+            raise ValueError("Content item is not binary")
+        return cls(base64.b64decode(data), content.mimeType)
+
+    @property
+    def size(self) -> int:
+        """Size in bytes."""
+        return self.view.nbytes
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[memoryview]:
+        """Yield the content as memoryview slices of the shared buffer."""
+        for start in range(0, self.size, chunk_size):
+            yield self.view[start:start + chunk_size]
+
+
+class SpooledContent:
+    """
+    One resource content item spooled into a temporary file.
+
+    The file is kept in memory up to max_memory bytes and transparently
+    moved to disk beyond that.
+    """
+
+    def __init__(self, mime_type: Optional[str], max_memory: int = SPOOL_MAX_MEMORY):
+        """
+        Initialize an empty spool.
+
+        Args:
+            mime_type: MIME type of the content
+            max_memory: Size in bytes above which the spool moves to disk
+        """
+        self.mime_type = mime_type
+        self.size = 0
+        self.file = tempfile.SpooledTemporaryFile(max_size=max_memory)
+
+    def write(self, data: bytes) -> None:
+        """Append decoded bytes."""
+        self.file.write(data)
+        self.size += len(data)
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the spooled bytes in chunks, closing the spool when done."""
+        try:
+            self.file.seek(0)
+            while True:
+                chunk = self.file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the spool and any temporary file behind it."""
+        self.file.close()
+
+
+def spool_resource_content(
+    content: Union[TextResourceContents, BlobResourceContents],
+    max_memory: int = SPOOL_MAX_MEMORY
+) -> SpooledContent:
+    """
+    Decode a resource content item into a spool.
+
+    Blob content is base64-decoded a slice at a time, so peak memory is the
+    encoded string plus one decoded chunk rather than a full decoded copy.
+
+    Args:
+        content: Text or blob resource content
+        max_memory: Size in bytes above which the spool moves to disk
+
+    Returns:
+        The spooled content
+    """
+    if isinstance(content, BlobResourceContents):
+        spooled = SpooledContent(content.mimeType or "application/octet-stream", max_memory)
+        for chunk in iter_base64_decoded(content.blob, DECODE_CHUNK_CHARS):
+            spooled.write(chunk)
+    else:
+        spooled = SpooledContent(content.mimeType or "text/plain", max_memory)
+        text = content.text
+        for start in range(0, len(text), DECODE_CHUNK_CHARS):
+            spooled.write(text[start:start + DECODE_CHUNK_CHARS].encode("utf-8"))
+    return spooled
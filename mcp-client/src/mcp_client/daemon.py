@@ -0,0 +1,189 @@
+"""
+Background daemon that keeps MCP server sessions warm for the CLI.
+
+The daemon listens on a local Unix socket and serves newline-delimited
+JSON requests from CLI invocations, sent through daemon_client. Sessions
+are held in session pools (one per server and connection settings), so
+after the first call a command skips the server spawn, initialize
+handshake and capability discovery and only pays for the request itself.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .client import CallStats, aclose_shared_http_transports
+from .daemon_client import MESSAGE_LIMIT, daemon_request, default_socket_path, ensure_socket_dir
+from .pool import SessionPoolConfig, SessionPoolManager, config_hash
+from .timing import acquire_timings
+
+
+logger = logging.getLogger("mcp_client.daemon")
+
+
+def server_config_for(server: str, transport: str, client_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a pool server configuration for a CLI server path or URL."""
+    config: Dict[str, Any] = {"server_type": transport, "client_options": client_options or {}}
+    if server.startswith(("http://", "https://")):
+        config["server_url"] = server
+    else:
+        config["server_path"] = server
+    return config
+
+
+class CLIDaemon:
+    """Serves CLI requests over a Unix socket from pooled, warm sessions."""
+
+    def __init__(self, socket_path: Optional[Path] = None, pool_config: Optional[SessionPoolConfig] = None):
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Unix socket to listen on
+            pool_config: Pool settings; by default one session per server is kept open
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.pool_manager = SessionPoolManager(pool_config or SessionPoolConfig(min_size=1))
+        self.server_ids: Dict[str, int] = {}  # config hash -> synthetic pool server id
+        self.servers: Dict[int, str] = {}
+        self.requests = 0
+        self.started_at = time.time()
+        self._stopped = asyncio.Event()
+
+    async def serve(self) -> None:
+        """Listen until a stop request arrives, then close every session."""
+        if self.socket_path == default_socket_path():
+            ensure_socket_dir(self.socket_path)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        server = await asyncio.start_unix_server(self._handle_connection, str(self.socket_path), limit=MESSAGE_LIMIT)
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"Listening on {self.socket_path}")
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            await self.pool_manager.close_all()
+            await aclose_shared_http_transports()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self.dispatch(json.loads(line))
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one request: status, stop, list, tool, resource or prompt."""
+        op = request.get("op")
+        if op == "status":
+            return {"ok": True, "result": self.status()}
+        if op == "stop":
+            self._stopped.set()
+            return {"ok": True}
+
+        self.requests += 1
+        server = request["server"]
+        server_config = server_config_for(server, request.get("transport", "auto"), request.get("client_options"))
+        server_id = self.server_ids.setdefault(config_hash(server_config), len(self.server_ids) + 1)
+        self.servers[server_id] = server
+
+        acquire_start = time.perf_counter()
+        async with self.pool_manager.acquire(server_id, server_config) as client:
+            timings = acquire_timings(client, acquire_start)
+            if op == "list":
+                with timings.phase("discovery"):
+                    await client.discover_capabilities()
+                return {"ok": True, "result": client.capabilities_snapshot(), "timings": timings.to_dict()}
+            if op == "tool":
+                stats = CallStats()
+                result = await client.call_tool(request["name"], request.get("arguments") or {}, stats=stats)
+                timings.merge(stats.timings)
+            elif op == "resource":
+                result = await client.read_resource(request["uri"], timings=timings)
+            elif op == "prompt":
+                result = await client.get_prompt(request["name"], request.get("arguments") or {}, timings=timings)
+            else:
+                raise ValueError(f"Unknown operation: {op}")
+        return {
+            "ok": True,
+            "result": result.model_dump(mode="json", by_alias=True, exclude_none=True),
+            "timings": timings.to_dict()
+        }
+
+    def status(self) -> Dict[str, Any]:
+        """Get daemon status and its pools."""
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "requests": self.requests,
+            "servers": self.servers,
+            "pools": self.pool_manager.stats()
+        }
+
+
+async def start_daemon(socket_path: Optional[Path] = None, wait: float = 10.0) -> Dict[str, Any]:
+    """
+    Start the daemon as a detached background process.
+
+    Returns:
+        The new daemon's status
+
+    Raises:
+        RuntimeError: If a daemon is already running or it fails to come up
+    """
+    path = socket_path or default_socket_path()
+    existing = await daemon_request({"op": "status"}, path, timeout=wait)
+    if existing is not None:
+        raise RuntimeError(f"Daemon already running (pid {existing['result']['pid']})")
+
+    if path == default_socket_path():
+        ensure_socket_dir(path)
+    log_path = path.with_suffix(".log")
+    env = dict(os.environ, MCP_CLIENT_DAEMON_SOCKET=str(path))
+    # Make the package importable for the child however this process found it
+    package_root = str(Path(__file__).resolve().parents[2])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", __name__],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            env=env,
+            start_new_session=True
+        )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+        reply = await daemon_request({"op": "status"}, path, timeout=wait)
+        if reply is not None:
+            return reply["result"]
+    raise RuntimeError(f"Daemon did not start; see {log_path}")
+
+
+def main() -> None:
+    """Run the daemon in the foreground."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    asyncio.run(CLIDaemon().serve())
+
+
+if __name__ == "__main__":
+    main()
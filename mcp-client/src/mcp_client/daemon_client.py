@@ -0,0 +1,89 @@
+"""
+Client side of the CLI daemon protocol.
+
+CLI commands talk to a running daemon through this module. It only uses
+the standard library, so a command answered by the daemon never imports
+the MCP SDK; see daemon.py for the daemon itself.
+"""
+
+import asyncio
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Largest request or response line accepted on the socket
+MESSAGE_LIMIT = 64 * 1024 * 1024
+
+
+def default_socket_path() -> Path:
+    """
+    Socket path from MCP_CLIENT_DAEMON_SOCKET, or daemon.sock in a private
+    per-user directory under the runtime (or temp) directory.
+    """
+    configured = os.getenv("MCP_CLIENT_DAEMON_SOCKET")
+    if configured:
+        return Path(configured)
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"mcp-client-{os.getuid()}" / "daemon.sock"
+
+
+def ensure_socket_dir(socket_path: Path) -> None:
+    """
+    Create the directory holding the socket, readable only by this user.
+
+    Raises:
+        PermissionError: If the directory exists but belongs to another
+            user or is accessible to others, so that a socket in it could
+            have been planted
+    """
+    directory = socket_path.parent
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"Refusing to use {directory}: it must be a directory private to the current user")
+
+
+def check_socket_owner(socket_path: Path) -> None:
+    """
+    Raises:
+        PermissionError: If the socket is not a socket owned by this user
+    """
+    info = os.stat(socket_path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"Refusing to use {socket_path}: it is not a socket owned by the current user")
+
+
+async def daemon_request(
+    request: Dict[str, Any],
+    socket_path: Optional[Path] = None,
+    timeout: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to a running daemon.
+
+    Returns:
+        The daemon's reply, or None if no daemon is listening
+
+    Raises:
+        PermissionError: If the socket belongs to another user
+    """
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+    # Another user's socket could capture the arguments and forge results
+    check_socket_owner(path)
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(path), limit=MESSAGE_LIMIT)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return None
+    try:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        return json.loads(line) if line else None
+    finally:
+        writer.close()
@@ -5,7 +5,13 @@ This module provides database models and operations for storing
 MCP server configurations, query history, and user data.
 """
 
-from .models import MCPServer, QueryHistory, User
-from .database import Database
+from ..lazy import lazy_exports
 
-__all__ = ["MCPServer", "QueryHistory", "User", "Database"] 
\ No newline at end of file
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "MCPServer": ".models",
+    "QueryHistory": ".models",
+    "User": ".models",
+    "Database": ".database",
+})
+
+__all__ = ["MCPServer", "QueryHistory", "User", "Database"]
@@ -6,8 +6,9 @@ for the MCP client application.
 """
 
 import os
+from datetime import datetime
 from typing import Generator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
 
@@ -41,6 +42,20 @@ class Database:
     def create_tables(self):
         """Create all database tables."""
         Base.metadata.create_all(bind=self.engine)
+        self._add_missing_columns()
+    
+    def _add_missing_columns(self):
+        """Add nullable columns introduced after a table was created."""
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                existing = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing and column.nullable:
+                        column_type = column.type.compile(dialect=self.engine.dialect)
+                        connection.execute(text(
+                            f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                        ))
     
     def drop_tables(self):
         """Drop all database tables."""
@@ -105,9 +120,9 @@ class Database:
             # Ensure all attributes are loaded before session closes
             _ = (server.id, server.name, server.description, server.server_type,
                  server.server_path, server.server_url, server.server_command,
-                 server.server_args, server.server_env, server.capabilities,
-                 server.last_ping, server.is_active, server.created_at,
-                 server.updated_at, server.owner_id)
+                 server.server_args, server.server_env, server.client_options, server.replicas,
+                 server.capabilities, server.last_ping, server.last_ping_latency, server.is_active,
+                 server.created_at, server.updated_at, server.owner_id)
             
             # Detach from session to prevent DetachedInstanceError
             session.expunge(server)
@@ -126,9 +141,26 @@ class Database:
                 # Access all attributes to ensure they're loaded
                 _ = (server.id, server.name, server.description, server.server_type,
                      server.server_path, server.server_url, server.server_command,
-                     server.server_args, server.server_env, server.capabilities,
-                     server.last_ping, server.is_active, server.created_at,
-                     server.updated_at, server.owner_id)
+                     server.server_args, server.server_env, server.client_options, server.replicas,
+                     server.capabilities, server.last_ping, server.last_ping_latency, server.is_active,
+                     server.created_at, server.updated_at, server.owner_id)
+            
+            # Detach from session to prevent DetachedInstanceError
+            session.expunge_all()
+            return servers
+    
+    def get_active_servers(self) -> list[MCPServer]:
+        """Get all active MCP servers."""
+        with self.session_scope() as session:
+            servers = session.query(MCPServer).filter(MCPServer.is_active == True).all()
+            
+            # Ensure all attributes are loaded before session closes
+            for server in servers:
+                _ = (server.id, server.name, server.description, server.server_type,
+                     server.server_path, server.server_url, server.server_command,
+                     server.server_args, server.server_env, server.client_options, server.replicas,
+                     server.capabilities, server.last_ping, server.last_ping_latency, server.is_active,
+                     server.created_at, server.updated_at, server.owner_id)
             
             # Detach from session to prevent DetachedInstanceError
             session.expunge_all()
@@ -142,9 +174,9 @@ class Database:
                 # Ensure all attributes are loaded before session closes
                 _ = (server.id, server.name, server.description, server.server_type,
                      server.server_path, server.server_url, server.server_command,
-                     server.server_args, server.server_env, server.capabilities,
-                     server.last_ping, server.is_active, server.created_at,
-                     server.updated_at, server.owner_id)
+                     server.server_args, server.server_env, server.client_options, server.replicas,
+                     server.capabilities, server.last_ping, server.last_ping_latency, server.is_active,
+                     server.created_at, server.updated_at, server.owner_id)
                 # Detach from session to prevent DetachedInstanceError
                 session.expunge(server)
             return server
@@ -157,6 +189,15 @@ class Database:
                 server.capabilities = capabilities
                 session.commit()
     
+    def update_server_ping(self, server_id: int, latency_ms: float):
+        """Record a successful heartbeat and its latency."""
+        with self.session_scope() as session:
+            server = session.query(MCPServer).filter(MCPServer.id == server_id).first()
+            if server:
+                server.last_ping = datetime.utcnow()
+                server.last_ping_latency = latency_ms
+                session.commit()
+    
     def log_query(self, user_id: int, server_id: int, query_data: dict) -> QueryHistory:
         """Log a query execution."""
         with self.session_scope() as session:
@@ -173,7 +214,7 @@ class Database:
             _ = (query.id, query.query_text, query.query_type, query.tool_name,
                  query.tool_args, query.resource_uri, query.prompt_name,
                  query.prompt_args, query.result, query.error_message,
-                 query.execution_time, query.created_at, query.user_id,
+                 query.execution_time, query.timings, query.created_at, query.user_id,
                  query.mcp_server_id)
             
             # Detach from session to prevent DetachedInstanceError
@@ -192,13 +233,49 @@ class Database:
                 _ = (query.id, query.query_text, query.query_type, query.tool_name,
                      query.tool_args, query.resource_uri, query.prompt_name,
                      query.prompt_args, query.result, query.error_message,
-                     query.execution_time, query.created_at, query.user_id,
+                     query.execution_time, query.timings, query.created_at, query.user_id,
                      query.mcp_server_id)
             
             # Detach from session to prevent DetachedInstanceError
             session.expunge_all()
             return queries
 
+    def get_tool_latency_history(self, server_id: int, per_tool: int = 100) -> dict[str, list[float]]:
+        """
+        Get recent successful tool latencies (ms) for a server, oldest first, per tool.
+        
+        Each tool gets its own window of per_tool calls. The request phase
+        of a call's timings is used where recorded, so that pool acquire,
+        cold starts and parsing do not inflate the samples; older rows
+        without timings fall back to the end-to-end execution time.
+        """
+        with self.session_scope() as session:
+            ranked = session.query(
+                QueryHistory.tool_name,
+                QueryHistory.execution_time,
+                QueryHistory.timings,
+                QueryHistory.created_at,
+                func.row_number().over(
+                    partition_by=QueryHistory.tool_name,
+                    order_by=QueryHistory.created_at.desc()
+                ).label("recency")
+            ).filter(
+                QueryHistory.mcp_server_id == server_id,
+                QueryHistory.query_type == "tool",
+                QueryHistory.tool_name.isnot(None),
+                QueryHistory.execution_time.isnot(None),
+                QueryHistory.error_message.is_(None)
+            ).subquery()
+            rows = session.query(ranked.c.tool_name, ranked.c.execution_time, ranked.c.timings).filter(
+                ranked.c.recency <= per_tool
+            ).order_by(ranked.c.created_at).all()
+
+        history: dict[str, list[float]] = {}
+        for tool_name, execution_time, timings in rows:
+            request_ms = timings.get("request") if isinstance(timings, dict) else None
+            history.setdefault(tool_name, []).append(request_ms if request_ms is not None else execution_time)
+        return history
+
 
 # Global database instance
 db = Database()
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 import json
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, Boolean, 
+    Column, Integer, String, Text, DateTime, Boolean, Float,
     ForeignKey, JSON, create_engine
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -51,10 +51,13 @@ class MCPServer(Base):
     server_command = Column(String(200), nullable=True)
     server_args = Column(JSON, nullable=True)
     server_env = Column(JSON, nullable=True)
+    client_options = Column(JSON, nullable=True)  # Pool sizing and client tuning
+    replicas = Column(JSON, nullable=True)  # Additional instances: connection field overrides per replica
     
     # Server metadata
     capabilities = Column(JSON, nullable=True)
     last_ping = Column(DateTime, nullable=True)
+    last_ping_latency = Column(Float, nullable=True)  # milliseconds
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -87,6 +90,7 @@ class QueryHistory(Base):
     result = Column(JSON, nullable=True)
     error_message = Column(Text, nullable=True)
     execution_time = Column(Integer, nullable=True)  # milliseconds
+    timings = Column(JSON, nullable=True)  # per-phase milliseconds (connect, initialize, request, ...)
     
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -125,6 +129,8 @@ class MCPServerCreate(BaseModel):
     server_command: Optional[str] = None
     server_args: Optional[List[str]] = None
     server_env: Optional[Dict[str, Any]] = None
+    client_options: Optional[Dict[str, Any]] = None
+    replicas: Optional[List[Dict[str, Any]]] = None
 
 
 class MCPServerUpdate(BaseModel):
@@ -136,6 +142,8 @@ class MCPServerUpdate(BaseModel):
     server_command: Optional[str] = None
     server_args: Optional[List[str]] = None
     server_env: Optional[Dict[str, Any]] = None
+    client_options: Optional[Dict[str, Any]] = None
+    replicas: Optional[List[Dict[str, Any]]] = None
     is_active: Optional[bool] = None
 
 
@@ -149,8 +157,11 @@ class MCPServerResponse(BaseModel):
     server_command: Optional[str]
     server_args: Optional[List[str]]
     server_env: Optional[Dict[str, Any]]
+    client_options: Optional[Dict[str, Any]] = None
+    replicas: Optional[List[Dict[str, Any]]] = None
     capabilities: Optional[Dict[str, Any]]
     last_ping: Optional[datetime]
+    last_ping_latency: Optional[float] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
@@ -169,6 +180,18 @@ class QueryRequest(BaseModel):
     prompt_args: Optional[Dict[str, Any]] = None
 
 
+class ToolCallRequest(BaseModel):
+    name: str
+    arguments: Dict[str, Any] = {}
+
+
+class BatchToolRequest(BaseModel):
+    calls: List[ToolCallRequest]
+    concurrency: int = 8  # calls in flight at once
+    timeout: Optional[float] = None  # seconds allowed per call
+    include_binary: bool = False  # embed base64 data of binary results
+
+
 class QueryResponse(BaseModel):
     id: int
     query_text: str
@@ -181,6 +204,7 @@ class QueryResponse(BaseModel):
     result: Optional[Dict[str, Any]]
     error_message: Optional[str]
     execution_time: Optional[int]
+    timings: Optional[Dict[str, float]] = None
     created_at: datetime
     user_id: int
     mcp_server_id: int
@@ -194,6 +218,7 @@ class ChatRequest(BaseModel):
     llm_provider: str = "openai"  # openai, anthropic, bedrock
     model_name: str = "gpt-4o"
     system_prompt: Optional[str] = None
+    turn_timeout: Optional[float] = None  # seconds allowed for the turn's tool calls
 
 
 class ChatResponse(BaseModel):
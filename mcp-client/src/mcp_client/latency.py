@@ -0,0 +1,101 @@
+"""
+Latency tracking for MCP tool calls.
+
+This module keeps a sliding window of observed tool call latencies per
+server and tool, and answers percentile queries used to decide when to
+hedge a slow request and how long a call may take before it times out.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Sequence, Tuple
+
+
+def nearest_rank(sorted_samples: Sequence[float], percentile: float) -> float:
+    """Nearest-rank percentile of samples sorted in ascending order (at least one)."""
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class LatencyTracker:
+    """Sliding windows of tool call latencies keyed by server identity and tool."""
+
+    def __init__(self, window: int = 256):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Number of most recent samples kept per tool
+        """
+        self.window = window
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._seeded: set = set()
+        self._lock = threading.Lock()
+
+    def record(self, server_key: str, tool_name: str, latency_ms: float) -> None:
+        """Record one observed latency."""
+        with self._lock:
+            samples = self._samples.get((server_key, tool_name))
+            if samples is None:
+                samples = self._samples[(server_key, tool_name)] = deque(maxlen=self.window)
+            samples.append(latency_ms)
+
+    def seed(self, server_key: str, tool_name: str, latencies_ms: Iterable[float]) -> None:
+        """Add historical samples ahead of any observed in this process, once per tool."""
+        with self._lock:
+            if (server_key, tool_name) in self._seeded:
+                return
+            self._seeded.add((server_key, tool_name))
+            samples = self._samples.get((server_key, tool_name))
+            history = deque(latencies_ms, maxlen=self.window)
+            if samples:
+                history.extend(samples)
+            self._samples[(server_key, tool_name)] = history
+
+    def count(self, server_key: str, tool_name: str) -> int:
+        """Number of samples held for a tool."""
+        with self._lock:
+            return len(self._samples.get((server_key, tool_name)) or ())
+
+    def percentile(
+        self,
+        server_key: str,
+        tool_name: str,
+        percentile: float,
+        min_samples: int = 1
+    ) -> Optional[float]:
+        """
+        Get a latency percentile in milliseconds (nearest-rank).
+
+        Returns:
+            The percentile, or None with fewer than min_samples samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get((server_key, tool_name)) or ())
+        if not samples or len(samples) < min_samples:
+            return None
+        return nearest_rank(samples, percentile)
+
+    def stats(self, server_key: str) -> Dict[str, Dict[str, float]]:
+        """Get sample counts and p50/p90/p99 per tool for a server."""
+        with self._lock:
+            tools = [tool for key, tool in self._samples if key == server_key]
+        return {
+            tool: {
+                "count": self.count(server_key, tool),
+                "p50_ms": self.percentile(server_key, tool, 50),
+                "p90_ms": self.percentile(server_key, tool, 90),
+                "p99_ms": self.percentile(server_key, tool, 99),
+            }
+            for tool in tools
+        }
+
+
+# Global tool latency tracker
+latency_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the global tool latency tracker."""
+    return latency_tracker
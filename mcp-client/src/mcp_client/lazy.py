@@ -0,0 +1,39 @@
+"""
+Lazy attribute loading for package namespaces.
+
+The package __init__ modules re-export classes from submodules that pull
+in heavy dependencies (the MCP SDK, SQLAlchemy, FastAPI, LLM SDKs). This
+module builds PEP 562 module __getattr__/__dir__ hooks so a re-exported
+name only imports its submodule when it is first accessed.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build __getattr__ and __dir__ for a package.
+
+    Args:
+        package: The package's __name__
+        exports: Exported name -> relative submodule defining it (e.g. ".client")
+
+    Returns:
+        The (__getattr__, __dir__) pair to assign in the package namespace
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Cache so later lookups (and a same-named submodule) resolve to the export
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
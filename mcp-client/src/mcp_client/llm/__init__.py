@@ -5,8 +5,14 @@ This module provides integrations with various LLM providers
 for intelligent tool calling and conversation management.
 """
 
-from .providers import OpenAIProvider, AnthropicProvider, BedrockProvider
-from .agent import MCPAgent
-from .tools import ToolManager
+from ..lazy import lazy_exports
 
-__all__ = ["OpenAIProvider", "AnthropicProvider", "BedrockProvider", "MCPAgent", "ToolManager"] 
\ No newline at end of file
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "OpenAIProvider": ".providers",
+    "AnthropicProvider": ".providers",
+    "BedrockProvider": ".providers",
+    "MCPAgent": ".agent",
+    "ToolManager": ".tools",
+})
+
+__all__ = ["OpenAIProvider", "AnthropicProvider", "BedrockProvider", "MCPAgent", "ToolManager"]
@@ -7,12 +7,15 @@ with MCP tools for intelligent conversation and automatic tool execution.
 
 import json
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
 from .providers import get_llm_provider, LLMProvider
 from .tools import ToolManager, create_tool_manager
+from ..client import MCPClient
+from ..database.database import get_database
 from ..database.models import ChatRequest, ChatResponse
+from ..pool import ReplicaClient, ReplicaSet, SessionPool, get_session_pool_manager
 
 
 class MCPAgent:
@@ -66,7 +69,8 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
         model: str = None,
         temperature: float = 0.7,
         max_tokens: int = 1000,
-        max_tool_calls: int = 5
+        max_tool_calls: int = 5,
+        turn_timeout: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Process a chat message with intelligent tool calling.
@@ -77,13 +81,20 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
             temperature: Response temperature
             max_tokens: Maximum tokens in response
             max_tool_calls: Maximum number of tool calls per response
+            turn_timeout: Optional budget in seconds for the tool calls of
+                this turn; each call gets at most the time that remains
             
         Returns:
             Chat response with content and execution details
         """
         start_time = datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        turn_deadline = loop.time() + turn_timeout if turn_timeout is not None else None
         
         try:
+            # Pick up tool list changes announced by the server
+            await self.tool_manager.refresh_if_stale()
+            
             # Add user message to conversation
             self.conversation_history.append({
                 "role": "user",
@@ -105,10 +116,14 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
             
             # Iterative tool calling loop
             for iteration in range(max_tool_calls):
+                # Leave out tools whose circuit breaker is open
+                unavailable = set(self.tool_manager.get_unavailable_tools())
+                offered_tools = [tool for tool in available_tools if tool["name"] not in unavailable]
+                
                 # Get LLM response
                 llm_response = await self.llm_provider.chat_completion(
                     messages=messages,
-                    tools=available_tools if available_tools else None,
+                    tools=offered_tools if offered_tools else None,
                     model=model,
                     temperature=temperature,
                     max_tokens=max_tokens
@@ -120,9 +135,11 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
                 
                 # Check if LLM wants to use tools
                 if llm_response.get("tool_calls"):
-                    # Execute tool calls
+                    # Execute tool calls within what is left of the turn budget
+                    remaining = turn_deadline - loop.time() if turn_deadline is not None else None
                     tool_results = await self.tool_manager.execute_multiple_tools(
-                        llm_response["tool_calls"]
+                        llm_response["tool_calls"],
+                        timeout=remaining
                     )
                     
                     tool_executions.extend(tool_results)
@@ -166,7 +183,7 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
                                 tool_message = {
                                     "role": "tool", 
                                     "tool_call_id": tool_call_id,
-                                    "content": f"Error: {tool_result['error']}"
+                                    "content": f"Error: {self._tool_error_detail(tool_result)}"
                                 }
                             messages.append(tool_message)
                     else:
@@ -180,7 +197,7 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
                             else:
                                 tool_message = {
                                     "role": "user",
-                                    "content": f"Tool {tool_result['tool_name']} error: {tool_result['error']}"
+                                    "content": f"Tool {tool_result['tool_name']} error: {self._tool_error_detail(tool_result)}"
                                 }
                             messages.append(tool_message)
                     
@@ -222,6 +239,15 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
                 "timestamp": start_time.isoformat()
             }
     
+    def _tool_error_detail(self, tool_result: Dict[str, Any]) -> str:
+        """Error text for a failed tool call, telling the LLM when the tool is unavailable."""
+        if tool_result.get("unavailable"):
+            return (
+                f"{tool_result['error']}. This tool is unavailable right now; "
+                "do not call it again and answer with the information you have."
+            )
+        return tool_result["error"]
+    
     async def reset_conversation(self):
         """Reset the conversation history."""
         self.conversation_history = []
@@ -252,7 +278,8 @@ Be helpful, accurate, and transparent about your capabilities and limitations.""
 async def create_mcp_agent(
     server_config: Dict[str, Any],
     llm_config: Dict[str, Any],
-    system_prompt: str = None
+    system_prompt: str = None,
+    mcp_client: Optional[MCPClient] = None
 ) -> MCPAgent:
     """
     Create and initialize an MCP agent.
@@ -261,12 +288,13 @@ async def create_mcp_agent(
         server_config: MCP server configuration
         llm_config: LLM provider configuration
         system_prompt: Optional custom system prompt
+        mcp_client: Optional already connected MCP client
         
     Returns:
         Initialized MCPAgent instance
     """
     # Create tool manager
-    tool_manager = await create_tool_manager(server_config)
+    tool_manager = await create_tool_manager(server_config, mcp_client)
     
     # Create LLM provider
     provider_name = llm_config.get("provider", "openai")
@@ -285,6 +313,7 @@ class AgentManager:
     def __init__(self):
         """Initialize agent manager."""
         self.agents: Dict[int, MCPAgent] = {}
+        self.leases: Dict[int, Union[SessionPool, ReplicaSet]] = {}
     
     async def create_agent(
         self,
@@ -293,11 +322,56 @@ class AgentManager:
         llm_config: Dict[str, Any],
         system_prompt: str = None
     ) -> MCPAgent:
-        """Create and register an agent for a server."""
-        agent = await create_mcp_agent(server_config, llm_config, system_prompt)
+        """
+        Create and register an agent for a server.
+        
+        The agent's MCP session is checked out of the server's session pool,
+        so a warm spare is used when one is ready. For servers with replicas
+        each tool call is routed to the least-loaded replica.
+        """
+        pool = get_session_pool_manager().get_pool(server_id, server_config)
+        client = await pool.checkout()
+        if isinstance(pool, ReplicaSet):
+            # Balance the agent's tool calls across replicas, not just its session
+            client = ReplicaClient(pool, client)
+        try:
+            agent = await create_mcp_agent(server_config, llm_config, system_prompt, client)
+        except Exception:
+            await pool.checkin(client)
+            raise
+        self.leases[server_id] = pool
+        
+        # Persist capability changes picked up by this agent's session
+        agent.tool_manager.mcp_client.on_capabilities_updated = (
+            lambda capabilities: get_database().update_server_capabilities(server_id, capabilities)
+        )
+        
         self.agents[server_id] = agent
         return agent
     
+    async def renew_session(self, server_id: int) -> None:
+        """
+        Give an agent a fresh pooled session if its own has died.
+        
+        Agents hold their session across turns, so a session the supervisor
+        found unresponsive or replaced while restarting the server is
+        checked back in and another one checked out in its place.
+        """
+        agent = self.agents.get(server_id)
+        pool = self.leases.get(server_id)
+        if agent is None or pool is None:
+            return
+        client = agent.tool_manager.mcp_client
+        if pool.is_live(client):
+            return
+        fresh = await pool.checkout()
+        if isinstance(pool, ReplicaSet):
+            fresh = ReplicaClient(pool, fresh)
+        fresh.on_capabilities_updated = client.on_capabilities_updated
+        client.on_capabilities_updated = None
+        agent.tool_manager.mcp_client = fresh
+        await pool.checkin(client, healthy=False)
+    
     def get_agent(self, server_id: int) -> Optional[MCPAgent]:
         """Get agent for a server."""
         return self.agents.get(server_id)
@@ -306,9 +380,15 @@ class AgentManager:
         """Remove agent for a server."""
         if server_id in self.agents:
             agent = self.agents[server_id]
-            # Close MCP client connection
-            if hasattr(agent.tool_manager.mcp_client, 'close'):
-                await agent.tool_manager.mcp_client.close()
+            client = agent.tool_manager.mcp_client
+            pool = self.leases.pop(server_id, None)
+            if pool is not None:
+                # Return the session to its pool
+                client.on_capabilities_updated = None
+                await pool.checkin(client)
+            elif hasattr(client, 'close'):
+                # Close MCP client connection
+                await client.close()
             del self.agents[server_id]
     
     def list_agents(self) -> List[int]:
@@ -3,6 +3,9 @@ LLM provider implementations for MCP Client.
 
 This module provides implementations for different LLM providers
 including OpenAI, Anthropic, and AWS Bedrock.
+
+Each provider imports its SDK when it is constructed, so only the SDK of
+the provider actually in use is loaded.
 """
 
 import os
@@ -12,12 +15,6 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
-import openai
-from anthropic import Anthropic
-import boto3
-
-from ..database.models import ChatRequest, ChatResponse
-
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -48,6 +45,8 @@ class OpenAIProvider(LLMProvider):
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
+        import openai
+        
         self.client = openai.AsyncOpenAI(api_key=self.api_key)
     
     def format_tools_for_provider(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -131,6 +130,8 @@ class AnthropicProvider(LLMProvider):
         if not self.api_key:
             raise ValueError("Anthropic API key is required")
         
+        from anthropic import Anthropic
+        
         self.client = Anthropic(api_key=self.api_key)
     
     def format_tools_for_provider(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -228,6 +229,8 @@ class BedrockProvider(LLMProvider):
         self.region_name = region_name
         
         # Initialize boto3 client
+        import boto3
+        
         session_kwargs = {"region_name": region_name}
         if access_key and secret_key:
             session_kwargs.update({
@@ -10,7 +10,10 @@ import asyncio
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from ..client import MCPClient, MCPClientConfig
+from ..cache import get_result_cache
+from ..client import CallStats, MCPClient, MCPClientConfig
+from ..content import describe_binary
+from ..resilience import CircuitOpenError
 
 
 class ToolManager:
@@ -27,12 +30,17 @@ class ToolManager:
         self.available_tools = []
         self.tool_schemas = {}
     
-    async def refresh_tools(self):
-        """Refresh available tools from the MCP server."""
+    async def refresh_tools(self, force: bool = False):
+        """
+        Refresh available tools from the MCP server.
+        
+        Args:
+            force: Bypass the capability cache
+        """
         if not self.mcp_client.session:
             raise RuntimeError("MCP client is not connected")
         
-        await self.mcp_client.discover_capabilities()
+        await self.mcp_client.discover_capabilities(refresh=force)
         
         # Convert MCP tools to standardized format
         self.available_tools = []
@@ -48,21 +56,41 @@ class ToolManager:
             self.available_tools.append(tool_dict)
             self.tool_schemas[tool.name] = tool_dict
     
+    async def refresh_if_stale(self) -> bool:
+        """Refresh tools if the server reported a tool list change. Returns True if refreshed."""
+        if "tools" not in self.mcp_client.stale_capabilities:
+            return False
+        await self.refresh_tools()
+        return True
+    
     def get_tools_for_llm(self) -> List[Dict[str, Any]]:
         """Get tools formatted for LLM consumption."""
         return self.available_tools.copy()
     
+    def get_unavailable_tools(self) -> List[str]:
+        """Get names of tools whose circuit breaker is currently open."""
+        return [
+            tool["name"] for tool in self.available_tools
+            if not self.mcp_client.is_tool_available(tool["name"])
+        ]
+    
     def get_tool_schema(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get schema for a specific tool."""
         return self.tool_schemas.get(tool_name)
     
-    async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Execute a tool with the given arguments.
         
         Args:
             tool_name: Name of the tool to execute
             arguments: Arguments to pass to the tool
+            timeout: Optional limit in seconds on top of the tool's own deadline
             
         Returns:
             Dictionary containing execution result
@@ -75,7 +103,8 @@ class ToolManager:
                 raise ValueError(f"Tool '{tool_name}' not found")
             
             # Execute the tool via MCP client
-            result = await self.mcp_client.call_tool(tool_name, arguments)
+            stats = CallStats()
+            result = await self.mcp_client.call_tool(tool_name, arguments, stats=stats, timeout=timeout)
             
             # Calculate execution time
             execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
@@ -87,6 +116,11 @@ class ToolManager:
                 "arguments": arguments,
                 "result": self._format_tool_result(result),
                 "execution_time_ms": int(execution_time),
+                "cache": self._cache_info(stats),
+                "coalesced": stats.coalesced,
+                "hedged": stats.hedged,
+                "deadline_ms": int(stats.deadline * 1000) if stats.deadline is not None else None,
+                "timings": stats.timings.to_dict(),
                 "timestamp": start_time.isoformat()
             }
             
@@ -100,10 +134,17 @@ class ToolManager:
                 "tool_name": tool_name,
                 "arguments": arguments,
                 "error": str(e),
+                "timed_out": isinstance(e, TimeoutError),
+                "unavailable": isinstance(e, CircuitOpenError),
                 "execution_time_ms": int(execution_time),
                 "timestamp": start_time.isoformat()
             }
     
+    def _cache_info(self, stats: CallStats) -> Dict[str, Any]:
+        """Result cache status of a call plus the server's hit and miss counters."""
+        counters = get_result_cache().stats(self.mcp_client.server_key) if self.mcp_client.server_key else {}
+        return {"hit": stats.cache_hit, **counters}
+    
     def _format_tool_result(self, mcp_result) -> Any:
         """Format MCP tool result for LLM consumption."""
         if hasattr(mcp_result, 'content') and mcp_result.content:
@@ -112,8 +153,8 @@ class ToolManager:
             for content_item in mcp_result.content:
                 if hasattr(content_item, 'text'):
                     content_parts.append(content_item.text)
-                elif hasattr(content_item, 'data'):
-                    content_parts.append(f"Binary data ({len(content_item.data)} bytes)")
+                elif (binary := describe_binary(content_item)) is not None:
+                    content_parts.append(f"Binary data ({binary['size']} bytes, {binary['mimeType']})")
                 else:
                     content_parts.append(str(content_item))
             
@@ -121,12 +162,17 @@ class ToolManager:
         else:
             return str(mcp_result)
     
-    async def execute_multiple_tools(self, tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def execute_multiple_tools(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
         """
         Execute multiple tools concurrently.
         
         Args:
             tool_calls: List of tool calls with 'name' and 'arguments'
+            timeout: Optional limit in seconds applied to each call
             
         Returns:
             List of execution results
@@ -135,7 +181,8 @@ class ToolManager:
         for tool_call in tool_calls:
             task = self.execute_tool(
                 tool_call.get("name"),
-                tool_call.get("arguments", {})
+                tool_call.get("arguments", {}),
+                timeout=timeout
             )
             tasks.append(task)
         
@@ -199,41 +246,53 @@ class ToolManager:
         return {k: v for k, v in categories.items() if v}
 
 
-async def create_tool_manager(server_config: Dict[str, Any]) -> ToolManager:
+async def create_tool_manager(
+    server_config: Dict[str, Any],
+    mcp_client: Optional[MCPClient] = None
+) -> ToolManager:
     """
     Create and initialize a tool manager for an MCP server.
     
     Args:
         server_config: Server configuration dictionary
+        mcp_client: Already connected client to use, e.g. one checked out
+            from a session pool. A new client is connected if omitted.
         
     Returns:
         Initialized ToolManager instance
     """
-    # Create MCP client configuration
-    config = MCPClientConfig(
-        server_command=server_config.get("server_command"),
-        server_args=server_config.get("server_args", []),
-        server_env=server_config.get("server_env", {}),
-        transport_type=server_config.get("server_type", "stdio"),
-        timeout=30,
-        debug=False
-    )
-    
-    # Create and connect MCP client
-    client = MCPClient(config)
-    
-    # Determine connection method
-    if server_config.get("server_url"):
-        await client.connect(server_config["server_url"], server_config.get("server_type"))
-    elif server_config.get("server_path"):
-        await client.connect(server_config["server_path"])
+    if mcp_client is not None:
+        client = mcp_client
     else:
-        # Use command and args
-        await client.connect_stdio(
-            server_config["server_command"],
-            server_config.get("server_args", []),
-            server_config.get("server_env", {})
+        # Create MCP client configuration
+        config = MCPClientConfig(
+            server_command=server_config.get("server_command"),
+            server_args=server_config.get("server_args", []),
+            server_env=server_config.get("server_env", {}),
+            transport_type=server_config.get("server_type", "stdio"),
+            timeout=30,
+            debug=False
         )
+        
+        # Create and connect MCP client
+        client = MCPClient(config)
+        
+        # Determine connection method
+        if server_config.get("server_url"):
+            await client.connect(server_config["server_url"], server_config.get("server_type"))
+        elif server_config.get("server_path"):
+            await client.connect(server_config["server_path"])
+        else:
+            # Use command and args
+            await client.connect_stdio(
+                server_config["server_command"],
+                server_config.get("server_args", []),
+                server_config.get("server_env", {})
+            )
+    
+    # Start from the stored capabilities snapshot when it is still fresh
+    if server_config.get("capabilities"):
+        client.load_capabilities_snapshot(server_config["capabilities"])
     
     # Create tool manager and refresh tools
     tool_manager = ToolManager(client)
@@ -3,21 +3,33 @@ Main CLI entry point for the MCP Client.
 
 This module provides the command-line interface for connecting to and
 interacting with MCP servers.
+
+Modules that pull in the MCP SDK (the client, the daemon, result types)
+are imported inside the commands that use them, so that short commands
+such as `version`, and calls answered by the CLI daemon, start quickly.
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
-from .client import MCPClient, MCPClientConfig
+from .snapshots import get_capability_snapshots
+from .timing import Timings
+
+if TYPE_CHECKING:
+    from .client import MCPClient, MCPClientConfig
 
 
 # Load environment variables
@@ -26,17 +38,49 @@ load_dotenv()
 console = Console()
 
 
+def _cached_capabilities(ctx) -> dict:
+    """Capabilities from the snapshot of the server given on the command line, for completion."""
+    params = ctx.find_root().params
+    if not params.get('server'):
+        return {}
+    entry = get_capability_snapshots().load(params['server'], params.get('transport') or 'auto')
+    return entry["capabilities"] if entry else {}
+
+
+def _name_completer(category: str, field: str):
+    """Build a completer for tool, prompt or resource names from the cached snapshot (never contacts the server)."""
+    def complete(ctx, param, incomplete):
+        return [
+            str(item[field])
+            for item in _cached_capabilities(ctx).get(category) or []
+            if str(item.get(field, "")).startswith(incomplete)
+        ]
+    return complete
+
+
+def _complete_tool_arguments(ctx, param, incomplete):
+    """Complete key= for the parameters of the tool being called that are not given yet."""
+    tools = _cached_capabilities(ctx).get("tools") or []
+    tool = next((t for t in tools if t["name"] == ctx.params.get("tool_name")), None)
+    properties = ((tool or {}).get("inputSchema") or {}).get("properties") or {}
+    given = {arg.split("=", 1)[0] for arg in ctx.params.get("args") or ()}
+    return [f"{name}=" for name in properties if name not in given and f"{name}=".startswith(incomplete)]
+
+
 @click.group(invoke_without_command=True)
 @click.option('--server', '-s', help='Server script path or URL')
 @click.option('--transport', '-t', 
-              type=click.Choice(['stdio', 'sse', 'auto']), 
+              type=click.Choice(['stdio', 'sse', 'streamable_http', 'inprocess', 'auto']), 
               default='auto',
-              help='Transport type (stdio, sse, auto)')
+              help='Transport type (stdio, sse, streamable_http, inprocess, auto)')
+@click.option('--http2', is_flag=True, help='Allow HTTP/2 for HTTP transports (requires h2)')
 @click.option('--debug', '-d', is_flag=True, help='Enable debug logging')
-@click.option('--timeout', default=30, help='Connection timeout in seconds')
+@click.option('--timeout', default=30, help='Connection timeout, and the longest any single tool call may take, in seconds')
 @click.option('--config', '-c', type=click.Path(exists=True), help='Configuration file path')
+@click.option('--timings', is_flag=True, help='Show a per-phase timing breakdown of the operation')
+@click.option('--no-daemon', is_flag=True, help='Connect directly even if a CLI daemon is running')
 @click.pass_context
-def cli(ctx, server, transport, debug, timeout, config):
+def cli(ctx, server, transport, http2, debug, timeout, config, timings, no_daemon):
     """
     MCP Client - Connect to and interact with Model Context Protocol servers.
     
@@ -50,28 +94,36 @@ def cli(ctx, server, transport, debug, timeout, config):
         # Connect to an SSE server
         mcp-client -s http://localhost:8000/sse -t sse
         
+        # Connect to a streamable HTTP server
+        mcp-client -s http://localhost:8000/mcp -t streamable_http
+        
+        # Run a trusted Python FastMCP server inside the client process
+        mcp-client -s server.py -t inprocess
+        
         # Interactive mode (default)
         mcp-client -s server.py interactive
         
-        # List server capabilities
+        # List server capabilities (cached on disk; --refresh rediscovers)
         mcp-client -s server.py list
         
         # Call a specific tool
         mcp-client -s server.py tool my_tool arg1=value1 arg2=value2
+        
+        # Show where the time went (connect, initialize, request, parse)
+        mcp-client -s server.py --timings tool my_tool arg1=value1
+        
+        # Keep sessions warm in a background daemon for later commands
+        mcp-client daemon start
     """
     ctx.ensure_object(dict)
     
-    # Load configuration
-    if config:
-        ctx.obj['config'] = _load_config_file(config)
-    else:
-        ctx.obj['config'] = MCPClientConfig(
-            transport_type=transport,
-            timeout=timeout,
-            debug=debug
-        )
+    # The client configuration is built on first use, see _client_config
+    ctx.obj['config_file'] = config
+    ctx.obj['config_options'] = dict(transport_type=transport, timeout=timeout, debug=debug, http2=http2)
     
     ctx.obj['server'] = server
+    ctx.obj['timings'] = timings
+    ctx.obj['use_daemon'] = not no_daemon
     
     # If no subcommand is specified, run interactive mode
     if ctx.invoked_subcommand is None:
@@ -87,7 +139,7 @@ def cli(ctx, server, transport, debug, timeout, config):
 def interactive(ctx):
     """Start an interactive session with the MCP server."""
     server = ctx.obj['server']
-    config = ctx.obj['config']
+    config = _client_config(ctx)
     
     if not server:
         console.print("[red]Error: Server path or URL is required[/red]")
@@ -97,24 +149,26 @@ def interactive(ctx):
 
 
 @cli.command()
+@click.option('--refresh', is_flag=True, help='Rediscover capabilities instead of using the cached snapshot')
 @click.pass_context
-def list(ctx):
+def list(ctx, refresh):
     """List all capabilities (resources, tools, prompts) from the server."""
     server = ctx.obj['server']
-    config = ctx.obj['config']
+    config = _client_config(ctx)
     
     if not server:
         console.print("[red]Error: Server path or URL is required[/red]")
         sys.exit(1)
     
-    asyncio.run(_run_list_capabilities(server, config))
+    asyncio.run(_run_list_capabilities(server, config, refresh))
 
 
 @cli.command()
-@click.argument('tool_name')
-@click.argument('args', nargs=-1)
+@click.argument('tool_name', shell_complete=_name_completer('tools', 'name'))
+@click.argument('args', nargs=-1, shell_complete=_complete_tool_arguments)
+@click.option('--refresh', is_flag=True, help='Skip validating the call against the cached capabilities')
 @click.pass_context
-def tool(ctx, tool_name, args):
+def tool(ctx, tool_name, args, refresh):
     """
     Call a specific tool on the server.
     
@@ -124,7 +178,7 @@ def tool(ctx, tool_name, args):
     Example: mcp-client -s server.py tool add a=5 b=3
     """
     server = ctx.obj['server']
-    config = ctx.obj['config']
+    options = _config_options(ctx)
     
     if not server:
         console.print("[red]Error: Server path or URL is required[/red]")
@@ -132,9 +186,11 @@ def tool(ctx, tool_name, args):
     
     # Parse tool arguments
     tool_args = {}
+    raw_args = {}
     for arg in args:
         if '=' in arg:
             key, value = arg.split('=', 1)
+            raw_args[key] = value
             # Try to parse as JSON, fallback to string
             try:
                 tool_args[key] = json.loads(value)
@@ -143,11 +199,14 @@ def tool(ctx, tool_name, args):
         else:
             console.print(f"[yellow]Warning: Ignoring invalid argument: {arg}[/yellow]")
     
-    asyncio.run(_run_tool_call(server, config, tool_name, tool_args))
+    if not refresh:
+        tool_args = _check_tool_arguments(server, _transport_type(options), tool_name, tool_args, raw_args)
+    
+    asyncio.run(_run_tool_call(server, options, tool_name, tool_args, ctx.obj['timings'], ctx.obj['use_daemon']))
 
 
 @cli.command()
-@click.argument('uri')
+@click.argument('uri', shell_complete=_name_completer('resources', 'uri'))
 @click.pass_context
 def resource(ctx, uri):
     """
@@ -158,17 +217,37 @@ def resource(ctx, uri):
     Example: mcp-client -s server.py resource file:///path/to/file.txt
     """
     server = ctx.obj['server']
-    config = ctx.obj['config']
+    options = _config_options(ctx)
     
     if not server:
         console.print("[red]Error: Server path or URL is required[/red]")
         sys.exit(1)
     
-    asyncio.run(_run_resource_read(server, config, uri))
+    asyncio.run(_run_resource_read(server, options, uri, ctx.obj['timings'], ctx.obj['use_daemon']))
 
 
 @cli.command()
-@click.argument('prompt_name')
+@click.option('--prefix', '-p', default='', help='URI prefix to match')
+@click.option('--limit', '-n', default=100, type=int, help='Maximum number of resources to show')
+@click.pass_context
+def resources(ctx, prefix, limit):
+    """
+    Find resources on the server by URI prefix.
+    
+    Example: mcp-client -s server.py resources --prefix file:///logs/
+    """
+    server = ctx.obj['server']
+    config = _client_config(ctx)
+    
+    if not server:
+        console.print("[red]Error: Server path or URL is required[/red]")
+        sys.exit(1)
+    
+    asyncio.run(_run_resource_search(server, config, prefix, limit))
+
+
+@cli.command()
+@click.argument('prompt_name', shell_complete=_name_completer('prompts', 'name'))
 @click.argument('args', nargs=-1)
 @click.pass_context
 def prompt(ctx, prompt_name, args):
@@ -181,7 +260,7 @@ def prompt(ctx, prompt_name, args):
     Example: mcp-client -s server.py prompt code_review code="print('hello')"
     """
     server = ctx.obj['server']
-    config = ctx.obj['config']
+    options = _config_options(ctx)
     
     if not server:
         console.print("[red]Error: Server path or URL is required[/red]")
@@ -196,7 +275,95 @@ def prompt(ctx, prompt_name, args):
         else:
             console.print(f"[yellow]Warning: Ignoring invalid argument: {arg}[/yellow]")
     
-    asyncio.run(_run_prompt_get(server, config, prompt_name, prompt_args))
+    asyncio.run(_run_prompt_get(server, options, prompt_name, prompt_args, ctx.obj['timings'], ctx.obj['use_daemon']))
+
+
+@cli.command()
+@click.argument('kind', type=click.Choice(['tool', 'resource', 'prompt']))
+@click.argument('name')
+@click.argument('args', nargs=-1)
+@click.option('--concurrency', default=1, type=int, help='Calls in flight at once')
+@click.option('--duration', type=float, help='Seconds to run (default 10 unless --requests is given)')
+@click.option('--requests', 'request_count', type=int, help='Number of calls to make')
+@click.option('--rate', type=float, help='Target calls per second (default: as fast as possible)')
+@click.option('--warmup', default=0, type=int, help='Unmeasured calls made first')
+@click.option('--format', 'output_format', type=click.Choice(['table', 'json']), default='table', help='Report format')
+@click.option('--output', '-o', type=click.Path(), help='Write the report to a file')
+@click.pass_context
+def bench(ctx, kind, name, args, concurrency, duration, request_count, rate, warmup, output_format, output):
+    """
+    Measure a server by driving one tool, resource or prompt.
+    
+    KIND: tool, resource or prompt
+    NAME: Tool name, resource URI or prompt name
+    ARGS: Arguments in key=value format
+    
+    Reports throughput, p50/p90/p99/max latency and error rate. With --rate,
+    latency is measured from each call's scheduled start.
+    
+    Example: mcp-client -s server.py bench tool add a=5 b=3 --concurrency 8 --duration 30 --format json
+    """
+    server = ctx.obj['server']
+    config = _client_config(ctx)
+    
+    if not server:
+        console.print("[red]Error: Server path or URL is required[/red]")
+        sys.exit(1)
+    
+    if duration is None and request_count is None:
+        duration = 10.0
+    
+    arguments = {}
+    for arg in args:
+        if '=' in arg:
+            key, value = arg.split('=', 1)
+            # Prompt arguments are strings; tool arguments may be JSON
+            try:
+                arguments[key] = value if kind == 'prompt' else json.loads(value)
+            except (json.JSONDecodeError, ValueError):
+                arguments[key] = value
+        else:
+            console.print(f"[yellow]Warning: Ignoring invalid argument: {arg}[/yellow]")
+    
+    settings = {
+        "concurrency": concurrency,
+        "duration": duration,
+        "requests": request_count,
+        "rate": rate,
+        "warmup": warmup
+    }
+    asyncio.run(_run_bench(server, config, kind, name, arguments, settings, output_format, output))
+
+
+@cli.command()
+@click.argument('input_file', type=click.File('r'))
+@click.option('--concurrency', default=8, type=int, help='Calls in flight at once')
+@click.option('--output', '-o', type=click.File('w'), default='-', help='Results file (default: stdout)')
+@click.pass_context
+def batch(ctx, input_file, concurrency, output):
+    """
+    Run tool, resource and prompt calls from a JSONL file over one connection.
+    
+    INPUT_FILE: JSONL file of calls, or - for stdin. Each line is an object
+    such as {"type": "tool", "name": "add", "arguments": {"a": 1}},
+    {"type": "resource", "uri": "file:///x"} or {"type": "prompt", "name":
+    "review", "arguments": {...}}; type defaults to tool and an optional
+    "id" is echoed back.
+    
+    Results are written as JSONL in completion order, each with the input
+    line number. Input is read only as calls complete, so memory use does
+    not grow with the input. Exits with status 1 if any call failed.
+    
+    Example: mcp-client -s server.py batch calls.jsonl --concurrency 16 -o results.jsonl
+    """
+    server = ctx.obj['server']
+    config = _client_config(ctx)
+    
+    if not server:
+        console.print("[red]Error: Server path or URL is required[/red]")
+        sys.exit(1)
+    
+    asyncio.run(_run_batch(server, config, input_file, concurrency, output))
 
 
 @cli.command()
@@ -206,14 +373,82 @@ def prompt(ctx, prompt_name, args):
               type=click.Choice(['json', 'yaml', 'table']), 
               default='table',
               help='Output format')
-def inspect(server_path, output, output_format):
+@click.option('--refresh', is_flag=True, help='Rediscover capabilities instead of using the cached snapshot')
+def inspect(server_path, output, output_format, refresh):
     """
     Inspect a server and output its capabilities.
     
     SERVER_PATH: Path to the server script
     """
+    from .client import MCPClientConfig
+    
     config = MCPClientConfig()
-    asyncio.run(_run_inspect(server_path, config, output, output_format))
+    asyncio.run(_run_inspect(server_path, config, output, output_format, refresh))
+
+
+@cli.group()
+def daemon():
+    """
+    Manage the background daemon that keeps server sessions warm.
+    
+    While the daemon runs, the tool, resource and prompt commands are sent
+    to it over a local Unix socket and reuse its open sessions instead of
+    spawning and initializing the server each time.
+    """
+
+
+@daemon.command('start')
+@click.option('--foreground', is_flag=True, help='Run in this process instead of detaching')
+def daemon_start(foreground):
+    """Start the daemon."""
+    from .daemon import CLIDaemon, default_socket_path, start_daemon
+    
+    if foreground:
+        console.print(f"[blue]🔄 Listening on {default_socket_path()}[/blue]")
+        asyncio.run(CLIDaemon().serve())
+        return
+    try:
+        status = asyncio.run(start_daemon())
+    except (RuntimeError, OSError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        sys.exit(1)
+    console.print(f"[green]✅ Daemon started (pid {status['pid']}) on {status['socket']}[/green]")
+
+
+@daemon.command('stop')
+def daemon_stop():
+    """Stop the daemon and close its sessions."""
+    from .daemon_client import daemon_request
+    
+    if asyncio.run(daemon_request({"op": "stop"})) is None:
+        console.print("[yellow]⚠️ Daemon is not running[/yellow]")
+        return
+    console.print("[green]✅ Daemon stopped[/green]")
+
+
+@daemon.command('status')
+def daemon_status():
+    """Show the daemon's sessions."""
+    from .daemon_client import daemon_request
+    
+    reply = asyncio.run(daemon_request({"op": "status"}))
+    if reply is None:
+        console.print("[yellow]⚠️ Daemon is not running[/yellow]")
+        sys.exit(1)
+    status = reply["result"]
+    console.print(
+        f"[green]✅ Daemon running (pid {status['pid']}) on {status['socket']}, "
+        f"up {status['uptime_s']}s, {status['requests']} requests[/green]"
+    )
+    
+    table = Table(title="Sessions")
+    table.add_column("Server", style="cyan")
+    table.add_column("Open", style="green", justify="right")
+    table.add_column("In use", style="yellow", justify="right")
+    for pool in status["pools"]:
+        server = status["servers"].get(str(pool["server_id"]), pool["server_id"])
+        table.add_row(str(server), str(pool["size"]), str(pool["in_use"]))
+    console.print(table)
 
 
 @cli.command()
@@ -225,6 +460,8 @@ def version():
 
 async def _run_interactive(server: str, config: MCPClientConfig):
     """Run the interactive session."""
+    from .client import MCPClient
+    
     async with MCPClient(config) as client:
         try:
             console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
@@ -255,16 +492,13 @@ async def _run_interactive(server: str, config: MCPClientConfig):
             sys.exit(1)
 
 
-async def _run_list_capabilities(server: str, config: MCPClientConfig):
+async def _run_list_capabilities(server: str, config: MCPClientConfig, refresh: bool = False):
     """List server capabilities."""
+    from .client import MCPClient
+    
     async with MCPClient(config) as client:
         try:
-            console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
-            await client.connect(server)
-            
-            console.print("[blue]🔍 Discovering server capabilities...[/blue]")
-            await client.discover_capabilities()
-            
+            await _load_capabilities(client, server, config, refresh)
             client.display_capabilities()
             
         except Exception as e:
@@ -275,27 +509,50 @@ async def _run_list_capabilities(server: str, config: MCPClientConfig):
             sys.exit(1)
 
 
-async def _run_tool_call(server: str, config: MCPClientConfig, tool_name: str, tool_args: dict):
+async def _run_tool_call(
+    server: str,
+    options: dict,
+    tool_name: str,
+    tool_args: dict,
+    show_timings: bool = False,
+    use_daemon: bool = True
+):
     """Call a specific tool."""
+    if use_daemon:
+        reply = await _daemon_call(server, options, {"op": "tool", "name": tool_name, "arguments": tool_args})
+        if reply is not None:
+            console.print(f"[blue]🔧 Calling tool: {tool_name} (via daemon)[/blue]")
+            result = reply["result"]
+            timings = Timings.from_dict(reply["timings"])
+            console.print(f"[green]✅ Tool '{tool_name}' executed successfully:[/green]")
+            with timings.phase("parse"):
+                _print_tool_result(result)
+            if show_timings:
+                _print_timings(timings)
+            return
+    
+    from .client import CallStats, MCPClient
+    
+    config = _build_client_config(options)
     async with MCPClient(config) as client:
         try:
             console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
             await client.connect(server)
             
             console.print(f"[blue]🔧 Calling tool: {tool_name}[/blue]")
-            result = await client.call_tool(tool_name, tool_args)
+            stats = CallStats()
+            result = await client.call_tool(tool_name, tool_args, stats=stats)
+            timings = Timings(client.timings.phases)
+            timings.merge(stats.timings)
             
             console.print(f"[green]✅ Tool '{tool_name}' executed successfully:[/green]")
             
             # Display result
-            if hasattr(result, 'content') and result.content:
-                for content_item in result.content:
-                    if hasattr(content_item, 'text'):
-                        console.print(Panel(content_item.text, title="Result"))
-                    elif hasattr(content_item, 'data'):
-                        console.print(Panel(str(content_item.data), title="Data"))
-            else:
-                console.print(Panel(str(result), title="Result"))
+            with timings.phase("parse"):
+                _print_tool_result(_result_json(result))
+            
+            if show_timings:
+                _print_timings(timings)
                 
         except Exception as e:
             console.print(f"[red]❌ Error: {e}[/red]")
@@ -305,27 +562,81 @@ async def _run_tool_call(server: str, config: MCPClientConfig, tool_name: str, t
             sys.exit(1)
 
 
-async def _run_resource_read(server: str, config: MCPClientConfig, uri: str):
+async def _run_resource_read(
+    server: str,
+    options: dict,
+    uri: str,
+    show_timings: bool = False,
+    use_daemon: bool = True
+):
     """Read a specific resource."""
+    if use_daemon:
+        reply = await _daemon_call(server, options, {"op": "resource", "uri": uri})
+        if reply is not None:
+            console.print(f"[blue]📖 Reading resource: {uri} (via daemon)[/blue]")
+            result = reply["result"]
+            timings = Timings.from_dict(reply["timings"])
+            console.print(f"[green]✅ Resource '{uri}' read successfully:[/green]")
+            with timings.phase("parse"):
+                _print_resource_result(result)
+            if show_timings:
+                _print_timings(timings)
+            return
+    
+    from .client import MCPClient
+    
+    config = _build_client_config(options)
     async with MCPClient(config) as client:
         try:
             console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
             await client.connect(server)
             
             console.print(f"[blue]📖 Reading resource: {uri}[/blue]")
-            result = await client.read_resource(uri)
+            timings = Timings(client.timings.phases)
+            result = await client.read_resource(uri, timings=timings)
             
             console.print(f"[green]✅ Resource '{uri}' read successfully:[/green]")
             
             # Display content
-            if hasattr(result, 'contents') and result.contents:
-                for content_item in result.contents:
-                    if hasattr(content_item, 'text'):
-                        console.print(Panel(content_item.text, title=f"Content ({getattr(content_item, 'mimeType', 'text')})"))
-                    elif hasattr(content_item, 'data'):
-                        console.print(Panel(f"Binary data ({len(content_item.data)} bytes)", title="Binary Content"))
-            else:
-                console.print(Panel(str(result), title="Result"))
+            with timings.phase("parse"):
+                _print_resource_result(_result_json(result))
+            
+            if show_timings:
+                _print_timings(timings)
+                
+        except Exception as e:
+            console.print(f"[red]❌ Error: {e}[/red]")
+            if config.debug:
+                import traceback
+                console.print(traceback.format_exc())
+            sys.exit(1)
+
+
+async def _run_resource_search(server: str, config: MCPClientConfig, prefix: str, limit: int):
+    """Find resources by URI prefix."""
+    from .client import MCPClient
+    
+    async with MCPClient(config) as client:
+        try:
+            console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
+            await client.connect(server)
+            
+            console.print(f"[blue]🔍 Searching resources with prefix: {prefix or '(any)'}[/blue]")
+            found = await client.find_resources(prefix, limit)
+            
+            table = Table(title=f"Resources ({len(found)})")
+            table.add_column("URI", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("MIME Type", style="yellow")
+            for resource in found:
+                table.add_row(str(resource.uri), resource.name, resource.mimeType or "")
+            console.print(table)
+            
+            if prefix and not client.resource_catalog().get(prefix):
+                match = await client.match_resource_template(prefix)
+                if match:
+                    template, variables = match
+                    console.print(f"[dim]Matches template {template.uriTemplate} with {variables}[/dim]")
                 
         except Exception as e:
             console.print(f"[red]❌ Error: {e}[/red]")
@@ -335,37 +646,217 @@ async def _run_resource_read(server: str, config: MCPClientConfig, uri: str):
             sys.exit(1)
 
 
-async def _run_prompt_get(server: str, config: MCPClientConfig, prompt_name: str, prompt_args: dict):
+async def _run_batch(server: str, config: MCPClientConfig, input_file, concurrency: int, output):
+    """Run calls from a JSONL stream, writing results as they complete."""
+    from .client import MCPClient
+    from .concurrency import iter_bounded
+    
+    # Results go to stdout by default, so progress goes to stderr
+    status = Console(stderr=True)
+    
+    async with MCPClient(config) as client:
+        try:
+            status.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
+            await client.connect(server)
+            
+            def calls():
+                for number, line in enumerate(input_file, 1):
+                    if line.strip():
+                        yield number, line
+            
+            async def execute(numbered_line):
+                number, line = numbered_line
+                record = {"line": number}
+                start = time.perf_counter()
+                try:
+                    call = json.loads(line)
+                    if not isinstance(call, dict):
+                        raise ValueError("Each line must be a JSON object")
+                    if "id" in call:
+                        record["id"] = call["id"]
+                    kind = record["type"] = call.get("type", "tool")
+                    if kind == "tool":
+                        result = await client.call_tool(call["name"], call.get("arguments") or {})
+                    elif kind == "resource":
+                        result = await client.read_resource(call.get("uri") or call["name"])
+                    elif kind == "prompt":
+                        result = await client.get_prompt(call["name"], call.get("arguments") or {})
+                    else:
+                        raise ValueError(f"Unknown call type: {kind}")
+                    record["success"] = not getattr(result, "isError", False)
+                    record["result"] = result.model_dump(mode="json", exclude_none=True)
+                except KeyError as e:
+                    record["success"] = False
+                    record["error"] = f"Missing field {e}"
+                except Exception as e:
+                    record["success"] = False
+                    record["error"] = str(e)
+                record["execution_time_ms"] = round((time.perf_counter() - start) * 1000, 2)
+                return record
+            
+            start = time.perf_counter()
+            completed = failed = 0
+            async for record in iter_bounded(calls(), execute, concurrency):
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+                completed += 1
+                failed += not record["success"]
+            
+            elapsed = time.perf_counter() - start
+            status.print(
+                f"[green]✅ {completed} calls in {elapsed:.2f}s "
+                f"({completed / elapsed if elapsed else 0:.1f}/s), {failed} failed[/green]"
+            )
+            
+        except Exception as e:
+            status.print(f"[red]❌ Error: {e}[/red]")
+            if config.debug:
+                import traceback
+                status.print(traceback.format_exc())
+            sys.exit(1)
+    
+    if failed:
+        sys.exit(1)
+
+
+async def _run_bench(
+    server: str,
+    config: MCPClientConfig,
+    kind: str,
+    name: str,
+    arguments: dict,
+    settings: dict,
+    output_format: str,
+    output: Optional[str]
+):
+    """Run a benchmark and report it."""
+    from .bench import run_benchmark
+    from .client import MCPClient
+    
+    # Measure the server itself: no caching, coalescing, hedging, breakers or session limit
+    config = config.model_copy(update={
+        "coalesce_requests": False,
+        "hedge_requests": False,
+        "adaptive_timeouts": False,
+        "circuit_breaker": False,
+        "max_concurrency": 0
+    })
+    quiet = output_format == 'json' and not output
+    
+    async with MCPClient(config) as client:
+        try:
+            if not quiet:
+                console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
+            await client.connect(server)
+            
+            async def operation():
+                if kind == 'tool':
+                    result = await client.call_tool(name, arguments, use_cache=False)
+                    if result.isError:
+                        text = " ".join(getattr(item, 'text', '') for item in result.content)
+                        raise RuntimeError(text or "Tool returned an error")
+                elif kind == 'resource':
+                    await client.read_resource(name)
+                else:
+                    await client.get_prompt(name, arguments)
+            
+            if not quiet:
+                console.print(f"[blue]⏱️  Benchmarking {kind} {name}...[/blue]")
+            result = await run_benchmark(
+                operation,
+                concurrency=settings["concurrency"],
+                duration=settings["duration"],
+                requests=settings["requests"],
+                rate=settings["rate"],
+                warmup=settings["warmup"]
+            )
+            report = {
+                "target": {"kind": kind, "name": name, "arguments": arguments, "server": server},
+                "settings": settings,
+                **result.summary()
+            }
+            
+            if output_format == 'json':
+                if output:
+                    with open(output, 'w') as f:
+                        json.dump(report, f, indent=2)
+                    console.print(f"[green]✅ Report saved to {output}[/green]")
+                else:
+                    click.echo(json.dumps(report, indent=2))
+            else:
+                _print_bench_report(report)
+                if output:
+                    with open(output, 'w') as f:
+                        json.dump(report, f, indent=2)
+                    console.print(f"[green]✅ Report saved to {output}[/green]")
+            
+        except Exception as e:
+            console.print(f"[red]❌ Error: {e}[/red]")
+            if config.debug:
+                import traceback
+                console.print(traceback.format_exc())
+            sys.exit(1)
+
+
+def _print_bench_report(report: dict) -> None:
+    """Print a benchmark report as a table."""
+    table = Table(title=f"Benchmark: {report['target']['kind']} {report['target']['name']}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green", justify="right")
+    table.add_row("Requests", str(report["requests"]))
+    table.add_row("Duration", f"{report['duration_s']:.2f}s")
+    table.add_row("Throughput", f"{report['throughput_rps']:.1f} req/s")
+    table.add_row("Errors", f"{report['errors']} ({report['error_rate']:.2%})")
+    for metric, value in report["latency_ms"].items():
+        table.add_row(f"Latency {metric}", f"{value:.2f}ms")
+    console.print(table)
+    
+    for message, count in report["error_messages"].items():
+        console.print(f"[red]{count} x {message}[/red]")
+
+
+async def _run_prompt_get(
+    server: str,
+    options: dict,
+    prompt_name: str,
+    prompt_args: dict,
+    show_timings: bool = False,
+    use_daemon: bool = True
+):
     """Get a specific prompt."""
+    if use_daemon:
+        reply = await _daemon_call(server, options, {"op": "prompt", "name": prompt_name, "arguments": prompt_args})
+        if reply is not None:
+            console.print(f"[blue]💬 Getting prompt: {prompt_name} (via daemon)[/blue]")
+            result = reply["result"]
+            timings = Timings.from_dict(reply["timings"])
+            console.print(f"[green]✅ Prompt '{prompt_name}' retrieved successfully:[/green]")
+            with timings.phase("parse"):
+                _print_prompt_result(result)
+            if show_timings:
+                _print_timings(timings)
+            return
+    
+    from .client import MCPClient
+    
+    config = _build_client_config(options)
     async with MCPClient(config) as client:
         try:
             console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
             await client.connect(server)
             
             console.print(f"[blue]💬 Getting prompt: {prompt_name}[/blue]")
-            result = await client.get_prompt(prompt_name, prompt_args)
+            timings = Timings(client.timings.phases)
+            result = await client.get_prompt(prompt_name, prompt_args, timings=timings)
             
             console.print(f"[green]✅ Prompt '{prompt_name}' retrieved successfully:[/green]")
             
             # Display prompt messages
-            if hasattr(result, 'messages') and result.messages:
-                for i, message in enumerate(result.messages):
-                    role = getattr(message, 'role', 'unknown')
-                    content = getattr(message, 'content', '')
-                    
-                    if hasattr(content, 'text'):
-                        content_text = content.text
-                    elif isinstance(content, str):
-                        content_text = content
-                    else:
-                        content_text = str(content)
-                        
-                    console.print(Panel(
-                        content_text,
-                        title=f"Message {i+1} ({role})"
-                    ))
-            else:
-                console.print(Panel(str(result), title="Result"))
+            with timings.phase("parse"):
+                _print_prompt_result(_result_json(result))
+            
+            if show_timings:
+                _print_timings(timings)
                 
         except Exception as e:
             console.print(f"[red]❌ Error: {e}[/red]")
@@ -375,15 +866,183 @@ async def _run_prompt_get(server: str, config: MCPClientConfig, prompt_name: str
             sys.exit(1)
 
 
-async def _run_inspect(server_path: str, config: MCPClientConfig, output: Optional[str], output_format: str):
+async def _load_capabilities(client: MCPClient, server: str, config: MCPClientConfig, refresh: bool) -> None:
+    """
+    Fill the client's capability lists from the server's cached snapshot,
+    or connect, discover them and update the snapshot.
+    """
+    snapshots = get_capability_snapshots()
+    entry = None if refresh else snapshots.load(server, config.transport_type)
+    if entry is not None:
+        age = _format_age(time.time() - entry["saved_at"])
+        console.print(f"[blue]📦 Using capabilities cached {age} ago (--refresh to rediscover)[/blue]")
+        client.restore_capabilities(entry["capabilities"])
+        return
+    
+    console.print(f"[blue]🔄 Connecting to server: {server}[/blue]")
+    await client.connect(server)
+    
+    console.print("[blue]🔍 Discovering server capabilities...[/blue]")
+    await client.discover_capabilities(refresh=refresh)
+    _print_discovery_timings(client)
+    
+    try:
+        snapshots.save(server, config.transport_type, client.capabilities_snapshot())
+    except OSError as e:
+        console.print(f"[yellow]⚠️ Could not cache capabilities: {e}[/yellow]")
+
+
+def _format_age(seconds: float) -> str:
+    """Format a duration as a short age (45s, 12m, 3h, 2d)."""
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+
+def _check_tool_arguments(server: str, transport: str, tool_name: str, tool_args: dict, raw_args: dict) -> dict:
+    """
+    Validate a tool call against the server's cached snapshot, if there is one.
+    
+    Exits on an unknown tool or missing required arguments. Values of
+    string parameters are passed as typed rather than parsed as JSON, so
+    e.g. zip=02139 stays a string.
+    
+    Returns:
+        The arguments to send
+    """
+    entry = get_capability_snapshots().load(server, transport)
+    if entry is None:
+        return tool_args
+    
+    tools = {t["name"]: t for t in entry["capabilities"].get("tools") or []}
+    tool = tools.get(tool_name)
+    if tool is None:
+        console.print(f"[red]❌ Unknown tool '{tool_name}'. Available: {', '.join(sorted(tools)) or 'none'}[/red]")
+        console.print("[dim]Checked against cached capabilities; use --refresh if the server changed[/dim]")
+        sys.exit(1)
+    
+    schema = tool.get("inputSchema") or {}
+    properties = schema.get("properties") or {}
+    tool_args = dict(tool_args)
+    for key, value in raw_args.items():
+        if (properties.get(key) or {}).get("type") == "string":
+            tool_args[key] = value
+    
+    missing = [name for name in schema.get("required") or [] if name not in tool_args]
+    if missing:
+        console.print(f"[red]❌ Tool '{tool_name}' requires: {', '.join(missing)}[/red]")
+        sys.exit(1)
+    
+    unknown = [key for key in tool_args if properties and key not in properties]
+    if unknown:
+        if schema.get("additionalProperties") is False:
+            console.print(f"[red]❌ Tool '{tool_name}' does not accept: {', '.join(unknown)}[/red]")
+            sys.exit(1)
+        console.print(f"[yellow]Warning: Tool '{tool_name}' does not declare: {', '.join(unknown)}[/yellow]")
+    return tool_args
+
+
+async def _daemon_call(server: str, options: dict, request: dict) -> Optional[dict]:
+    """
+    Send a request for a server to the CLI daemon.
+    
+    Returns:
+        The daemon's reply, or None if no daemon is running
+    """
+    from .daemon_client import daemon_request
+    
+    if not server.startswith(("http://", "https://")):
+        server = str(Path(server).resolve())
+    request = {
+        **request,
+        "server": server,
+        "transport": _transport_type(options),
+        "client_options": {key: options[key] for key in ("timeout", "http2", "debug") if key in options}
+    }
+    try:
+        reply = await daemon_request(request)
+    except (OSError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+        console.print(f"[yellow]⚠️ Daemon unreachable ({e}), connecting directly[/yellow]")
+        return None
+    if reply is not None and not reply["ok"]:
+        console.print(f"[red]❌ Error: {reply['error']}[/red]")
+        sys.exit(1)
+    return reply
+
+
+def _result_json(result) -> dict:
+    """A result model in the JSON form the daemon replies with."""
+    return result.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def _base64_size(data: str) -> int:
+    """Decoded size of a base64 payload, without decoding it."""
+    data = "".join(data.split())
+    return len(data) * 3 // 4 - data[-2:].count("=")
+
+
+def _print_tool_result(result: dict):
+    """Display the content of a tool result (as JSON, see _result_json)."""
+    if result.get('content'):
+        for content_item in result['content']:
+            if 'text' in content_item:
+                console.print(Panel(content_item['text'], title="Result"))
+            elif 'data' in content_item:
+                size = _base64_size(content_item['data'])
+                mime_type = content_item.get('mimeType') or 'application/octet-stream'
+                console.print(Panel(f"Binary data ({size} bytes)", title=f"Data ({mime_type})"))
+    else:
+        console.print(Panel(json.dumps(result), title="Result"))
+
+
+def _print_resource_result(result: dict):
+    """Display the contents of a resource read (as JSON, see _result_json)."""
+    if result.get('contents'):
+        for content_item in result['contents']:
+            if 'text' in content_item:
+                console.print(Panel(content_item['text'], title=f"Content ({content_item.get('mimeType', 'text')})"))
+            elif 'blob' in content_item:
+                console.print(Panel(f"Binary data ({_base64_size(content_item['blob'])} bytes)", title="Binary Content"))
+    else:
+        console.print(Panel(json.dumps(result), title="Result"))
+
+
+def _print_prompt_result(result: dict):
+    """Display the messages of a prompt (as JSON, see _result_json)."""
+    if result.get('messages'):
+        for i, message in enumerate(result['messages']):
+            role = message.get('role', 'unknown')
+            content = message.get('content', '')
+            
+            if isinstance(content, dict) and 'text' in content:
+                content_text = content['text']
+            elif isinstance(content, str):
+                content_text = content
+            else:
+                content_text = json.dumps(content)
+                
+            console.print(Panel(
+                content_text,
+                title=f"Message {i+1} ({role})"
+            ))
+    else:
+        console.print(Panel(json.dumps(result), title="Result"))
+
+
+async def _run_inspect(
+    server_path: str,
+    config: MCPClientConfig,
+    output: Optional[str],
+    output_format: str,
+    refresh: bool = False
+):
     """Inspect server capabilities and optionally save to file."""
+    from .client import MCPClient
+    
     async with MCPClient(config) as client:
         try:
-            console.print(f"[blue]🔄 Connecting to server: {server_path}[/blue]")
-            await client.connect(server_path)
-            
-            console.print("[blue]🔍 Discovering server capabilities...[/blue]")
-            await client.discover_capabilities()
+            await _load_capabilities(client, server_path, config, refresh)
             
             # Collect capabilities data
             capabilities_data = {
@@ -437,8 +1096,59 @@ async def _run_inspect(server_path: str, config: MCPClientConfig, output: Option
             sys.exit(1)
 
 
-def _load_config_file(config_path: str) -> MCPClientConfig:
-    """Load configuration from a file."""
+def _print_timings(timings: Timings) -> None:
+    """Print a per-phase timing breakdown."""
+    phases = timings.to_dict()
+    total = phases.pop("total")
+    breakdown = ", ".join(f"{phase} {ms:.1f}ms" for phase, ms in phases.items())
+    console.print(f"[dim]Timings: {breakdown} (total {total:.1f}ms)[/dim]")
+
+
+def _print_discovery_timings(client: MCPClient) -> None:
+    """Print per-category discovery latencies."""
+    timings = client.discovery_timings
+    if timings:
+        console.print(
+            f"[dim]Discovery: resources {timings['resources']:.1f}ms, "
+            f"tools {timings['tools']:.1f}ms, prompts {timings['prompts']:.1f}ms "
+            f"(total {timings['total']:.1f}ms)[/dim]"
+        )
+
+
+def _config_options(ctx) -> dict:
+    """
+    Client configuration fields from the configuration file or the group
+    options, read without importing the client.
+    """
+    if 'options' not in ctx.obj:
+        if ctx.obj['config_file']:
+            ctx.obj['options'] = _load_config_file(ctx.obj['config_file'])
+        else:
+            ctx.obj['options'] = ctx.obj['config_options']
+    return ctx.obj['options']
+
+
+def _transport_type(options: dict) -> str:
+    """Transport of the client configuration fields (MCPClientConfig's default if unset)."""
+    return options.get('transport_type') or 'stdio'
+
+
+def _build_client_config(options: dict) -> MCPClientConfig:
+    """Build the client configuration from its fields."""
+    from .client import MCPClientConfig
+    
+    return MCPClientConfig(**options)
+
+
+def _client_config(ctx) -> MCPClientConfig:
+    """Build the client configuration from the group options on first use."""
+    if 'config' not in ctx.obj:
+        ctx.obj['config'] = _build_client_config(_config_options(ctx))
+    return ctx.obj['config']
+
+
+def _load_config_file(config_path: str) -> dict:
+    """Load configuration fields from a file."""
     path = Path(config_path)
     
     if not path.exists():
@@ -454,7 +1164,7 @@ def _load_config_file(config_path: str) -> MCPClientConfig:
     else:
         raise ValueError(f"Unsupported configuration file format: {path.suffix}")
     
-    return MCPClientConfig(**config_data)
+    return config_data or {}
 
 
 def main():
@@ -0,0 +1,971 @@
+"""
+Session pooling for MCP servers.
+
+This module keeps connected MCPClient sessions alive between requests so
+that API routes can reuse a warm session instead of spawning the server
+process and running the initialize handshake on every call.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .client import MCPClient, MCPClientConfig
+from .latency import get_latency_tracker
+
+
+logger = logging.getLogger("mcp_client.pool")
+
+# Loads stored tool latencies (ms, oldest first) for a server id, keyed by tool
+LatencyHistoryLoader = Callable[[int], Dict[str, List[float]]]
+
+
+class SessionPoolConfig(BaseModel):
+    """Sizing and lifecycle settings for a session pool."""
+
+    min_size: int = 0
+    max_size: int = 4
+    warm_spares: int = 0  # idle, initialized sessions kept ready beyond those in use
+    idle_timeout: float = 300.0  # seconds an idle session is kept open
+    health_check_after: float = 30.0  # idle seconds after which a session is pinged before reuse
+    health_check_timeout: float = 5.0
+    acquire_timeout: float = 30.0
+
+
+class ReplicaConfig(BaseModel):
+    """Load balancing and outlier ejection settings for server replicas."""
+
+    error_rate_threshold: float = 0.5  # share of failed requests that ejects a replica
+    min_requests: int = 5  # requests in the window before the error rate is trusted
+    window: float = 30.0  # seconds of request outcomes considered
+    ejection_time: float = 30.0  # base ejection period, doubled on each repeat
+
+
+# Server configuration fields that determine how sessions are opened
+SERVER_CONFIG_KEYS = (
+    "server_command",
+    "server_args",
+    "server_env",
+    "server_type",
+    "server_path",
+    "server_url",
+    "client_options",
+    "replicas",
+)
+
+
+def server_config_from_model(server) -> Dict[str, Any]:
+    """Build a server configuration dictionary from an MCPServer row."""
+    return {
+        "server_command": server.server_command,
+        "server_args": server.server_args or [],
+        "server_env": server.server_env or {},
+        "server_type": server.server_type,
+        "server_path": server.server_path,
+        "server_url": server.server_url,
+        "client_options": server.client_options or {},
+        "replicas": getattr(server, "replicas", None) or []
+    }
+
+
+def normalize_server_config(server_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the connection fields of a server configuration."""
+    return {key: server_config.get(key) for key in SERVER_CONFIG_KEYS}
+
+
+def pool_config_from_options(
+    client_options: Optional[Dict[str, Any]],
+    default: Optional[SessionPoolConfig] = None
+) -> SessionPoolConfig:
+    """Build pool settings from the "pool" section of MCPServer.client_options."""
+    base = (default or SessionPoolConfig()).model_dump()
+    base.update((client_options or {}).get("pool") or {})
+    return SessionPoolConfig(**base)
+
+
+def replica_config_from_options(client_options: Optional[Dict[str, Any]]) -> ReplicaConfig:
+    """Build replica settings from the "replicas" section of MCPServer.client_options."""
+    return ReplicaConfig(**((client_options or {}).get("replicas") or {}))
+
+
+def replica_server_configs(server_id: int, server_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Expand a server configuration into one configuration per replica.
+
+    The base configuration is the first replica; each entry of "replicas"
+    adds another by overriding connection fields of the base. All replicas
+    share one cache identity so that result caching, coalescing and
+    resource mirroring span the logical server.
+    """
+    base = {key: value for key, value in server_config.items() if key != "replicas"}
+    shared_key = f"replicas:{server_id}:{config_hash(server_config)}"
+    configs = []
+    for replica in [{}] + list(server_config.get("replicas") or []):
+        replica_config = dict(base)
+        replica_config.update({k: v for k, v in replica.items() if k in SERVER_CONFIG_KEYS and k != "replicas"})
+        replica_config["client_options"] = {**(replica_config.get("client_options") or {}), "server_key": shared_key}
+        configs.append(replica_config)
+    return configs
+
+
+def config_hash(server_config: Dict[str, Any]) -> str:
+    """Return a stable hash of a server configuration."""
+    payload = json.dumps(server_config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def build_client_config(server_config: Dict[str, Any], timeout: int = 30) -> MCPClientConfig:
+    """
+    Build an MCPClientConfig from a server configuration dictionary.
+
+    Top-level keys of client_options that name MCPClientConfig fields
+    (e.g. max_concurrency) override the defaults.
+    """
+    overrides = {
+        key: value
+        for key, value in (server_config.get("client_options") or {}).items()
+        if key in MCPClientConfig.model_fields
+    }
+    settings = {
+        "server_command": server_config.get("server_command"),
+        "server_args": server_config.get("server_args") or [],
+        "server_env": server_config.get("server_env") or {},
+        "transport_type": server_config.get("server_type") or "stdio",
+        "timeout": timeout,
+        "debug": False
+    }
+    settings.update(overrides)
+    return MCPClientConfig(**settings)
+
+
+class PooledSession:
+    """
+    A connected MCPClient owned by a dedicated background task.
+
+    The MCP transports open anyio task groups that must be exited by the task
+    that entered them, so each pooled session lives inside its own task for
+    its whole lifetime instead of inside the request that happened to create it.
+    """
+
+    def __init__(self, client_config: MCPClientConfig, server_config: Dict[str, Any]):
+        self.client = MCPClient(client_config)
+        self.server_config = server_config
+        self.in_use = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self.failed = False  # set when a heartbeat fails; the session is discarded on release
+
+    async def start(self) -> None:
+        """Start the owner task and wait until the session is initialized."""
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with self.client:
+                await self.client.connect_server(self.server_config)
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.warning(f"Pooled session terminated: {e}")
+        finally:
+            self._ready.set()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the owner task is still running."""
+        return (
+            self._task is not None and not self._task.done()
+            and not self._closing.is_set() and not self.failed
+        )
+
+    @property
+    def idle_for(self) -> float:
+        """Seconds since the session was last released."""
+        return time.monotonic() - self.last_used
+
+    async def ping(self, timeout: float) -> Optional[float]:
+        """
+        Ping the server.
+
+        Returns:
+            Round-trip latency in milliseconds, or None if the session is unusable
+        """
+        if not self.alive:
+            return None
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.client.ping(), timeout)
+            return (time.perf_counter() - start) * 1000
+        except Exception as e:
+            logger.debug(f"Health check failed: {e}")
+            return None
+
+    async def check_health(self, timeout: float) -> bool:
+        """
+        Ping the server and report whether the session is usable.
+
+        A session that fails is marked failed at once, so callers still
+        sharing it finish but no new ones are given it.
+        """
+        healthy = await self.ping(timeout) is not None
+        if not healthy:
+            self.failed = True
+        return healthy
+
+    async def close(self) -> None:
+        """Signal the owner task to close the session and wait for it."""
+        self._closing.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class SessionPool:
+    """
+    Pool of warm sessions for a single server configuration.
+
+    MCP sessions multiplex concurrent JSON-RPC requests, so a session is
+    shared by several callers up to the client's max_concurrency before
+    another session is opened. Each client's request gate then queues
+    requests in FIFO order once the session is saturated.
+    """
+
+    def __init__(
+        self,
+        server_id: int,
+        server_config: Dict[str, Any],
+        config: Optional[SessionPoolConfig] = None
+    ):
+        """
+        Initialize the session pool.
+
+        Args:
+            server_id: Database id of the MCP server
+            server_config: Server connection configuration
+            config: Pool sizing and lifecycle settings
+        """
+        self.server_id = server_id
+        self.server_config = server_config
+        self.config = config or SessionPoolConfig()
+        self.client_config = build_client_config(server_config)
+        self.sessions: List[PooledSession] = []
+        self._pending = 0
+        self._closed = False
+        self._condition = asyncio.Condition()
+        self._reaper: Optional[asyncio.Task] = None
+        self._replenisher: Optional[asyncio.Task] = None
+        self.available = True  # False while the supervisor is restarting the server
+        self.replica: Optional[int] = None  # index within a ReplicaSet, if any
+        self.hedge_group: Optional["ReplicaSet"] = None  # hedges go to other replicas when set
+        self.latency_history: Optional[LatencyHistoryLoader] = None  # seeds tool deadlines
+        self._latency_seeded = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been closed."""
+        return self._closed
+
+    def start(self) -> None:
+        """Start background maintenance and begin opening warm sessions."""
+        self._ensure_reaper()
+        self._schedule_replenish()
+
+    async def checkout(self) -> MCPClient:
+        """
+        Check out a client for long-lived use, e.g. by an agent.
+
+        The client must be returned with checkin().
+        """
+        session = await self._checkout()
+        return session.client
+
+    async def checkin(self, client: MCPClient, healthy: bool = True) -> None:
+        """Return a client obtained from checkout()."""
+        for session in self.sessions:
+            if session.client is client:
+                await self._release(session, healthy)
+                return
+
+    def is_live(self, client: MCPClient) -> bool:
+        """Whether a checked-out client's session is still usable."""
+        return any(session.client is client and session.alive for session in self.sessions)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[MCPClient]:
+        """
+        Check out a connected client for the duration of the context.
+
+        If the body raises, the session is pinged before it is returned to
+        the pool so that broken transports are discarded instead of reused.
+        """
+        session = await self._checkout()
+        healthy = True
+        try:
+            yield session.client
+        except Exception:
+            healthy = await session.check_health(self.config.health_check_timeout)
+            raise
+        finally:
+            await self._release(session, healthy)
+
+    @asynccontextmanager
+    async def acquire_alternate(self, exclude: Optional[MCPClient] = None) -> AsyncIterator[MCPClient]:
+        """
+        Check out a live session other than exclude, for a hedged request.
+
+        Never waits or opens a session: a hedge on a cold or saturated pool
+        would only add load.
+        """
+        session = await self._checkout(exclude=exclude, spare_only=True)
+        healthy = True
+        try:
+            yield session.client
+        except Exception:
+            healthy = await session.check_health(self.config.health_check_timeout)
+            raise
+        finally:
+            await self._release(session, healthy)
+
+    def _hedge_source(self, client: MCPClient):
+        if self.hedge_group is not None:
+            return self.hedge_group.acquire_alternate(self)
+        return self.acquire_alternate(client)
+
+    async def _checkout(self, exclude: Optional[MCPClient] = None, spare_only: bool = False) -> PooledSession:
+        deadline = time.monotonic() + self.config.acquire_timeout
+
+        while True:
+            if self._closed:
+                raise RuntimeError("Session pool is closed")
+            if not self.available:
+                raise RuntimeError(f"Server {self.server_id} is unavailable while it is being restarted")
+            self._ensure_reaper()
+
+            candidate = None
+            create = False
+            async with self._condition:
+                while True:
+                    self._drop_dead()
+                    idle = [s for s in self.sessions if s.in_use == 0 and s.alive and s.client is not exclude]
+                    if idle:
+                        # Most recently used first so cold sessions can idle out
+                        candidate = max(idle, key=lambda s: s.last_used)
+                        candidate.in_use += 1
+                        break
+                    shareable = [
+                        s for s in self.sessions
+                        if s.alive and s.in_use < self._session_capacity and s.client is not exclude
+                    ]
+                    if shareable:
+                        candidate = min(shareable, key=lambda s: s.in_use)
+                        candidate.in_use += 1
+                        break
+                    if spare_only:
+                        raise RuntimeError(f"No spare session for server {self.server_id}")
+                    if len(self.sessions) + self._pending < self.config.max_size:
+                        self._pending += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out waiting for a session for server {self.server_id}"
+                        )
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+
+            if create:
+                session = await self._open_session(checked_out=True)
+                self._schedule_replenish()
+                return session
+
+            if candidate.idle_for >= self.config.health_check_after:
+                if not await candidate.check_health(self.config.health_check_timeout):
+                    await self._release(candidate, healthy=False)
+                    continue
+            self._schedule_replenish()
+            return candidate
+
+    async def _open_session(self, checked_out: bool) -> PooledSession:
+        """Open a new session; the caller must have reserved a pending slot."""
+        session = PooledSession(self.client_config, self.server_config)
+        try:
+            await session.start()
+        except BaseException:
+            async with self._condition:
+                self._pending -= 1
+                self._condition.notify_all()
+            raise
+
+        session.client.hedge_source = lambda: self._hedge_source(session.client)
+        self._seed_latency(session.client)
+
+        async with self._condition:
+            self._pending -= 1
+            if checked_out:
+                session.in_use = 1
+            self.sessions.append(session)
+            self._condition.notify_all()
+        logger.debug(f"Opened pooled session for server {self.server_id}")
+        return session
+
+    def _seed_latency(self, client: MCPClient) -> None:
+        """Seed the latency tracker from stored history once per pool."""
+        if self._latency_seeded or self.latency_history is None or not client.server_key:
+            return
+        self._latency_seeded = True
+        try:
+            history = self.latency_history(self.server_id)
+        except Exception as e:
+            logger.warning(f"Failed to load latency history for server {self.server_id}: {e}")
+            return
+        tracker = get_latency_tracker()
+        for tool_name, samples in history.items():
+            tracker.seed(client.server_key, tool_name, samples)
+
+    async def _release(self, session: PooledSession, healthy: bool = True) -> None:
+        discard = False
+        async with self._condition:
+            session.in_use = max(0, session.in_use - 1)
+            session.last_used = time.monotonic()
+            if (not healthy or not session.alive or self._closed) and session.in_use == 0:
+                if session in self.sessions:
+                    self.sessions.remove(session)
+                discard = True
+            self._condition.notify_all()
+        if discard:
+            await session.close()
+
+    def _drop_dead(self) -> None:
+        """Forget sessions whose owner task has exited."""
+        dead = [s for s in self.sessions if not s.alive and s.in_use == 0]
+        for session in dead:
+            self.sessions.remove(session)
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        interval = max(1.0, min(self.config.idle_timeout / 2, 30.0))
+        while not self._closed:
+            try:
+                await self.maintain()
+            except Exception as e:
+                logger.warning(f"Session pool maintenance failed: {e}")
+            await asyncio.sleep(interval)
+
+    @property
+    def _session_capacity(self) -> int:
+        """Concurrent users allowed per session."""
+        limit = self.client_config.max_concurrency
+        return limit if limit > 0 else 2 ** 31
+
+    def _target_size(self) -> int:
+        """Sessions to keep open: those in use plus warm spares, within min/max size."""
+        busy = sum(1 for s in self.sessions if s.in_use)
+        target = max(self.config.min_size, busy + self.config.warm_spares)
+        return min(self.config.max_size, target)
+
+    def _schedule_replenish(self) -> None:
+        """Open missing warm sessions in the background."""
+        if self._closed or not self.available:
+            return
+        if self._target_size() <= len(self.sessions) + self._pending:
+            return
+        if self._replenisher is None or self._replenisher.done():
+            self._replenisher = asyncio.create_task(self._top_up())
+
+    async def _top_up(self) -> None:
+        """Open sessions until the pool reaches its target size."""
+        # While the supervisor restarts the server, it alone opens sessions
+        if self._closed or not self.available:
+            return
+        async with self._condition:
+            self._drop_dead()
+            missing = max(0, self._target_size() - len(self.sessions) - self._pending)
+            self._pending += missing
+
+        for _ in range(missing):
+            try:
+                await self._open_session(checked_out=False)
+            except Exception as e:
+                logger.warning(f"Failed to pre-open session for server {self.server_id}: {e}")
+
+    async def heartbeat(self, timeout: float) -> Tuple[int, List[float]]:
+        """
+        Ping every live session and discard the ones that do not answer.
+
+        Returns:
+            The number of sessions that failed or had died, and the latencies
+            in milliseconds of those that answered
+        """
+        async with self._condition:
+            dead = [s for s in self.sessions if not s.alive]
+            self._drop_dead()
+            live = [s for s in self.sessions if s.alive]
+
+        results = await asyncio.gather(*(s.ping(timeout) for s in live))
+        latencies = [latency for latency in results if latency is not None]
+        failed = [s for s, latency in zip(live, results) if latency is None]
+
+        discarded = []
+        async with self._condition:
+            for session in failed:
+                session.failed = True
+                # Sessions still in use are discarded when released
+                if session.in_use == 0 and session in self.sessions:
+                    self.sessions.remove(session)
+                    discarded.append(session)
+            self._condition.notify_all()
+        await asyncio.gather(*(s.close() for s in discarded), return_exceptions=True)
+
+        return len(dead) + len(failed), latencies
+
+    async def restart(self) -> None:
+        """
+        Replace every session with a freshly started one.
+
+        Raises if the server cannot be started, leaving the pool empty.
+        """
+        async with self._condition:
+            for session in self.sessions:
+                session.failed = True
+            idle = [s for s in self.sessions if s.in_use == 0]
+            for session in idle:
+                self.sessions.remove(session)
+            self._pending += 1
+            self._condition.notify_all()
+        await asyncio.gather(*(s.close() for s in idle), return_exceptions=True)
+        await self._open_session(checked_out=False)
+
+    async def maintain(self) -> None:
+        """Evict idle sessions beyond the target size and top the pool back up."""
+        expired = []
+        async with self._condition:
+            self._drop_dead()
+            # Sessions holding resource subscriptions keep the mirror fresh
+            idle = sorted(
+                (s for s in self.sessions if s.in_use == 0 and not s.client.subscriptions),
+                key=lambda s: s.last_used
+            )
+            excess = len(self.sessions) - self._target_size()
+            for session in idle:
+                if excess <= 0:
+                    break
+                if session.idle_for >= self.config.idle_timeout:
+                    self.sessions.remove(session)
+                    expired.append(session)
+                    excess -= 1
+
+        for session in expired:
+            logger.debug(f"Evicting idle session for server {self.server_id}")
+            await session.close()
+
+        await self._top_up()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "server_id": self.server_id,
+            "replica": self.replica,
+            "available": self.available,
+            "size": len(self.sessions),
+            "in_use": sum(1 for s in self.sessions if s.in_use),
+            "idle": sum(1 for s in self.sessions if not s.in_use),
+            "pending": self._pending,
+            "min_size": self.config.min_size,
+            "max_size": self.config.max_size,
+            "warm_spares": self.config.warm_spares,
+            "sessions": [
+                {
+                    "leases": s.in_use,
+                    "subscriptions": len(s.client.subscriptions),
+                    **s.client.request_gate.stats()
+                }
+                for s in self.sessions
+            ]
+        }
+
+    async def subscribe_resource(self, uri: str) -> MCPClient:
+        """
+        Subscribe one pooled session to a resource.
+
+        Returns:
+            The subscribed client
+        """
+        for session in self.sessions:
+            if session.alive and uri in session.client.subscriptions:
+                return session.client
+        async with self.acquire() as client:
+            await client.subscribe_resource(uri)
+            return client
+
+    async def unsubscribe_resource(self, uri: str) -> bool:
+        """
+        Unsubscribe whichever pooled session holds a resource subscription.
+
+        Returns:
+            Whether a subscription was found
+        """
+        for session in list(self.sessions):
+            if uri in session.client.subscriptions:
+                await session.client.unsubscribe_resource(uri)
+                return True
+        return False
+
+    async def close(self) -> None:
+        """Close the pool and all idle sessions; busy sessions close on release."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+        if self._replenisher is not None:
+            self._replenisher.cancel()
+        async with self._condition:
+            idle = [s for s in self.sessions if s.in_use == 0]
+            for session in idle:
+                self.sessions.remove(session)
+            self._condition.notify_all()
+        await asyncio.gather(*(s.close() for s in idle), return_exceptions=True)
+
+
+class Replica:
+    """Load and error tracking for one replica of a logical server."""
+
+    def __init__(self, pool: SessionPool):
+        self.pool = pool
+        self.outstanding = 0
+        self.picks = 0
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.ejected_until = 0.0
+        self.ejections = 0
+
+    @property
+    def ejected(self) -> bool:
+        """Whether the replica is currently ejected from balancing."""
+        return time.monotonic() < self.ejected_until
+
+    @property
+    def usable(self) -> bool:
+        """Whether the replica's pool can take requests."""
+        return self.pool.available and not self.pool.closed
+
+    def error_rate(self, window: float) -> Tuple[float, int]:
+        """Error rate and request count over the last window seconds."""
+        cutoff = time.monotonic() - window
+        while self.outcomes and self.outcomes[0][0] < cutoff:
+            self.outcomes.popleft()
+        total = len(self.outcomes)
+        errors = sum(1 for _, ok in self.outcomes if not ok)
+        return (errors / total if total else 0.0), total
+
+
+class ReplicaSet:
+    """
+    Session pools for the replicas of one logical server.
+
+    Each request goes to the usable replica with the fewest outstanding
+    requests. A replica whose error rate over the recent window crosses the
+    threshold is ejected for a period that doubles on each repeat, unless it
+    is the last usable one.
+    """
+
+    def __init__(self, server_id: int, pools: List[SessionPool], config: Optional[ReplicaConfig] = None):
+        """
+        Initialize the replica set.
+
+        Args:
+            server_id: Database id of the logical MCP server
+            pools: One session pool per replica
+            config: Balancing and ejection settings
+        """
+        self.server_id = server_id
+        self.config = config or ReplicaConfig()
+        self.replicas = [Replica(pool) for pool in pools]
+        for index, pool in enumerate(pools):
+            pool.replica = index
+            pool.hedge_group = self
+
+    def pick(self) -> Replica:
+        """Choose the replica with the fewest outstanding requests."""
+        candidates = [r for r in self.replicas if r.usable and not r.ejected]
+        if not candidates:
+            # Fail open rather than refuse requests outright
+            candidates = [r for r in self.replicas if r.usable] or self.replicas
+        replica = min(candidates, key=lambda r: (r.outstanding, r.picks))
+        replica.picks += 1
+        return replica
+
+    def _record(self, replica: Replica, ok: bool) -> None:
+        replica.outcomes.append((time.monotonic(), ok))
+        if ok or replica.ejected:
+            return
+        rate, total = replica.error_rate(self.config.window)
+        if total < self.config.min_requests or rate < self.config.error_rate_threshold:
+            return
+        others = [r for r in self.replicas if r is not replica and r.usable and not r.ejected]
+        if not others:
+            return
+        period = self.config.ejection_time * (2 ** min(replica.ejections, 5))
+        replica.ejected_until = time.monotonic() + period
+        replica.ejections += 1
+        replica.outcomes.clear()
+        logger.warning(
+            f"Ejecting replica {replica.pool.replica} of server {self.server_id} "
+            f"for {period:.0f}s (error rate {rate:.0%})"
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[MCPClient]:
+        """Check out a client from the least-loaded replica for the duration of the context."""
+        replica = self.pick()
+        replica.outstanding += 1
+        ok = False
+        try:
+            async with replica.pool.acquire() as client:
+                yield client
+            ok = True
+        finally:
+            replica.outstanding -= 1
+            self._record(replica, ok)
+
+    @asynccontextmanager
+    async def acquire_alternate(self, exclude: SessionPool) -> AsyncIterator[MCPClient]:
+        """Check out a live session on a replica other than exclude, for a hedged request."""
+        others = [r for r in self.replicas if r.pool is not exclude and r.usable and not r.ejected]
+        if not others:
+            raise RuntimeError(f"No other replica of server {self.server_id} to hedge on")
+        replica = min(others, key=lambda r: (r.outstanding, r.picks))
+        replica.outstanding += 1
+        try:
+            async with replica.pool.acquire_alternate() as client:
+                yield client
+        finally:
+            replica.outstanding -= 1
+
+    async def checkout(self) -> MCPClient:
+        """Check out a client for long-lived use from the least-loaded replica."""
+        return await self.pick().pool.checkout()
+
+    async def checkin(self, client: Union[MCPClient, "ReplicaClient"], healthy: bool = True) -> None:
+        """Return a client obtained from checkout()."""
+        client = getattr(client, "primary", client)
+        for replica in self.replicas:
+            if any(session.client is client for session in replica.pool.sessions):
+                await replica.pool.checkin(client, healthy)
+                return
+
+    def is_live(self, client: Union[MCPClient, "ReplicaClient"]) -> bool:
+        """Whether a checked-out client's session is still usable."""
+        client = getattr(client, "primary", client)
+        return any(replica.pool.is_live(client) for replica in self.replicas)
+
+    def start(self) -> None:
+        """Start every replica's pool."""
+        for replica in self.replicas:
+            replica.pool.start()
+
+    async def subscribe_resource(self, uri: str) -> MCPClient:
+        """Subscribe one session, on the least-loaded replica, to a resource."""
+        for replica in self.replicas:
+            for session in replica.pool.sessions:
+                if session.alive and uri in session.client.subscriptions:
+                    return session.client
+        return await self.pick().pool.subscribe_resource(uri)
+
+    async def unsubscribe_resource(self, uri: str) -> bool:
+        """Unsubscribe whichever replica session holds a resource subscription."""
+        for replica in self.replicas:
+            if await replica.pool.unsubscribe_resource(uri):
+                return True
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Get balancing statistics per replica."""
+        replicas = []
+        for replica in self.replicas:
+            rate, total = replica.error_rate(self.config.window)
+            replicas.append({
+                "replica": replica.pool.replica,
+                "available": replica.usable,
+                "ejected": replica.ejected,
+                "ejections": replica.ejections,
+                "outstanding": replica.outstanding,
+                "requests": replica.picks,
+                "error_rate": round(rate, 3),
+                "window_requests": total
+            })
+        return {"server_id": self.server_id, "replicas": replicas}
+
+    async def close(self) -> None:
+        """Close every replica's pool."""
+        await asyncio.gather(*(r.pool.close() for r in self.replicas), return_exceptions=True)
+
+
+class ReplicaClient:
+    """
+    MCPClient facade that balances each request across server replicas.
+
+    Capability state (discovered tools, snapshots, list_changed handling)
+    comes from a primary session checked out of one replica, while tool
+    calls, resource reads and prompts are routed per request, so a
+    long-lived ToolManager benefits from balancing too.
+    """
+
+    def __init__(self, replicas: ReplicaSet, primary: MCPClient):
+        """
+        Initialize the facade.
+
+        Args:
+            replicas: Replica set to route requests through
+            primary: Checked-out client used for capability state
+        """
+        self.replicas = replicas
+        self.primary = primary
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.primary, name)
+
+    @property
+    def on_capabilities_updated(self):
+        """Capability update callback of the primary session."""
+        return self.primary.on_capabilities_updated
+
+    @on_capabilities_updated.setter
+    def on_capabilities_updated(self, callback) -> None:
+        self.primary.on_capabilities_updated = callback
+
+    async def call_tool(self, *args, **kwargs):
+        """Call a tool on the least-loaded replica."""
+        async with self.replicas.acquire() as client:
+            return await client.call_tool(*args, **kwargs)
+
+    async def read_resource(self, *args, **kwargs):
+        """Read a resource from the least-loaded replica."""
+        async with self.replicas.acquire() as client:
+            return await client.read_resource(*args, **kwargs)
+
+    async def get_prompt(self, *args, **kwargs):
+        """Get a prompt from the least-loaded replica."""
+        async with self.replicas.acquire() as client:
+            return await client.get_prompt(*args, **kwargs)
+
+
+class SessionPoolManager:
+    """
+    Registry of session pools keyed by server id and configuration hash.
+
+    Servers with replicas get one pool per replica, grouped in a ReplicaSet
+    that is returned in place of a single pool.
+    """
+
+    def __init__(self, config: Optional[SessionPoolConfig] = None):
+        """Initialize the pool manager."""
+        self.config = config or SessionPoolConfig()
+        self.pools: Dict[Tuple[int, str], SessionPool] = {}
+        self.replica_sets: Dict[Tuple[int, str], ReplicaSet] = {}
+        self.latency_history: Optional[LatencyHistoryLoader] = None  # handed to new pools
+
+    def get_pool(self, server_id: int, server_config: Dict[str, Any]) -> Union[SessionPool, ReplicaSet]:
+        """
+        Get or create the pool for a server configuration.
+
+        Pool settings come from the "pool" section of the server's
+        client_options, and replica balancing settings from its "replicas"
+        section.
+        """
+        server_config = normalize_server_config(server_config)
+        digest = config_hash(server_config)
+        key = (server_id, digest)
+
+        if server_config.get("replicas"):
+            replica_set = self.replica_sets.get(key)
+            if replica_set is None:
+                self._retire_stale(server_id, digest)
+                pools = []
+                for index, replica_config in enumerate(replica_server_configs(server_id, server_config)):
+                    pool_config = pool_config_from_options(replica_config.get("client_options"), self.config)
+                    pool = SessionPool(server_id, replica_config, pool_config)
+                    pool.latency_history = self.latency_history
+                    self.pools[(server_id, f"{digest}#{index}")] = pool
+                    pools.append(pool)
+                replica_set = ReplicaSet(
+                    server_id, pools, replica_config_from_options(server_config.get("client_options"))
+                )
+                self.replica_sets[key] = replica_set
+            return replica_set
+
+        pool = self.pools.get(key)
+        if pool is None:
+            self._retire_stale(server_id, digest)
+            pool_config = pool_config_from_options(server_config.get("client_options"), self.config)
+            pool = SessionPool(server_id, server_config, pool_config)
+            pool.latency_history = self.latency_history
+            self.pools[key] = pool
+        return pool
+
+    def _retire_stale(self, server_id: int, digest: str) -> None:
+        """Close pools left over from an older configuration of a server."""
+        for stale_key in [k for k in self.pools if k[0] == server_id and k[1].split("#")[0] != digest]:
+            asyncio.create_task(self.pools.pop(stale_key).close())
+        for stale_key in [k for k in self.replica_sets if k[0] == server_id and k[1] != digest]:
+            del self.replica_sets[stale_key]
+
+    def prewarm(self, server_id: int, server_config: Dict[str, Any]) -> Union[SessionPool, ReplicaSet]:
+        """Create the pool for a server and start opening its warm sessions."""
+        pool = self.get_pool(server_id, server_config)
+        pool.start()
+        return pool
+
+    def acquire(self, server_id: int, server_config: Dict[str, Any]):
+        """Check out a pooled client for a server (async context manager)."""
+        return self.get_pool(server_id, server_config).acquire()
+
+    async def close_server(self, server_id: int) -> None:
+        """Close all pools for a server."""
+        for key in [k for k in self.replica_sets if k[0] == server_id]:
+            del self.replica_sets[key]
+        keys = [k for k in self.pools if k[0] == server_id]
+        await asyncio.gather(*(self.pools.pop(k).close() for k in keys), return_exceptions=True)
+
+    async def close_all(self) -> None:
+        """Close every pool."""
+        pools = list(self.pools.values())
+        self.pools.clear()
+        self.replica_sets.clear()
+        await asyncio.gather(*(pool.close() for pool in pools), return_exceptions=True)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get statistics for all pools."""
+        return [pool.stats() for pool in self.pools.values()]
+
+    def replica_stats(self) -> List[Dict[str, Any]]:
+        """Get balancing statistics for all replica sets."""
+        return [replica_set.stats() for replica_set in self.replica_sets.values()]
+
+
+# Global session pool manager
+session_pool_manager = SessionPoolManager()
+
+
+def get_session_pool_manager() -> SessionPoolManager:
+    """Get the global session pool manager."""
+    return session_pool_manager
@@ -0,0 +1,237 @@
+"""
+Circuit breakers for MCP Client.
+
+This module tracks request failures per server and per tool and stops
+sending requests to a server or tool that keeps failing, so callers fail
+fast instead of each waiting out a timeout. After a cool-down period a
+limited number of trial requests are let through to probe for recovery.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is refused because its circuit is open."""
+
+    def __init__(self, target: str, retry_after: float):
+        self.target = target
+        self.retry_after = retry_after
+        super().__init__(
+            f"{target} is temporarily unavailable after repeated failures "
+            f"(retry in {retry_after:.0f}s)"
+        )
+
+
+class CircuitBreaker:
+    """
+    Closed, open and half-open failure tracking for one target.
+
+    The circuit opens after failure_threshold consecutive failures. Once
+    reset_timeout seconds have passed it is half-open: up to
+    half_open_max_calls trial requests go through, and the first outcome
+    closes the circuit again or reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request
+            half_open_max_calls: Trial requests allowed at once while half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trials = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state of the circuit."""
+        if self.opened_at is None:
+            return CLOSED
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a trial request through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a request may go through; reserves a trial slot when half-open."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self.trials < self.half_open_max_calls:
+            self.trials += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self) -> None:
+        """Give back a trial slot for a request that ended without an outcome."""
+        self.trials = max(0, self.trials - 1)
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self.failures = 0
+        self.opened_at = None
+        self.trials = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        self.failures += 1
+        if self.opened_at is not None:
+            # A failed trial request reopens the circuit for another period
+            if self.state == HALF_OPEN:
+                self.opened_at = time.monotonic()
+                self.trials = 0
+                self.times_opened += 1
+        elif self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self.trials = 0
+            self.times_opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get circuit status."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retry_after": round(self.retry_after(), 1),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers shared by all clients, keyed by server identity.
+
+    Each server has one breaker for the server as a whole and one per tool,
+    so a single broken tool is cut off without affecting the rest of the
+    server, while a server failing across tools is cut off entirely.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._breakers: Dict[Tuple[str, Optional[str]], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        server_key: str,
+        tool_name: Optional[str] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ) -> CircuitBreaker:
+        """Get the breaker for a server (tool_name None) or one of its tools."""
+        with self._lock:
+            breaker = self._breakers.get((server_key, tool_name))
+            if breaker is None:
+                breaker = self._breakers[(server_key, tool_name)] = CircuitBreaker(failure_threshold, reset_timeout)
+            return breaker
+
+    def check(
+        self,
+        server_key: str,
+        tool_name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ) -> None:
+        """
+        Admit a tool call or refuse it.
+
+        Raises:
+            CircuitOpenError: If the server's or the tool's circuit is open
+        """
+        server = self.get(server_key, None, failure_threshold, reset_timeout)
+        tool = self.get(server_key, tool_name, failure_threshold, reset_timeout)
+        with self._lock:
+            if not server.allow():
+                raise CircuitOpenError("Server", server.retry_after())
+            if not tool.allow():
+                if server.state == HALF_OPEN:
+                    server.release()
+                raise CircuitOpenError(f"Tool '{tool_name}'", tool.retry_after())
+
+    def record(
+        self,
+        server_key: str,
+        tool_name: str,
+        success: Optional[bool],
+        server_failure: bool = True
+    ) -> None:
+        """
+        Record the outcome of an admitted tool call.
+
+        Args:
+            success: True or False, or None when the call was abandoned
+                without an outcome (only releases any trial slot)
+            server_failure: Whether a failure counts against the server as
+                well as the tool; False for errors the server answered with
+        """
+        server, tool = self.get(server_key, None), self.get(server_key, tool_name)
+        with self._lock:
+            if success is None:
+                server.release()
+                tool.release()
+            elif success:
+                server.record_success()
+                tool.record_success()
+            else:
+                tool.record_failure()
+                if server_failure:
+                    server.record_failure()
+                else:
+                    server.release()
+
+    def is_open(self, server_key: str, tool_name: str) -> bool:
+        """Whether calls to a tool would currently be refused."""
+        with self._lock:
+            server = self._breakers.get((server_key, None))
+            tool = self._breakers.get((server_key, tool_name))
+        return any(b is not None and b.state == OPEN for b in (server, tool))
+
+    def stats(self, server_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get status of every circuit that is not closed; tool is None for server-wide circuits."""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return [
+            {"server": key, "tool": tool, **breaker.stats()}
+            for (key, tool), breaker in breakers
+            if (server_key is None or key == server_key) and breaker.state != CLOSED
+        ]
+
+    def clear(self) -> None:
+        """Drop every breaker."""
+        with self._lock:
+            self._breakers.clear()
+
+
+# Global circuit breaker registry
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the global circuit breaker registry."""
+    return circuit_breakers
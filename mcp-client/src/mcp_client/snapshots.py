@@ -0,0 +1,123 @@
+"""
+On-disk capability snapshots for the CLI.
+
+Each CLI invocation is a new process, so the in-memory capability cache
+never survives from one command to the next. This module keeps the last
+discovered capabilities of each server in the user's cache directory so
+that `list`, `inspect`, tool argument validation and shell completion can
+work without spawning the server.
+
+A snapshot is valid for the server path, modification time and transport
+it was taken with; editing the server script invalidates it. Servers
+reached by URL have no modification time, so their snapshots expire
+after URL_SNAPSHOT_MAX_AGE instead.
+
+This module only uses the standard library so that completion stays fast.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Seconds a snapshot of a server reached by URL stays valid
+URL_SNAPSHOT_MAX_AGE = 3600.0
+
+
+def default_cache_dir() -> Path:
+    """Snapshot directory from MCP_CLIENT_CACHE_DIR, or under the XDG cache directory."""
+    configured = os.getenv("MCP_CLIENT_CACHE_DIR")
+    if configured:
+        return Path(configured) / "capabilities"
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "mcp-client" / "capabilities"
+
+
+def snapshot_key(server: str, transport: str) -> Optional[Dict[str, Any]]:
+    """
+    Identify the server a snapshot belongs to.
+
+    Returns:
+        The server location, transport and, for local scripts, the
+        modification time; None if the script does not exist
+    """
+    if server.startswith(("http://", "https://")):
+        return {"server": server, "transport": transport}
+    path = Path(server).resolve()
+    # Local scripts are run over stdio unless the in-process transport is asked for
+    if transport == "auto":
+        transport = "stdio"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return {"server": str(path), "transport": transport, "mtime_ns": mtime_ns}
+
+
+class CapabilitySnapshotStore:
+    """Capability snapshots stored as one JSON file per server and transport."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Where snapshots are kept; defaults to default_cache_dir()
+        """
+        self.directory = directory or default_cache_dir()
+
+    def _path(self, key: Dict[str, Any]) -> Path:
+        # One file per server and transport; the mtime is checked on load so
+        # that a changed script overwrites its old snapshot instead of adding one
+        identity = json.dumps([key["server"], key["transport"]])
+        return self.directory / f"{hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]}.json"
+
+    def load(self, server: str, transport: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored snapshot of a server if it is still valid.
+
+        Returns:
+            {"saved_at": UNIX time, "capabilities": capabilities_snapshot()},
+            or None if there is no valid snapshot
+        """
+        key = snapshot_key(server, transport)
+        if key is None:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("key") != key:
+            return None
+        if "mtime_ns" not in key and time.time() - entry.get("saved_at", 0) > URL_SNAPSHOT_MAX_AGE:
+            return None
+        return entry
+
+    def save(self, server: str, transport: str, capabilities: Dict[str, Any]) -> None:
+        """Store a server's capabilities, replacing any older snapshot."""
+        key = snapshot_key(server, transport)
+        if key is None:
+            return
+        path = self._path(key)
+        entry = {"key": key, "saved_at": time.time(), "capabilities": capabilities}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent CLI processes never read a partial file
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(temp_path, path)
+
+
+# Global snapshot store
+capability_snapshots = CapabilitySnapshotStore()
+
+
+def get_capability_snapshots() -> CapabilitySnapshotStore:
+    """Get the global capability snapshot store."""
+    return capability_snapshots
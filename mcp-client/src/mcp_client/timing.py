@@ -0,0 +1,79 @@
+"""
+Timing breakdowns for MCP Client operations.
+
+This module records how long each phase of an operation took (spawning
+or connecting the transport, initialize, capability discovery, the
+request itself and formatting the response) so that slow calls can be
+attributed to the right phase.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+# Phases in the order they happen, used to order breakdowns
+PHASES = ("acquire", "connect", "initialize", "discovery", "request", "parse")
+
+
+class Timings:
+    """Durations in milliseconds of the phases of one operation."""
+
+    def __init__(self, phases: Optional[Dict[str, float]] = None):
+        """
+        Initialize a breakdown.
+
+        Args:
+            phases: Initial phase durations in milliseconds
+        """
+        self.phases: Dict[str, float] = dict(phases or {})
+
+    def add(self, phase: str, milliseconds: float) -> None:
+        """Add time to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + milliseconds
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block (sync or async code) as a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, (time.perf_counter() - start) * 1000)
+
+    def merge(self, other: "Timings") -> None:
+        """Add every phase of another breakdown."""
+        for phase, milliseconds in other.phases.items():
+            self.add(phase, milliseconds)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> "Timings":
+        """Rebuild a breakdown from to_dict() output."""
+        return cls({phase: ms for phase, ms in data.items() if phase != "total"})
+
+    @property
+    def total(self) -> float:
+        """Sum of all phases in milliseconds."""
+        return sum(self.phases.values())
+
+    def to_dict(self) -> Dict[str, float]:
+        """Phase durations rounded to 0.01 ms, in phase order, plus the total."""
+        ordered = sorted(self.phases, key=lambda p: PHASES.index(p) if p in PHASES else len(PHASES))
+        result = {phase: round(self.phases[phase], 2) for phase in ordered}
+        result["total"] = round(self.total, 2)
+        return result
+
+
+def acquire_timings(client: Any, acquire_start: float) -> Timings:
+    """
+    Time spent getting a pooled session: its connect, initialize and
+    discovery phases if it was opened while waiting, the rest as acquire.
+
+    Args:
+        client: The MCPClient that was checked out
+        acquire_start: time.perf_counter() value from before the checkout
+    """
+    timings = client.connection_timings(acquire_start)
+    elapsed = (time.perf_counter() - acquire_start) * 1000
+    timings.add("acquire", max(0.0, elapsed - timings.total))
+    return timings
@@ -5,6 +5,10 @@ This module provides a Streamlit-based web interface
 for managing MCP servers and running conversations.
 """
 
-from .main import main
+from ..lazy import lazy_exports
 
-__all__ = ["main"] 
\ No newline at end of file
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "main": ".main",
+})
+
+__all__ = ["main"]
@@ -0,0 +1,20 @@
+"""
+In-process test server with tools that hang, fail or return content on demand.
+"""
+
+import asyncio
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
+
+
+mcp = FastMCP("Test Fixture Server")
+
+READ_ONLY = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
+
+@mcp.tool(annotations=READ_ONLY)
+async def wait(seconds: float) -> str:
+    """Sleep, then answer."""
+    await asyncio.sleep(seconds)
+    return "done"
@@ -0,0 +1,38 @@
+"""Tests for how the agent manager keeps agents on live pooled sessions."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.mcp_client.llm.agent import AgentManager
+from src.mcp_client.pool import SessionPool, SessionPoolConfig
+
+SERVER = Path(__file__).resolve().parents[1] / "examples" / "simple_server.py"
+
+
+def test_renew_session_replaces_a_session_lost_to_restart():
+    async def scenario():
+        pool = SessionPool(1, {"server_type": "inprocess", "server_path": str(SERVER)}, SessionPoolConfig(max_size=2))
+        manager = AgentManager()
+        try:
+            client = await pool.checkout()
+            agent = SimpleNamespace(tool_manager=SimpleNamespace(mcp_client=client))
+            manager.agents[1], manager.leases[1] = agent, pool
+
+            await manager.renew_session(1)
+            assert agent.tool_manager.mcp_client is client
+
+            # The supervisor restarts the server while the agent holds its session
+            await pool.restart()
+            assert not pool.is_live(client)
+            await manager.renew_session(1)
+            fresh = agent.tool_manager.mcp_client
+            result = await fresh.call_tool("add", {"a": 2, "b": 2})
+            return client, fresh, result, [s.client for s in pool.sessions]
+        finally:
+            await pool.close()
+
+    client, fresh, result, pooled = asyncio.run(scenario())
+    assert fresh is not client
+    assert result.content[0].text == "4.0"
+    assert client not in pooled
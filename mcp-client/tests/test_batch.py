@@ -0,0 +1,87 @@
+"""Tests for batched tool calls, through MCPClient and the batch command."""
+
+import asyncio
+import json
+import uuid
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.mcp_client.client import MCPClient, MCPClientConfig
+from src.mcp_client.main import cli
+
+SERVER = Path(__file__).resolve().parents[1] / "examples" / "simple_server.py"
+
+
+def run_batch(calls, concurrency):
+    async def scenario():
+        config = MCPClientConfig(transport_type="inprocess", server_key=f"test-{uuid.uuid4()}")
+        async with MCPClient(config) as client:
+            await client.connect(str(SERVER))
+            in_flight = peak = 0
+            send = client._send_tool_call
+
+            async def tracking(tool_name, arguments):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await send(tool_name, arguments)
+                finally:
+                    in_flight -= 1
+
+            client._send_tool_call = tracking
+            results = await client.call_tools_batch(calls, concurrency=concurrency)
+            return results, peak
+
+    return asyncio.run(scenario())
+
+
+def test_batch_results_come_back_in_call_order():
+    calls = [{"name": "add", "arguments": {"a": n, "b": 1}} for n in range(10)]
+
+    results, peak = run_batch(calls, concurrency=3)
+
+    assert [r.index for r in results] == list(range(10))
+    assert [r.result.content[0].text for r in results] == [f"{n + 1}.0" for n in range(10)]
+    assert all(r.success for r in results)
+    assert peak == 3
+
+
+def test_failed_calls_are_reported_not_raised():
+    calls = [
+        {"name": "divide", "arguments": {"a": 1, "b": 0}},
+        {"name": "divide", "arguments": {"a": 1, "b": 2}},
+    ]
+
+    results, _ = run_batch(calls, concurrency=2)
+
+    failed, ok = results
+    assert not failed.success and failed.result.isError
+    assert ok.success
+    assert failed.to_dict()["index"] == 0
+
+
+def test_batch_command_writes_one_record_per_line(tmp_path):
+    calls = tmp_path / "calls.jsonl"
+    calls.write_text(
+        '{"name": "add", "arguments": {"a": 1, "b": 2}, "id": "sum"}\n'
+        "\n"
+        '{"type": "resource", "uri": "config://server"}\n'
+        "not json\n"
+    )
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner().invoke(
+        cli, ["-s", str(SERVER), "-t", "inprocess", "batch", str(calls), "-o", str(output)]
+    )
+
+    records = sorted((json.loads(line) for line in output.read_text().splitlines()), key=lambda r: r["line"])
+    assert [r["line"] for r in records] == [1, 3, 4]
+    assert records[0]["id"] == "sum"
+    assert records[0]["result"]["content"][0]["text"] == "3.0"
+    assert records[1]["type"] == "resource" and records[1]["success"]
+    assert not records[2]["success"]
+    # One call failed, so the command exits with an error
+    assert result.exit_code == 1
@@ -0,0 +1,150 @@
+"""Tests for the tool result cache and the resource mirror."""
+
+import pytest
+from mcp.types import ReadResourceResult, TextResourceContents
+
+from src.mcp_client import cache
+from src.mcp_client.cache import ResourceMirror, ResultCache, canonical_arguments
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return clock
+
+
+def test_argument_order_does_not_change_the_key():
+    assert canonical_arguments({"a": 1, "b": 2}) == canonical_arguments({"b": 2, "a": 1})
+    assert canonical_arguments(None) == canonical_arguments({})
+
+
+def test_hit_until_ttl_expires(clock):
+    results = ResultCache()
+    results.put("srv", "add", {"a": 1, "b": 2}, "3", ttl=10)
+
+    assert results.get("srv", "add", {"b": 2, "a": 1}) == "3"
+    clock.now += 10
+    assert results.get("srv", "add", {"a": 1, "b": 2}) is None
+    assert results.stats("srv") == {"hits": 1, "misses": 1}
+
+
+def test_results_are_keyed_by_server_tool_and_arguments(clock):
+    results = ResultCache()
+    results.put("srv", "add", {"a": 1}, "one", ttl=10)
+
+    assert results.get("other", "add", {"a": 1}) is None
+    assert results.get("srv", "multiply", {"a": 1}) is None
+    assert results.get("srv", "add", {"a": 2}) is None
+    assert results.get("srv", "add", {"a": 1}) == "one"
+
+
+def test_zero_ttl_is_not_stored(clock):
+    results = ResultCache()
+    results.put("srv", "add", {}, "value", ttl=0)
+    assert results.get("srv", "add", {}) is None
+
+
+def test_evicts_least_recently_used(clock):
+    results = ResultCache(max_entries=2)
+    results.put("srv", "t", {"n": 1}, 1, ttl=10)
+    results.put("srv", "t", {"n": 2}, 2, ttl=10)
+    assert results.get("srv", "t", {"n": 1}) == 1
+
+    results.put("srv", "t", {"n": 3}, 3, ttl=10)
+
+    assert results.get("srv", "t", {"n": 2}) is None
+    assert results.get("srv", "t", {"n": 1}) == 1
+    assert results.get("srv", "t", {"n": 3}) == 3
+
+
+def test_invalidate_one_tool_or_the_whole_server(clock):
+    results = ResultCache()
+    results.put("srv", "add", {}, "a", ttl=10)
+    results.put("srv", "echo", {}, "e", ttl=10)
+    results.put("other", "add", {}, "o", ttl=10)
+
+    results.invalidate("srv", "add")
+    assert results.get("srv", "add", {}) is None
+    assert results.get("srv", "echo", {}) == "e"
+
+    results.invalidate("srv")
+    assert results.get("srv", "echo", {}) is None
+    assert results.get("other", "add", {}) == "o"
+
+
+def text_result(text):
+    return ReadResourceResult(contents=[TextResourceContents(uri="config://server", text=text)])
+
+
+def test_mirror_only_keeps_subscribed_resources():
+    mirror = ResourceMirror()
+    mirror.put("srv", "config://server", text_result("v1"))
+    assert mirror.get("srv", "config://server") is None
+
+    mirror.subscribe("srv", "config://server")
+    assert mirror.get("srv", "config://server") is None
+    mirror.put("srv", "config://server", text_result("v1"))
+
+    assert mirror.get("srv", "config://server").contents[0].text == "v1"
+    assert mirror.stats("srv") == {
+        "subscriptions": ["config://server"], "mirrored": 1, "hits": 1, "misses": 1, "updates": 0
+    }
+
+
+def test_update_notification_drops_contents_and_stale_reads():
+    mirror = ResourceMirror()
+    mirror.subscribe("srv", "config://server")
+    mirror.put("srv", "config://server", text_result("v1"))
+
+    generation = mirror.generation("srv", "config://server")
+    mirror.invalidate("srv", "config://server")
+    assert mirror.get("srv", "config://server") is None
+
+    # A read that started before the update must not overwrite it
+    mirror.put("srv", "config://server", text_result("v1"), generation=generation)
+    assert mirror.get("srv", "config://server") is None
+
+    mirror.put("srv", "config://server", text_result("v2"), generation=mirror.generation("srv", "config://server"))
+    assert mirror.get("srv", "config://server").contents[0].text == "v2"
+
+
+def test_subscriptions_are_reference_counted():
+    mirror = ResourceMirror()
+    mirror.subscribe("srv", "config://server")
+    mirror.subscribe("srv", "config://server")
+    mirror.put("srv", "config://server", text_result("v1"))
+
+    mirror.unsubscribe("srv", "config://server")
+    assert mirror.is_subscribed("srv", "config://server")
+    assert mirror.get("srv", "config://server") is not None
+
+    mirror.unsubscribe("srv", "config://server")
+    assert not mirror.is_subscribed("srv", "config://server")
+    assert mirror.total_bytes == 0
+
+
+def test_mirror_is_bounded_in_bytes():
+    mirror = ResourceMirror(max_bytes=10)
+    for uri in ("a://1", "a://2", "a://3"):
+        mirror.subscribe("srv", uri)
+
+    mirror.put("srv", "a://1", text_result("x" * 4))
+    mirror.put("srv", "a://2", text_result("x" * 4))
+    mirror.put("srv", "a://3", text_result("x" * 4))
+    mirror.put("srv", "a://1", text_result("x" * 11))
+
+    assert mirror.total_bytes == 8
+    assert mirror.get("srv", "a://1") is None
+    assert mirror.get("srv", "a://2") is not None
+    assert mirror.get("srv", "a://3") is not None
@@ -0,0 +1,55 @@
+"""Tests for URI template matching and the resource catalog index."""
+
+import re
+
+import pytest
+from mcp.types import Resource, ResourceTemplate
+
+from src.mcp_client.catalog import ResourceCatalog, compile_uri_template
+
+
+@pytest.mark.parametrize("template, uri, expected", [
+    ("file:///{name}", "file:///notes", {"v_name": "notes"}),
+    ("file:///{name}", "file:///a/b", None),
+    ("file:///{+path}", "file:///a/b/c.txt", {"v_path": "a/b/c.txt"}),
+    ("doc://x{#frag}", "doc://x#intro", {"v_frag": "intro"}),
+    ("repo://{owner}{/name,branch}", "repo://me/app/main", {"v_owner": "me", "v_name": "app", "v_branch": "main"}),
+    ("search://q{?term,page}", "search://q?term=mcp&page=2", {"v_term": "mcp", "v_page": "2"}),
+    ("search://q{?term}", "search://q", {"v_term": None}),
+    ("pair://{a,b}", "pair://1,2", {"v_a": "1", "v_b": "2"}),
+    ("lit://a.b/{x}", "lit://aXb/1", None),
+])
+def test_compile_uri_template(template, uri, expected):
+    match = compile_uri_template(template).match(uri)
+    assert (match.groupdict() if match else None) == expected
+
+
+def test_compile_uri_template_rejects_odd_variable_names():
+    with pytest.raises(re.error):
+        compile_uri_template("x://{a-b}")
+
+
+def test_match_template_prefers_most_specific():
+    catalog = ResourceCatalog()
+    catalog.set_templates([
+        ResourceTemplate(uriTemplate="data://{name}", name="any"),
+        ResourceTemplate(uriTemplate="data://users/{id}", name="user"),
+        ResourceTemplate(uriTemplate="data://{bad-name}", name="skipped"),
+    ])
+    template, variables = catalog.match_template("data://users/42")
+    assert template.name == "user"
+    assert variables == {"id": "42"}
+    template, variables = catalog.match_template("data://other")
+    assert (template.name, variables) == ("any", {"name": "other"})
+    assert catalog.match_template("file://x") is None
+
+
+def test_find_by_prefix_in_uri_order():
+    catalog = ResourceCatalog()
+    catalog.add([Resource(uri=f"data://item/{n}", name=str(n)) for n in (3, 1, 2)])
+    catalog.add([Resource(uri="data://other", name="other"), Resource(uri="data://item/1", name="again")])
+    assert len(catalog) == 4
+    assert [r.name for r in catalog.find("data://item/")] == ["again", "2", "3"]
+    assert [r.name for r in catalog.find("data://item/", limit=1)] == ["again"]
+    assert catalog.find("zzz") == []
+    assert catalog.get("data://other").name == "other"
@@ -0,0 +1,98 @@
+"""Tests for MCPClient tool calls against the in-process fixture server."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, INVALID_PARAMS, METHOD_NOT_FOUND, ErrorData
+
+from src.mcp_client.client import MCPClient, MCPClientConfig
+from src.mcp_client.latency import get_latency_tracker
+from src.mcp_client.resilience import get_circuit_breakers
+
+SERVER = Path(__file__).resolve().parent / "fixture_server.py"
+
+
+@asynccontextmanager
+async def connected(**settings):
+    """A discovered client with its own server key, so shared state never leaks between tests."""
+    config = MCPClientConfig(transport_type="inprocess", server_key=f"test-{uuid.uuid4()}", **settings)
+    async with MCPClient(config) as client:
+        await client.connect(str(SERVER))
+        await client.discover_capabilities()
+        yield client
+
+
+def test_deadline_cancels_hung_coalesced_call():
+    async def scenario():
+        async with connected() as client:
+            assert client.is_tool_coalescable("wait")
+            calls = [client.call_tool("wait", {"seconds": 60}, timeout=0.1) for _ in range(3)]
+            results = await asyncio.gather(*calls, return_exceptions=True)
+            await asyncio.sleep(0.01)
+            return results, client.request_gate.in_flight
+
+    results, in_flight = asyncio.run(scenario())
+    assert all(isinstance(r, TimeoutError) for r in results)
+    assert in_flight == 0
+
+
+@pytest.mark.parametrize("code, opens", [(INVALID_PARAMS, False), (METHOD_NOT_FOUND, False), (INTERNAL_ERROR, True)])
+def test_only_server_side_errors_open_the_tool_circuit(code, opens):
+    async def scenario():
+        async with connected(circuit_failure_threshold=2) as client:
+            async def reject(tool_name, arguments):
+                raise McpError(ErrorData(code=code, message="rejected"))
+
+            client._send_tool_call = reject
+            for _ in range(2):
+                with pytest.raises(McpError):
+                    await client.call_tool("wait", {"seconds": 0})
+            return client.is_tool_available("wait")
+
+    assert asyncio.run(scenario()) is not opens
+
+
+def test_adaptive_deadlines_are_opt_in():
+    async def scenario():
+        async with connected(timeout=30) as client:
+            get_latency_tracker().seed(client.server_key, "wait", [1.0] * 20)
+            return client.tool_deadline("wait")
+
+    assert asyncio.run(scenario()) == 30
+
+
+def test_missed_adaptive_deadline_is_not_a_server_failure():
+    async def scenario():
+        async with connected(adaptive_timeouts=True, tool_timeout_min=0.05) as client:
+            get_latency_tracker().seed(client.server_key, "wait", [1.0] * 20)
+            with pytest.raises(TimeoutError):
+                await client.call_tool("wait", {"seconds": 5})
+            breakers = get_circuit_breakers()
+            return breakers.get(client.server_key).failures, breakers.get(client.server_key, "wait").failures
+
+    assert asyncio.run(scenario()) == (0, 1)
+
+
+def test_idempotent_tool_result_is_served_from_cache():
+    async def scenario():
+        async with connected() as client:
+            sent = []
+            send = client._send_tool_call
+
+            async def counting(tool_name, arguments):
+                sent.append(tool_name)
+                return await send(tool_name, arguments)
+
+            client._send_tool_call = counting
+            assert client.is_tool_cacheable("wait")
+            first = await client.call_tool("wait", {"seconds": 0})
+            second = await client.call_tool("wait", {"seconds": 0})
+            return sent, first, second
+
+    sent, first, second = asyncio.run(scenario())
+    assert sent == ["wait"]
+    assert second is first
@@ -0,0 +1,208 @@
+"""Tests for the request gate, single-flight coalescing and iter_bounded."""
+
+import asyncio
+
+import pytest
+
+from src.mcp_client.concurrency import RequestGate, SingleFlight, iter_bounded
+
+
+def test_gate_unlimited_never_queues():
+    async def scenario():
+        gate = RequestGate(limit=0)
+        async with gate, gate, gate:
+            assert gate.in_flight == 3
+        return gate
+
+    gate = asyncio.run(scenario())
+    assert gate.in_flight == 0
+    assert gate.total_queued == 0
+
+
+def test_gate_hands_slots_to_waiters_in_fifo_order():
+    async def scenario():
+        gate = RequestGate(limit=1)
+        order = []
+
+        async def request(name):
+            async with gate:
+                order.append(name)
+                await asyncio.sleep(0)
+
+        async with gate:
+            tasks = [asyncio.create_task(request(n)) for n in range(5)]
+            await asyncio.sleep(0)
+            assert gate.queue_depth == 5
+        await asyncio.gather(*tasks)
+        return gate, order
+
+    gate, order = asyncio.run(scenario())
+    assert order == [0, 1, 2, 3, 4]
+    assert gate.in_flight == 0
+    assert gate.max_in_flight == 1
+    assert gate.total_queued == 5
+
+
+def test_gate_late_arrival_does_not_overtake_queue():
+    async def scenario():
+        gate = RequestGate(limit=1)
+        order = []
+
+        async def request(name):
+            async with gate:
+                order.append(name)
+
+        await gate.__aenter__()
+        queued = asyncio.create_task(request("queued"))
+        await asyncio.sleep(0)
+        await gate.__aexit__(None, None, None)
+        # The slot now belongs to the queued request even before it runs
+        await request("late")
+        await queued
+        return order
+
+    assert asyncio.run(scenario()) == ["queued", "late"]
+
+
+def test_gate_cancelled_waiter_frees_its_place():
+    async def scenario():
+        gate = RequestGate(limit=1)
+        await gate.__aenter__()
+        waiter = asyncio.create_task(gate.__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert gate.queue_depth == 0
+        await gate.__aexit__(None, None, None)
+        return gate
+
+    assert asyncio.run(scenario()).in_flight == 0
+
+
+def test_gate_cancel_after_handoff_passes_slot_on():
+    async def scenario():
+        gate = RequestGate(limit=1)
+        await gate.__aenter__()
+        first = asyncio.create_task(gate.__aenter__())
+        second = asyncio.create_task(gate.__aenter__())
+        await asyncio.sleep(0)
+        # Hand the slot to the first waiter, then cancel it before it resumes
+        await gate.__aexit__(None, None, None)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await second
+        assert gate.in_flight == 1
+        await gate.__aexit__(None, None, None)
+        return gate
+
+    assert asyncio.run(scenario()).in_flight == 0
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(4)))
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(scenario())
+    assert calls == 1
+    assert [r for r, _ in results] == ["value"] * 4
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert flight.stats() == {"in_flight": 0, "total_calls": 4, "total_coalesced": 3}
+
+
+def test_single_flight_forgets_key_after_completion():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fetch():
+            return object()
+
+        first, _ = await flight.do("key", fetch)
+        second, shared = await flight.do("key", fetch)
+        return first, second, shared
+
+    first, second, shared = asyncio.run(scenario())
+    assert first is not second
+    assert shared is False
+
+
+def test_single_flight_shares_exceptions():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        return await asyncio.gather(*(flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_single_flight_cancelled_caller_keeps_shared_request():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(flight.do("key", fetch))
+        follower = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == ("value", True)
+
+
+def test_single_flight_cancels_request_when_every_caller_leaves():
+    async def scenario():
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.sleep(60)
+
+        callers = [asyncio.create_task(flight.do("key", hang)) for _ in range(2)]
+        await started.wait()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        return flight
+
+    assert asyncio.run(scenario()).stats()["in_flight"] == 0
+
+
+def test_iter_bounded_limits_concurrency():
+    async def scenario():
+        running = peak = 0
+
+        async def worker(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001 * (item % 3))
+            running -= 1
+            return item * 2
+
+        results = [r async for r in iter_bounded(range(10), worker, 3)]
+        return peak, results
+
+    peak, results = asyncio.run(scenario())
+    assert peak == 3
+    assert sorted(results) == [i * 2 for i in range(10)]
@@ -0,0 +1,53 @@
+"""Tests for chunked base64 decoding and resource content spooling."""
+
+import base64
+import os
+
+import pytest
+from mcp.types import BlobResourceContents, TextResourceContents
+
+from src.mcp_client import content
+from src.mcp_client.content import BinaryContent, base64_decoded_size, iter_base64_decoded, spool_resource_content
+
+PAYLOAD = os.urandom(10_000)
+
+
+@pytest.mark.parametrize("encoded", [
+    base64.b64encode(PAYLOAD).decode(),
+    base64.encodebytes(PAYLOAD).decode(),  # MIME: 76-character lines
+    base64.encodebytes(PAYLOAD).decode().replace("\n", "\r\n"),
+])
+@pytest.mark.parametrize("chunk_chars", [5, 77, 4096])
+def test_chunked_decode_matches_whole_decode(encoded, chunk_chars):
+    assert b"".join(iter_base64_decoded(encoded, chunk_chars)) == PAYLOAD
+    assert base64_decoded_size(encoded) == len(PAYLOAD)
+
+
+def test_truncated_base64_is_rejected():
+    with pytest.raises(ValueError):
+        b"".join(iter_base64_decoded("QUJD" * 10 + "QU", 8))
+
+
+def test_spool_decodes_line_wrapped_blob(monkeypatch):
+    monkeypatch.setattr(content, "DECODE_CHUNK_CHARS", 100)
+    blob = BlobResourceContents(uri="data://x", blob=base64.encodebytes(PAYLOAD).decode(), mimeType="image/png")
+    spooled = spool_resource_content(blob, max_memory=1024)
+    assert (spooled.size, spooled.mime_type) == (len(PAYLOAD), "image/png")
+    assert b"".join(spooled.iter_chunks(3000)) == PAYLOAD
+
+
+def test_spool_rolls_text_over_to_disk():
+    text = TextResourceContents(uri="data://x", text="é" * 5000)
+    spooled = spool_resource_content(text, max_memory=1024)
+    assert spooled.file._rolled
+    assert b"".join(spooled.iter_chunks()).decode() == text.text
+
+
+def test_binary_content_slices_share_one_buffer():
+    blob = BlobResourceContents(uri="data://x", blob=base64.b64encode(PAYLOAD).decode())
+    binary = BinaryContent.from_content(blob)
+    chunks = list(binary.iter_chunks(4096))
+    assert binary.mime_type == "application/octet-stream"
+    assert [len(c) for c in chunks] == [4096, 4096, 1808]
+    assert all(c.obj is binary.view.obj for c in chunks)
+    assert b"".join(chunks) == PAYLOAD
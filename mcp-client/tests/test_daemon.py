@@ -0,0 +1,93 @@
+"""Tests for the CLI daemon and its stdlib-only client."""
+
+import asyncio
+import os
+import socket
+from pathlib import Path
+
+import pytest
+
+from src.mcp_client.daemon import CLIDaemon
+from src.mcp_client.daemon_client import check_socket_owner, daemon_request, ensure_socket_dir
+
+SERVER = str(Path(__file__).resolve().parents[1] / "examples" / "simple_server.py")
+
+
+def run_daemon(socket_path, scenario):
+    """Serve a daemon on socket_path while scenario() talks to it, then stop it."""
+    async def main():
+        daemon = CLIDaemon(socket_path)
+        serving = asyncio.create_task(daemon.serve())
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+        try:
+            return await scenario(daemon)
+        finally:
+            await daemon_request({"op": "stop"}, socket_path, timeout=5)
+            await serving
+
+    return asyncio.run(main())
+
+
+def test_daemon_reuses_one_session_across_requests(tmp_path):
+    socket_path = tmp_path / "d.sock"
+
+    async def scenario(daemon):
+        request = {"server": SERVER, "transport": "inprocess"}
+        listed = await daemon_request({**request, "op": "list"}, socket_path, timeout=30)
+        first = await daemon_request({**request, "op": "tool", "name": "add", "arguments": {"a": 2, "b": 3}}, socket_path, timeout=30)
+        second = await daemon_request({**request, "op": "tool", "name": "add", "arguments": {"a": 4, "b": 5}}, socket_path, timeout=30)
+        status = await daemon_request({"op": "status"}, socket_path, timeout=5)
+        return listed, first, second, status
+
+    listed, first, second, status = run_daemon(socket_path, scenario)
+    assert "add" in {tool["name"] for tool in listed["result"]["tools"]}
+    assert first["result"]["content"][0]["text"] == "5.0"
+    assert second["result"]["content"][0]["text"] == "9.0"
+    assert status["result"]["requests"] == 3
+    (pool,) = status["result"]["pools"]
+    assert pool["size"] == 1
+    assert not socket_path.exists()
+
+
+def test_daemon_reports_errors_and_keeps_serving(tmp_path):
+    socket_path = tmp_path / "d.sock"
+
+    async def scenario(daemon):
+        bad = await daemon_request({"op": "bogus", "server": SERVER, "transport": "inprocess"}, socket_path, timeout=30)
+        status = await daemon_request({"op": "status"}, socket_path, timeout=5)
+        return bad, status
+
+    bad, status = run_daemon(socket_path, scenario)
+    assert bad == {"ok": False, "error": "Unknown operation: bogus"}
+    assert status["ok"]
+
+
+def test_no_daemon_is_not_an_error(tmp_path):
+    assert asyncio.run(daemon_request({"op": "status"}, tmp_path / "missing.sock")) is None
+
+
+def test_socket_dir_must_be_private(tmp_path):
+    private = tmp_path / "private"
+    ensure_socket_dir(private / "d.sock")
+    assert private.stat().st_mode & 0o777 == 0o700
+
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    os.chmod(shared, 0o755)
+    with pytest.raises(PermissionError):
+        ensure_socket_dir(shared / "d.sock")
+
+
+def test_only_a_socket_is_trusted(tmp_path):
+    planted = tmp_path / "d.sock"
+    planted.write_text("")
+    with pytest.raises(PermissionError):
+        check_socket_owner(planted)
+
+    listener = socket.socket(socket.AF_UNIX)
+    try:
+        listener.bind(str(tmp_path / "real.sock"))
+        check_socket_owner(tmp_path / "real.sock")
+    finally:
+        listener.close()
@@ -0,0 +1,104 @@
+"""
+Import-time regression tests for the CLI.
+
+Each case runs in a fresh interpreter under -X importtime and fails if it
+imports a heavy dependency it should not need, or takes longer than its
+budget. Set MCP_CLIENT_IMPORT_BUDGET_SCALE (e.g. 2.0) on slow machines.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SERVER = ROOT / "examples" / "simple_server.py"
+
+# Dependencies that only some commands need
+HEAVY_MODULES = {"mcp", "httpx", "pydantic", "sqlalchemy", "fastapi", "streamlit", "openai", "anthropic", "boto3"}
+
+BUDGET_SCALE = float(os.getenv("MCP_CLIENT_IMPORT_BUDGET_SCALE", "1.0"))
+
+CLI = "import sys; sys.argv = ['mcp-client'] + sys.argv[1:]; from src.mcp_client.main import cli; cli()"
+
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+try:
+    exec({code!r})
+except SystemExit:
+    pass
+sys.__stdout__.write("\\n%.1f\\n" % ((time.perf_counter() - start) * 1000))
+"""
+
+
+def run_imports(code, *args, env=None):
+    """
+    Run code in a fresh interpreter.
+
+    Returns:
+        The process, the names of every module it imported and the time
+        the code took in milliseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(code=code), *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})}
+    )
+    modules = {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+    elapsed_ms = float(result.stdout.strip().splitlines()[-1]) if result.returncode == 0 else 0.0
+    return result, modules, elapsed_ms
+
+
+# (code to run, CLI arguments, heavy dependencies it may import, budget in ms)
+CASES = {
+    "import package": ("import src.mcp_client", [], set(), 50),
+    "import CLI": ("import src.mcp_client.main", [], set(), 250),
+    "mcp-client version": (CLI, ["version"], set(), 300),
+    "mcp-client --help": (CLI, ["--help"], set(), 300),
+    "import daemon client": ("import src.mcp_client.daemon_client", [], set(), 100),
+    "import client": ("import src.mcp_client.client", [], {"mcp", "httpx", "pydantic"}, 1500),
+    "import llm providers": ("import src.mcp_client.llm.providers", [], set(), 100),
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_import_budget(name):
+    code, args, allowed, budget_ms = CASES[name]
+    result, modules, elapsed_ms = run_imports(code, *args)
+    assert result.returncode == 0, result.stderr
+    unexpected = {module.split(".")[0] for module in modules} & HEAVY_MODULES - allowed
+    assert not unexpected, f"{name} imports {', '.join(sorted(unexpected))}"
+    assert elapsed_ms <= budget_ms * BUDGET_SCALE, f"{name} took {elapsed_ms:.0f}ms"
+
+
+@pytest.fixture
+def daemon_socket(tmp_path):
+    """A CLI daemon listening on a socket of its own, stopped after the test."""
+    tmp_path.chmod(0o700)
+    env = {"MCP_CLIENT_DAEMON_SOCKET": str(tmp_path / "daemon.sock")}
+    result = subprocess.run([sys.executable, "-c", CLI, "daemon", "start"], cwd=ROOT, capture_output=True, text=True, env={**os.environ, **env})
+    assert result.returncode == 0, result.stdout + result.stderr
+    yield env
+    subprocess.run([sys.executable, "-c", CLI, "daemon", "stop"], cwd=ROOT, capture_output=True, env={**os.environ, **env})
+
+
+def test_daemon_served_call_skips_the_sdk(daemon_socket):
+    args = ["-s", str(SERVER), "tool", "add", "a=1", "b=2"]
+    # The first call opens the daemon's session; the second is the one measured
+    run_imports(CLI, *args, env=daemon_socket)
+    result, modules, _ = run_imports(CLI, *args, env=daemon_socket)
+    assert result.returncode == 0, result.stderr
+    assert "via daemon" in result.stdout
+    assert "3.0" in result.stdout
+    assert "mcp.client.session" not in modules
+    assert not {module.split(".")[0] for module in modules} & HEAVY_MODULES
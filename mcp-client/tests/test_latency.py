@@ -0,0 +1,34 @@
+"""Tests for nearest-rank percentiles and the latency tracker."""
+
+import pytest
+
+from src.mcp_client.latency import LatencyTracker, nearest_rank
+
+
+@pytest.mark.parametrize("percentile, expected", [(0, 10), (25, 10), (50, 20), (75, 30), (90, 40), (100, 40)])
+def test_nearest_rank(percentile, expected):
+    assert nearest_rank([10, 20, 30, 40], percentile) == expected
+
+
+def test_nearest_rank_single_sample():
+    assert nearest_rank([5.0], 99) == 5.0
+
+
+def test_tracker_window_keeps_recent_samples():
+    tracker = LatencyTracker(window=3)
+    for latency in (100, 1, 2, 3):
+        tracker.record("srv", "tool", latency)
+    assert tracker.count("srv", "tool") == 3
+    assert tracker.percentile("srv", "tool", 100) == 3
+    assert tracker.percentile("srv", "tool", 50, min_samples=4) is None
+    assert tracker.percentile("srv", "other", 50) is None
+
+
+def test_tracker_seeds_history_once_ahead_of_observed():
+    tracker = LatencyTracker(window=3)
+    tracker.record("srv", "tool", 1)
+    tracker.seed("srv", "tool", [50, 60, 70])
+    tracker.seed("srv", "tool", [90, 90, 90])
+    # The window keeps the newest samples: two seeded, then the observed one
+    assert sorted(tracker._samples[("srv", "tool")]) == [1, 60, 70]
+    assert tracker.stats("srv")["tool"]["count"] == 3
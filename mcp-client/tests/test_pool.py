@@ -0,0 +1,218 @@
+"""Tests for session pool checkout, sharing and replenishment over the in-process transport."""
+
+import asyncio
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from src.mcp_client.client import CallStats
+from src.mcp_client.latency import get_latency_tracker
+from src.mcp_client.pool import SessionPool, SessionPoolConfig
+
+SERVER = Path(__file__).resolve().parents[1] / "examples" / "simple_server.py"
+
+
+def server_config(**client_options):
+    return {"server_type": "inprocess", "server_path": str(SERVER), "client_options": client_options}
+
+
+def run_with_pool(scenario, config=None, **client_options):
+    async def main():
+        pool = SessionPool(1, server_config(**client_options), config or SessionPoolConfig(max_size=2))
+        try:
+            return await scenario(pool)
+        finally:
+            await pool.close()
+
+    return asyncio.run(main())
+
+
+def test_acquire_reuses_idle_session():
+    async def scenario(pool):
+        async with pool.acquire() as first:
+            result = await first.call_tool("add", {"a": 1, "b": 2})
+        async with pool.acquire() as second:
+            pass
+        return first, second, result, pool.stats()
+
+    first, second, result, stats = run_with_pool(scenario)
+    assert first is second
+    assert result.content[0].text == "3.0"
+    assert stats["size"] == 1
+
+
+def test_sessions_are_shared_up_to_max_concurrency():
+    async def scenario(pool):
+        clients = [await pool.checkout() for _ in range(4)]
+        sessions = len(pool.sessions)
+        for client in clients:
+            await pool.checkin(client)
+        return clients, sessions
+
+    clients, sessions = run_with_pool(scenario, max_concurrency=2)
+    assert sessions == 2
+    assert len({id(c) for c in clients}) == 2
+
+
+def test_checkout_times_out_when_saturated():
+    async def scenario(pool):
+        client = await pool.checkout()
+        try:
+            with pytest.raises(TimeoutError):
+                await pool.checkout()
+        finally:
+            await pool.checkin(client)
+
+    run_with_pool(scenario, SessionPoolConfig(max_size=1, acquire_timeout=0.1), max_concurrency=1)
+
+
+def test_waiter_gets_released_session():
+    async def scenario(pool):
+        client = await pool.checkout()
+        waiter = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        await pool.checkin(client)
+        handed = await asyncio.wait_for(waiter, 1)
+        await pool.checkin(handed)
+        return client, handed
+
+    client, handed = run_with_pool(scenario, SessionPoolConfig(max_size=1), max_concurrency=1)
+    assert client is handed
+
+
+def test_unhealthy_checkin_discards_session():
+    async def scenario(pool):
+        client = await pool.checkout()
+        await pool.checkin(client, healthy=False)
+        return len(pool.sessions)
+
+    assert run_with_pool(scenario) == 0
+
+
+def test_closed_pool_refuses_checkout():
+    async def scenario(pool):
+        await pool.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            await pool.checkout()
+
+    run_with_pool(scenario)
+
+
+def test_replenish_opens_warm_spares():
+    async def scenario(pool):
+        async with pool.acquire():
+            for _ in range(100):
+                if len(pool.sessions) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            return len(pool.sessions)
+
+    config = SessionPoolConfig(max_size=3, warm_spares=1)
+    assert run_with_pool(scenario, config, max_concurrency=1) == 2
+
+
+def test_unavailable_pool_neither_checks_out_nor_tops_up():
+    async def scenario(pool):
+        pool.available = False
+        with pytest.raises(RuntimeError, match="unavailable"):
+            await pool.checkout()
+        await pool._top_up()
+        return len(pool.sessions) + pool._pending
+
+    assert run_with_pool(scenario, SessionPoolConfig(min_size=2)) == 0
+
+
+def test_failed_health_check_stops_sharing_a_session():
+    async def scenario(pool):
+        holder = await pool.checkout()
+        broken = next(s for s in pool.sessions if s.client is holder)
+
+        async def no_answer():
+            raise ConnectionError("transport closed")
+
+        holder.ping = no_answer
+        with pytest.raises(ValueError):
+            async with pool.acquire() as shared:
+                assert shared is holder
+                raise ValueError("request failed")
+        async with pool.acquire() as client:
+            replacement = client
+        await pool.checkin(holder)
+        return broken, replacement, holder, pool.sessions
+
+    broken, replacement, holder, sessions = run_with_pool(scenario)
+    assert broken.failed
+    assert replacement is not holder
+    assert broken not in sessions
+
+
+def hedging_options():
+    server_key = f"test-{uuid.uuid4()}"
+    get_latency_tracker().record(server_key, "add", 20.0)
+    return {"server_key": server_key, "hedge_requests": True, "hedge_min_samples": 1}
+
+
+async def wait_for_size(pool, size):
+    while pool.stats()["size"] < size:
+        await asyncio.sleep(0.01)
+
+
+def test_slow_call_is_hedged_on_a_spare_session():
+    async def scenario(pool):
+        async with pool.acquire() as client:
+            await client.discover_capabilities()
+            await wait_for_size(pool, 2)
+            send = client._send_tool_call
+
+            async def stalled(tool_name, arguments):
+                await asyncio.sleep(30)
+                return await send(tool_name, arguments)
+
+            client._send_tool_call = stalled
+            stats = CallStats()
+            start = time.perf_counter()
+            result = await client.call_tool("add", {"a": 1, "b": 2}, stats=stats, use_cache=False)
+            return result, stats, time.perf_counter() - start
+
+    config = SessionPoolConfig(max_size=2, warm_spares=1)
+    result, stats, elapsed = run_with_pool(scenario, config, **hedging_options())
+    assert result.content[0].text == "3.0"
+    assert stats.hedged and stats.hedge_won
+    assert elapsed < 5
+
+
+def test_fast_call_is_not_hedged():
+    async def scenario(pool):
+        async with pool.acquire() as client:
+            await client.discover_capabilities()
+            await wait_for_size(pool, 2)
+            stats = CallStats()
+            await client.call_tool("add", {"a": 1, "b": 2}, stats=stats, use_cache=False)
+            return stats
+
+    stats = run_with_pool(scenario, SessionPoolConfig(max_size=2, warm_spares=1), **hedging_options())
+    assert not stats.hedged
+
+
+def test_hedge_without_a_spare_session_waits_for_the_original():
+    async def scenario(pool):
+        async with pool.acquire() as client:
+            await client.discover_capabilities()
+            send = client._send_tool_call
+
+            async def slow(tool_name, arguments):
+                await asyncio.sleep(0.2)
+                return await send(tool_name, arguments)
+
+            client._send_tool_call = slow
+            stats = CallStats()
+            result = await client.call_tool("add", {"a": 1, "b": 2}, stats=stats, use_cache=False)
+            return result, stats, pool.stats()
+
+    result, stats, pool_stats = run_with_pool(scenario, **hedging_options())
+    assert result.content[0].text == "3.0"
+    assert not stats.hedged
+    assert pool_stats["size"] == 1
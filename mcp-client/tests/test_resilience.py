@@ -0,0 +1,111 @@
+"""Tests for circuit breaker state transitions."""
+
+import pytest
+
+from src.mcp_client import resilience
+from src.mcp_client.resilience import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+)
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock)
+    return clock
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+    assert breaker.retry_after() == 10
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_limits_trials_and_closes_on_success(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_for_another_period(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+    assert breaker.retry_after() == 10
+
+
+def test_released_trial_slot_can_be_reused(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_registry_tool_failures_do_not_open_server(clock):
+    registry = CircuitBreakerRegistry()
+    for _ in range(2):
+        registry.check("srv", "bad", failure_threshold=2)
+        registry.record("srv", "bad", False, server_failure=False)
+    with pytest.raises(CircuitOpenError, match="Tool 'bad'"):
+        registry.check("srv", "bad", failure_threshold=2)
+    registry.check("srv", "good", failure_threshold=2)
+    assert registry.is_open("srv", "bad")
+    assert not registry.is_open("srv", "good")
+
+
+def test_registry_server_failures_open_every_tool(clock):
+    registry = CircuitBreakerRegistry()
+    for tool in ("a", "b"):
+        registry.check("srv", tool, failure_threshold=2)
+        registry.record("srv", tool, False)
+    with pytest.raises(CircuitOpenError, match="Server"):
+        registry.check("srv", "c", failure_threshold=2)
+    assert [s["tool"] for s in registry.stats("srv")] == [None]
+
+
+def test_registry_abandoned_call_releases_trial(clock):
+    registry = CircuitBreakerRegistry()
+    registry.check("srv", "tool", failure_threshold=1, reset_timeout=10)
+    registry.record("srv", "tool", False)
+    clock.now += 10
+    registry.check("srv", "tool")
+    registry.record("srv", "tool", None)
+    registry.check("srv", "tool")
+    registry.record("srv", "tool", True)
+    assert registry.stats() == []
@@ -0,0 +1,78 @@
+"""Tests for on-disk capability snapshots."""
+
+import os
+
+import pytest
+
+from src.mcp_client import snapshots
+from src.mcp_client.snapshots import URL_SNAPSHOT_MAX_AGE, CapabilitySnapshotStore
+
+CAPABILITIES = {"tools": [{"name": "add", "inputSchema": {"type": "object"}}]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CapabilitySnapshotStore(tmp_path / "capabilities")
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = tmp_path / "server.py"
+    path.write_text("# server\n")
+    return path
+
+
+def test_round_trip(store, server):
+    store.save(str(server), "stdio", CAPABILITIES)
+
+    entry = store.load(str(server), "stdio")
+    assert entry["capabilities"] == CAPABILITIES
+    assert list(store.directory.iterdir()) == [store._path(entry["key"])]
+
+
+def test_auto_transport_shares_the_stdio_snapshot(store, server):
+    store.save(str(server), "auto", CAPABILITIES)
+
+    assert store.load(str(server), "stdio") is not None
+    assert store.load(str(server), "inprocess") is None
+
+
+def test_editing_the_server_invalidates_its_snapshot(store, server):
+    store.save(str(server), "stdio", CAPABILITIES)
+    stat = server.stat()
+    os.utime(server, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert store.load(str(server), "stdio") is None
+
+    # The new snapshot replaces the old one rather than adding a file
+    store.save(str(server), "stdio", CAPABILITIES)
+    assert store.load(str(server), "stdio") is not None
+    assert len(list(store.directory.iterdir())) == 1
+
+
+def test_missing_server_has_no_snapshot(store, tmp_path):
+    missing = tmp_path / "missing.py"
+    store.save(str(missing), "stdio", CAPABILITIES)
+
+    assert store.load(str(missing), "stdio") is None
+    assert not store.directory.exists()
+
+
+def test_url_snapshot_expires(store, monkeypatch):
+    url = "http://localhost:8000/mcp"
+    now = 1_000_000.0
+    monkeypatch.setattr(snapshots.time, "time", lambda: now)
+    store.save(url, "http", CAPABILITIES)
+
+    now += URL_SNAPSHOT_MAX_AGE
+    assert store.load(url, "http") is not None
+    now += 1
+    assert store.load(url, "http") is None
+
+
+def test_corrupt_snapshot_is_ignored(store, server):
+    store.save(str(server), "stdio", CAPABILITIES)
+    path = next(store.directory.iterdir())
+    path.write_text("{not json")
+
+    assert store.load(str(server), "stdio") is None